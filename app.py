@@ -1,29 +1,172 @@
 from __future__ import annotations
 
+from functools import lru_cache
+import math
+import mimetypes
+import os
 from pathlib import Path
+import sys
+from typing import Any
+
+from flask import Flask, Response, abort, jsonify, request, send_file
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.security import safe_join
+
+ROOT_DIR = Path(__file__).resolve().parent
+WEB_DIR = ROOT_DIR / "web"
+DATA_PATH = WEB_DIR / "galaxy-data.json"
+# Kept outside WEB_DIR: snapshots are pickles and must never be served.
+SNAPSHOT_PATH = ROOT_DIR / "galaxy-data.snapshot"
+TILE_SEED = int(os.environ.get("GALAXY_SEED", "42"))
+
+# Vercel installs requirements.txt only, so make the src/ package importable.
+if str(ROOT_DIR / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from galaxy.data_index import DEFAULT_PAGE_SIZE, GalaxyIndex  # noqa: E402
+from galaxy.data_ndjson import NDJSON_MIMETYPE, iter_ndjson_chunks  # noqa: E402
+from galaxy.data_snapshot import GalaxySnapshot, load_galaxy_state  # noqa: E402
+from galaxy.serialization import dumps  # noqa: E402
+from galaxy.spatial import KDTree  # noqa: E402
+from galaxy.tiles import generate_tile  # noqa: E402
+from galaxy.web_assets import compressed_sibling, content_hash, is_hashed_asset  # noqa: E402
+
+
+class CompactJSONProvider(DefaultJSONProvider):
+    """Encode API responses through galaxy.serialization (orjson when installed).
+
+    The layouts jsonify asks for go through the fast encoder with Flask's
+    ``default`` hook; any other ``json.dumps`` options get the stdlib encoder.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not kwargs or kwargs == {"separators": (",", ":")}:
+            return dumps(obj, "compact", default=self.default)
+        if kwargs == {"indent": 2}:
+            return dumps(obj, "pretty", default=self.default)
+        return super().dumps(obj, **kwargs)
 
-from flask import Flask, Response, abort, jsonify, send_from_directory
 
 app = Flask(__name__)
-WEB_DIR = Path(__file__).resolve().parent / "web"
+app.json = CompactJSONProvider(app)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+MAX_SPATIAL_RESULTS = 1000
+PRIVATE_SUFFIXES = frozenset({".snapshot"})
+
+
+@lru_cache(maxsize=1)
+def galaxy_state() -> GalaxySnapshot:
+    # Loaded on first API use; `galaxy-data snapshot` skips parsing and indexing.
+    return load_galaxy_state(DATA_PATH, SNAPSHOT_PATH)
+
+
+def galaxy_index() -> GalaxyIndex:
+    return galaxy_state().index
+
+
+def sector_tree() -> KDTree:
+    return galaxy_state().sector_tree
+
+
+def _sector_summary(sector: dict) -> dict:
+    # Member name lists grow with the galaxy; map queries only need counts.
+    summary = {key: value for key, value in sector.items() if key != "s"}
+    summary["system_count"] = len(sector.get("s", []))
+    return summary
+
+
+def _float_args(*names: str) -> list[float]:
+    values = []
+    for name in names:
+        raw = request.args.get(name)
+        try:
+            value = float(raw)
+        except (TypeError, ValueError):
+            raise ValueError(f"Query parameter '{name}' must be a number.") from None
+        if not math.isfinite(value):
+            raise ValueError(f"Query parameter '{name}' must be finite.")
+        values.append(value)
+    return values
+
+
+def _not_found(message: str) -> tuple[Response, int]:
+    return jsonify({"error": message}), 404
+
+
+def _bad_request(message: str) -> tuple[Response, int]:
+    return jsonify({"error": message}), 400
+
+
+def _flag(value: str | None) -> bool | None:
+    if value is None or value == "":
+        return None
+    lowered = value.lower()
+    if lowered in {"1", "true", "yes"}:
+        return True
+    if lowered in {"0", "false", "no"}:
+        return False
+    raise ValueError(f"Expected a boolean, got '{value}'.")
 
 
 def _serve_web_asset(asset: str) -> Response:
     if not asset:
         abort(404)
-    return send_from_directory(WEB_DIR, asset)
+    joined = safe_join(str(WEB_DIR), asset)
+    if joined is None or not Path(joined).is_file():
+        abort(404)
+    path = Path(joined)
+    if path.suffix in PRIVATE_SUFFIXES:
+        abort(404)
+
+    etag = content_hash(path)
+    body, encoding = path, None
+    variant = compressed_sibling(path, {value for value, _ in request.accept_encodings})
+    if variant is not None:
+        encoding, body = variant
+        etag = f"{etag}-{encoding}"
+
+    response = send_file(
+        body,
+        mimetype=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        download_name=path.name,
+        etag=etag,
+        conditional=True,
+    )
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    if is_hashed_asset(path.name):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        # Revalidate on every use; unchanged assets cost a 304.
+        response.cache_control.no_cache = True
+    return response
+
+
+@app.after_request
+def tag_api_responses(response: Response) -> Response:
+    if request.path.startswith("/api/") and response.status_code == 200 and not response.is_streamed:
+        response.add_etag()
+        response.cache_control.no_cache = True
+        response.make_conditional(request)
+    return response
 
 
 @app.get("/")
 @app.get("/index.html")
 def root() -> Response:
-    return send_from_directory(WEB_DIR, "index.html")
+    return _serve_web_asset("index.html")
 
 
 @app.get("/web")
 @app.get("/web/")
 def legacy_web_root() -> Response:
-    return send_from_directory(WEB_DIR, "index.html")
+    return _serve_web_asset("index.html")
 
 
 @app.get("/web/<path:asset>")
@@ -41,3 +184,110 @@ def root_web_asset(asset: str) -> Response:
 @app.get("/api/health")
 def health() -> Response:
     return jsonify({"ok": True, "service": "galaxy"})
+
+
+@app.get("/api/sectors/near")
+def sectors_near() -> Response | tuple[Response, int]:
+    try:
+        x, y = _float_args("x", "y")
+    except ValueError as exc:
+        return _bad_request(str(exc))
+    k = max(1, min(request.args.get("k", 5, type=int), MAX_SPATIAL_RESULTS))
+    sectors = galaxy_index().data["sectors"]
+    return jsonify(
+        {"sectors": [{"distance": round(distance, 6), "sector": _sector_summary(sectors[i])} for distance, i in sector_tree().nearest(x, y, k)]}
+    )
+
+
+@app.get("/api/sectors/in-box")
+def sectors_in_box() -> Response | tuple[Response, int]:
+    try:
+        xmin, ymin, xmax, ymax = _float_args("xmin", "ymin", "xmax", "ymax")
+    except ValueError as exc:
+        return _bad_request(str(exc))
+    sectors = galaxy_index().data["sectors"]
+    found = sector_tree().in_box(xmin, ymin, xmax, ymax)
+    return jsonify(
+        {"sectors": [_sector_summary(sectors[i]) for i in found[:MAX_SPATIAL_RESULTS]], "truncated": len(found) > MAX_SPATIAL_RESULTS}
+    )
+
+
+@app.get("/api/sectors/<sector_id>")
+def sector_detail(sector_id: str) -> Response | tuple[Response, int]:
+    index = galaxy_index()
+    sector = index.sector(sector_id)
+    if sector is None:
+        return _not_found(f"Unknown sector '{sector_id}'.")
+    return jsonify({"sector": sector, "systems": index.systems_in(sector)})
+
+
+@app.get("/api/systems.ndjson")
+def systems_ndjson() -> Response | tuple[Response, int]:
+    index = galaxy_index()
+    systems = index.data.get("systems", [])
+    token = request.args.get("sector")
+    if token:
+        sector = index.sector(token)
+        if sector is None:
+            return _not_found(f"Unknown sector '{token}'.")
+        systems = index.systems_in(sector)
+    # Lines are encoded as the client reads, in chunks of whole systems.
+    return Response(iter_ndjson_chunks(systems), mimetype=NDJSON_MIMETYPE)
+
+
+@app.get("/api/systems/<system_id>")
+def system_detail(system_id: str) -> Response | tuple[Response, int]:
+    index = galaxy_index()
+    system = index.system(system_id)
+    if system is None:
+        return _not_found(f"Unknown system '{system_id}'.")
+    return jsonify({"sector": index.sector_of(system), "system": system})
+
+
+@app.get("/api/systems/<system_id>/planets/<planet_name>")
+def planet_detail(system_id: str, planet_name: str) -> Response | tuple[Response, int]:
+    index = galaxy_index()
+    system = index.system(system_id)
+    planet = index.planet(system, planet_name) if system is not None else None
+    if planet is None:
+        return _not_found(f"Unknown planet '{planet_name}' in system '{system_id}'.")
+    summary = {key: value for key, value in system.items() if key != "p"}
+    return jsonify({"sector": index.sector_of(system), "system": summary, "planet": planet})
+
+
+@app.get("/api/planets")
+def planet_listing() -> Response | tuple[Response, int]:
+    args = request.args
+    try:
+        min_hab = args.get("min_hab") or None
+        if min_hab is not None and not min_hab.lstrip("-").isdigit():
+            raise ValueError("min_hab must be an integer.")
+        page, next_cursor = galaxy_index().query_planets(
+            planet_type=args.get("type") or None,
+            min_hab=int(min_hab) if min_hab is not None else None,
+            star_class=args.get("star_class") or None,
+            locked=_flag(args.get("locked")),
+            sort=args.get("sort") or "index",
+            cursor=args.get("cursor") or None,
+            limit=args.get("limit", DEFAULT_PAGE_SIZE, type=int),
+        )
+    except ValueError as exc:
+        return _bad_request(str(exc))
+    return jsonify(
+        {
+            "planets": [
+                {"system": system.get("id"), "star_class": system.get("star", {}).get("cls"), "planet": planet}
+                for system, planet in page
+            ],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@app.get("/api/tiles/<int:z>/<int:x>/<int:y>")
+def galaxy_tile(z: int, x: int, y: int) -> Response | tuple[Response, int]:
+    try:
+        tile = generate_tile(TILE_SEED, z, x, y)
+    except ValueError as exc:
+        return _not_found(str(exc))
+    return jsonify(tile)
@@ -0,0 +1,43 @@
+"""Time growing a galaxy with and without the generation cache.
+
+Usage: python benchmarks/bench_cache.py [--sizes 20000 100000] [--grow 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import deque
+import tempfile
+import time
+
+from galaxy.data_cache import GenerationCache
+from galaxy.data_pipeline import iter_systems
+
+
+def _timed(**kwargs) -> float:
+    start = time.perf_counter()
+    deque(iter_systems(**kwargs), maxlen=0)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20_000, 100_000])
+    parser.add_argument("--grow", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'systems':>9} {'+systems':>9} {'uncached s':>11} {'cold s':>8} {'grown s':>8} {'speedup':>8}")
+    for size in args.sizes:
+        grown = size + args.grow
+        kwargs = dict(seed=args.seed, planets_per_system=6, workers=1)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = GenerationCache(directory)
+            cold = _timed(system_count=size, cache=cache, **kwargs)
+            warm = _timed(system_count=grown, cache=cache, **kwargs)
+        uncached = _timed(system_count=grown, **kwargs)
+        print(f"{size:>9} {args.grow:>9} {uncached:>11.2f} {cold:>8.2f} {warm:>8.2f} {uncached / warm:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compare JSON encoding throughput of the stdlib and orjson backends.
+
+Usage: python benchmarks/bench_json.py [--sizes 1000 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from galaxy.data_pipeline import generate_galaxy
+from galaxy.serialization import JSON_STYLES, dumps, orjson_available
+
+
+def _best_seconds(encode, repeats: int) -> tuple[float, int]:
+    best, size = float("inf"), 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        size = len(encode().encode("utf-8"))
+        best = min(best, time.perf_counter() - start)
+    return best, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--planets-per-system", type=int, default=6)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    backends = ["stdlib", "orjson"] if orjson_available() else ["stdlib"]
+    print(f"{'systems':>9} {'style':>8} {'backend':>8} {'MiB':>8} {'seconds':>8} {'MiB/s':>8}")
+    for size in args.sizes:
+        data = generate_galaxy(seed=args.seed, system_count=size, planets_per_system=args.planets_per_system)
+        for style in JSON_STYLES:
+            for backend in backends:
+                seconds, encoded = _best_seconds(lambda: dumps(data, style, backend=backend), args.repeats)
+                mib = encoded / 2**20
+                print(f"{size:>9} {style:>8} {backend:>8} {mib:>8.1f} {seconds:>8.3f} {mib / seconds:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
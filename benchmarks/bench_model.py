@@ -0,0 +1,49 @@
+"""Compare heap usage of dict systems with slotted galaxy.data_model records.
+
+Usage: python benchmarks/bench_model.py [--sizes 1000 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+from galaxy.data_model import System
+from galaxy.data_pipeline import iter_systems
+
+
+def _retained_bytes(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--planets-per-system", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'systems':>9} {'dict MiB':>9} {'record MiB':>11} {'dict B/planet':>14} {'record B/planet':>16} {'ratio':>6}")
+    for size in args.sizes:
+        kwargs = dict(seed=args.seed, system_count=size, planets_per_system=args.planets_per_system)
+        as_dicts = _retained_bytes(lambda: list(iter_systems(**kwargs)))
+        as_records = _retained_bytes(lambda: [System.from_dict(system) for system in iter_systems(**kwargs)])
+        planets = size * args.planets_per_system
+        print(
+            f"{size:>9} {as_dicts / 2**20:>9.1f} {as_records / 2**20:>11.1f} "
+            f"{as_dicts / planets:>14.0f} {as_records / planets:>16.0f} {as_dicts / as_records:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark the sector k-d tree against a linear scan.
+
+Usage: python benchmarks/bench_spatial.py [--sizes 10000 100000 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from galaxy.spatial import KDTree
+
+
+def _timed(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'points':>9} {'build s':>8} {'knn10 ms':>9} {'box ms':>8} {'scan knn ms':>12} {'scan box ms':>12}")
+    for size in args.sizes:
+        points = [(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(size)]
+        start = time.perf_counter()
+        tree = KDTree(points)
+        build = time.perf_counter() - start
+
+        probes = [(rng.uniform(-1, 0.95), rng.uniform(-1, 0.95)) for _ in range(args.queries)]
+        cycle = iter(probes * 2)
+
+        def knn() -> None:
+            x, y = next(cycle)
+            tree.nearest(x, y, 10)
+
+        def box() -> None:
+            x, y = next(cycle)
+            tree.in_box(x, y, x + 0.05, y + 0.05)
+
+        def scan_knn() -> None:
+            x, y = next(cycle)
+            sorted(((px - x) ** 2 + (py - y) ** 2, i) for i, (px, py) in enumerate(points))[:10]
+
+        def scan_box() -> None:
+            x, y = next(cycle)
+            [i for i, (px, py) in enumerate(points) if x <= px <= x + 0.05 and y <= py <= y + 0.05]
+
+        knn_s = _timed(knn, args.queries)
+        cycle = iter(probes * 2)
+        box_s = _timed(box, args.queries)
+        scan_repeats = max(1, args.queries // 50)
+        cycle = iter(probes * 2)
+        scan_knn_s = _timed(scan_knn, scan_repeats)
+        cycle = iter(probes * 2)
+        scan_box_s = _timed(scan_box, scan_repeats)
+        print(
+            f"{size:>9} {build:>8.2f} {knn_s * 1e3:>9.3f} {box_s * 1e3:>8.3f} "
+            f"{scan_knn_s * 1e3:>12.1f} {scan_box_s * 1e3:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
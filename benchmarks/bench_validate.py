@@ -0,0 +1,44 @@
+"""Compare the python and numpy validation engines on generated galaxies.
+
+Usage: python benchmarks/bench_validate.py [--sizes 1000 5000 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from galaxy.data_pipeline import generate_galaxy, validate_galaxy
+from galaxy.data_vectorized import numpy_available, screen_systems
+
+
+def _best(run, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 5_000, 20_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if not numpy_available():
+        parser.error("NumPy is not installed")
+
+    print(f"{'systems':>9} {'python s':>9} {'numpy s':>8} {'screen s':>9} {'speedup':>8}")
+    for size in args.sizes:
+        data = generate_galaxy(seed=args.seed, system_count=size, engine="numpy")
+        sector_names = {sector["n"] for sector in data["sectors"]}
+        python = _best(lambda: validate_galaxy(data), args.repeats)
+        vectorized = _best(lambda: validate_galaxy(data, engine="numpy"), args.repeats)
+        screen = _best(lambda: screen_systems(data["systems"], sector_names), args.repeats)
+        print(f"{size:>9} {python:>9.3f} {vectorized:>8.3f} {screen:>9.3f} {python / vectorized:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""Benchmark harness for the data pipeline with regression baselines.
+
+Each scale runs generate → validate → export → JSON load. The first pass
+runs under ``tracemalloc`` to record peak memory and doubles as a warm-up;
+the following ``repeats`` passes are timed without it. Regressions compare
+best-of-N times, which are far less noisy than medians on shared machines.
+
+Each scale also measures the API's cold start: a fresh interpreter that
+imports the loader and builds the served state from the exported JSON
+(``cold_json``) or from a ``galaxy-data snapshot`` (``cold_snap``). Those
+times include interpreter start-up, and their peak is the child's peak RSS
+(0 where the platform does not report it).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from galaxy.data_pipeline import export_galaxy_json, generate_galaxy, validate_galaxy
+from galaxy.data_snapshot import write_snapshot
+
+# Quick enough for a regression check; pass larger scales explicitly.
+DEFAULT_SCALES = (10, 1_000)
+DEFAULT_REPEATS = 3
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.25
+PLANETS_PER_SYSTEM = 6
+# Slowdowns smaller than this are timer noise at the 10-system scale.
+MIN_TIME_DELTA_S = 0.002
+
+# Prints the child's peak RSS in bytes. On Linux that is VmHWM: ru_maxrss
+# would include the parent's high-water mark, which Linux carries across
+# exec. Elsewhere ru_maxrss (bytes on macOS) is the best available figure,
+# and platforms without the resource module report 0.
+_COLD_START = """\
+import os
+import sys
+from galaxy.data_snapshot import load_galaxy_state
+load_galaxy_state(*sys.argv[1:])
+if os.path.exists("/proc/self/status"):
+    with open("/proc/self/status") as status:
+        print(next((int(line.split()[1]) * 1024 for line in status if line.startswith("VmHWM:")), 0))
+else:
+    try:
+        import resource
+    except ImportError:
+        print(0)
+    else:
+        print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024))
+"""
+
+
+def _measure(fn: Callable[[], Any], repeats: int) -> tuple[Any, int, list[float]]:
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    timings = []
+    for _ in range(repeats):
+        result = None  # release the previous result before building the next
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return result, peak, timings
+
+
+def _measure_cold_start(paths: list[Path], repeats: int) -> tuple[int, list[float]]:
+    """Time fresh interpreters loading the API state; the first run is a warm-up."""
+    package_root = str(Path(__file__).resolve().parents[1])
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")]))}
+    command = [sys.executable, "-c", _COLD_START, *map(str, paths)]
+    peak = 0
+    timings = []
+    for run in range(repeats + 1):
+        start = time.perf_counter()
+        completed = subprocess.run(command, env=env, check=True, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        peak = max(peak, int(completed.stdout.split()[-1]))
+        if run:
+            timings.append(elapsed)
+    return peak, timings
+
+
+def _record(operation: str, systems: int, peak: int, timings: list[float]) -> dict[str, Any]:
+    median = statistics.median(timings)
+    return {
+        "operation": operation,
+        "systems": systems,
+        "planets_per_s": systems * PLANETS_PER_SYSTEM / median if median else None,
+        "median_s": median,
+        "stdev_s": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "min_s": min(timings),
+        "max_s": max(timings),
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmarks(
+    scales: tuple[int, ...] | list[int] = DEFAULT_SCALES,
+    *,
+    repeats: int = DEFAULT_REPEATS,
+    seed: int = 42,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Time every operation at every scale; return one record per (operation, scale)."""
+    results: list[dict[str, Any]] = []
+
+    def emit(record: dict[str, Any]) -> None:
+        results.append(record)
+        if progress is not None:
+            progress(record)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "galaxy-data.json"
+        for systems in scales:
+            data, peak, timings = _measure(
+                lambda: generate_galaxy(seed=seed, system_count=systems, planets_per_system=PLANETS_PER_SYSTEM),
+                repeats,
+            )
+            emit(_record("generate", systems, peak, timings))
+            for operation, fn in (
+                ("validate", lambda: validate_galaxy(data)),
+                ("export", lambda: export_galaxy_json(data, output)),
+            ):
+                _, peak, timings = _measure(fn, repeats)
+                emit(_record(operation, systems, peak, timings))
+            # Free the generated galaxy so loading does not hold two copies.
+            del data
+            _, peak, timings = _measure(lambda: json.loads(output.read_text(encoding="utf-8")), repeats)
+            emit(_record("load", systems, peak, timings))
+
+            snapshot = write_snapshot(output, Path(tmp) / "galaxy-data.snapshot")
+            for operation, paths in (("cold_json", [output]), ("cold_snap", [output, snapshot])):
+                peak, timings = _measure_cold_start(paths, repeats)
+                emit(_record(operation, systems, peak, timings))
+    return results
+
+
+def _key(record: dict[str, Any]) -> str:
+    return f"{record['operation']}@{record['systems']}"
+
+
+def build_baseline(results: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {
+            _key(record): {"min_s": record["min_s"], "median_s": record["median_s"], "peak_bytes": record["peak_bytes"]}
+            for record in results
+        },
+    }
+
+
+def compare_to_baseline(
+    results: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    *,
+    time_threshold: float = DEFAULT_TIME_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+) -> list[str]:
+    """Describe every result that is slower or larger than its baseline beyond the thresholds.
+
+    Adds a ``time_change``/``memory_change`` ratio to each record that has a baseline entry.
+    """
+    regressions = []
+    reference = baseline.get("results", {})
+    for record in results:
+        entry = reference.get(_key(record))
+        if entry is None:
+            continue
+        time_change = record["min_s"] / entry["min_s"] - 1 if entry["min_s"] else 0.0
+        memory_change = record["peak_bytes"] / entry["peak_bytes"] - 1 if entry["peak_bytes"] else 0.0
+        record["time_change"] = time_change
+        record["memory_change"] = memory_change
+        if time_change > time_threshold and record["min_s"] - entry["min_s"] > MIN_TIME_DELTA_S:
+            regressions.append(
+                f"{_key(record)}: best {record['min_s'] * 1e3:.1f} ms is {time_change:+.0%} vs baseline "
+                f"{entry['min_s'] * 1e3:.1f} ms (threshold {time_threshold:+.0%})"
+            )
+        if memory_change > memory_threshold:
+            regressions.append(
+                f"{_key(record)}: peak {record['peak_bytes'] / 2**20:.1f} MiB is {memory_change:+.0%} vs baseline "
+                f"{entry['peak_bytes'] / 2**20:.1f} MiB (threshold {memory_threshold:+.0%})"
+            )
+    return regressions
+
+
+def format_record(record: dict[str, Any]) -> str:
+    change = ""
+    if "time_change" in record:
+        change = f"  time {record['time_change']:+6.0%}  mem {record['memory_change']:+6.0%}"
+    rate = f"{record['planets_per_s']:>12,.0f}" if record["planets_per_s"] else f"{'-':>12}"
+    return (
+        f"{record['operation']:<9}{record['systems']:>8}  {rate} planets/s  "
+        f"{record['median_s'] * 1e3:>10.2f} ms ±{record['stdev_s'] * 1e3:>8.2f}  "
+        f"peak {record['peak_bytes'] / 2**20:>8.2f} MiB{change}"
+    )
@@ -0,0 +1,585 @@
+"""Compact binary columnar galaxy format with a memory-mapped reader.
+
+Layout (all integers little-endian)::
+
+    b"GLXC" | u16 version | u16 reserved | u32 header length | header JSON
+    column blocks, each 8-byte aligned
+
+The header holds the document-level fields (name, sectors, topics, meta),
+record counts and a directory of typed columns. Numeric star and planet
+fields are stored as ``array`` typecodes ``d``/``q``/``B``; names, types,
+descriptions and the small nested payloads (timeline, atmosphere,
+exploration status) are stored as indexes into a string table in which
+repeated strings are stored once. Opening a file only parses the header;
+systems and planets are decoded lazily from the mapped columns.
+
+The writer spills columns and the string table to temporary files next to
+the output as it goes and concatenates them at the end, so its memory does
+not grow with the galaxy.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from contextlib import ExitStack
+import json
+import mmap
+from pathlib import Path
+import shutil
+import struct
+import sys
+import tempfile
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from galaxy.data_cache import GenerationCache
+from galaxy.data_model import as_system_dict
+from galaxy.data_pipeline import _galaxy_document, _plan_galaxy
+
+MAGIC = b"GLXC"
+FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<4sHHI")
+# Column values are buffered in batches of this many items between spills.
+_SPILL_ITEMS = 1 << 12
+# Strings up to this length (names, types, units) are always de-duplicated;
+# longer ones go through per-column two-generation indexes of this many
+# entries each.
+_SHORT_STRING = 32
+_DEDUP_GENERATION = 1 << 12
+
+# (column, typecode) pairs; "s" columns hold string-table indexes.
+_STAR_COLUMNS: list[tuple[str, str]] = [
+    ("star_cls", "s"),
+    ("star_tk", "q"),
+    ("star_lum", "d"),
+    ("star_age", "d"),
+    ("star_hz0", "d"),
+    ("star_hz1", "d"),
+    ("star_mult", "s"),
+    ("star_frost", "d"),
+    ("star_belt0", "d"),
+    ("star_belt1", "d"),
+    ("star_m", "d"),
+]
+_SYSTEM_COLUMNS: list[tuple[str, str]] = [
+    ("sys_id", "s"),
+    ("sys_n", "s"),
+    ("sys_sector", "s"),
+    ("sys_tl", "s"),
+    *_STAR_COLUMNS,
+]
+_PLANET_COLUMNS: list[tuple[str, str]] = [
+    ("n", "s"),
+    ("t", "s"),
+    ("m", "d"),
+    ("m_unit", "s"),
+    ("rad", "d"),
+    ("rad_unit", "s"),
+    ("g", "d"),
+    ("a", "d"),
+    ("op", "d"),
+    ("rp", "s"),
+    ("rot_days", "d"),
+    ("tilt", "d"),
+    ("temp0", "q"),
+    ("temp1", "q"),
+    ("atm", "s"),
+    ("pb", "d"),
+    ("pb_int", "B"),
+    ("teq", "d"),
+    ("tmean", "d"),
+    ("mag", "s"),
+    ("alb", "d"),
+    ("hab", "q"),
+    ("v", "s"),
+    ("sci", "s"),
+    ("x", "s"),
+    ("locked", "B"),
+]
+
+
+def is_galaxy_binary(path: str | Path) -> bool:
+    try:
+        with Path(path).open("rb") as fh:
+            return fh.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+class _SpilledColumn:
+    """A typed column written to ``spool`` in batches of ``_SPILL_ITEMS``."""
+
+    def __init__(self, typecode: str, spool: BinaryIO) -> None:
+        self.typecode = typecode
+        self.spool = spool
+        self.buffer = array(typecode)
+        self.length = 0
+
+    def append(self, value: Any) -> None:
+        self.buffer.append(value)
+        if len(self.buffer) >= _SPILL_ITEMS:
+            self.flush()
+
+    def flush(self) -> None:
+        if sys.byteorder != "little":
+            self.buffer.byteswap()
+        self.buffer.tofile(self.spool)
+        self.length += len(self.buffer)
+        self.buffer = array(self.typecode)
+
+    @property
+    def nbytes(self) -> int:
+        return (self.length + len(self.buffer)) * self.buffer.itemsize
+
+
+class _StringTable:
+    """String blob and offsets spilled to disk, with bounded de-duplication.
+
+    Short strings come from a small vocabulary and are always indexed. Long
+    ones are indexed per column in two generations of at most
+    ``_DEDUP_GENERATION`` entries; a hit in the older generation moves the
+    string to the newer one. Columns of recurring text (descriptions,
+    timelines) stay fully indexed, and text that never repeats (science
+    notes, atmospheres) ages out instead of being kept in memory.
+    """
+
+    def __init__(self, blob: BinaryIO, offsets: _SpilledColumn) -> None:
+        self.blob = blob
+        self.offsets = offsets
+        self.size = 0
+        self.count = 0
+        self.short: dict[str, int] = {}
+        # column -> [current generation, previous generation]
+        self.long: dict[str, list[dict[str, int]]] = {}
+        offsets.append(0)
+
+    def _append(self, value: str) -> int:
+        data = value.encode("utf-8")
+        self.blob.write(data)
+        self.size += len(data)
+        self.offsets.append(self.size)
+        self.count += 1
+        return self.count - 1
+
+    def add(self, value: str, column: str) -> int:
+        if len(value) <= _SHORT_STRING:
+            slot = self.short.get(value)
+            if slot is None:
+                slot = self.short[value] = self._append(value)
+            return slot
+        generations = self.long.get(column)
+        if generations is None:
+            generations = self.long[column] = [{}, {}]
+        current, previous = generations
+        slot = current.get(value)
+        if slot is not None:
+            return slot
+        slot = previous.get(value)
+        if slot is None:
+            slot = self._append(value)
+        if len(current) >= _DEDUP_GENERATION:
+            generations[:] = [{}, current]
+            current = generations[0]
+        current[value] = slot
+        return slot
+
+
+def _derived_sector_lists(sectors: list[dict[str, Any]], system_sectors: list[str], names: list[str]) -> list[list[str]]:
+    by_name: dict[str, list[str]] = {sector.get("n"): [] for sector in sectors}
+    for sector, name in zip(system_sectors, names):
+        if sector in by_name:
+            by_name[sector].append(name)
+    return [by_name[sector.get("n")] for sector in sectors]
+
+
+def write_galaxy_binary(path: str | Path, document: dict[str, Any], systems: Iterable[dict[str, Any]]) -> Path:
+    """Write ``document`` with ``systems`` streamed in as typed columns.
+
+    Systems must have the generator's shape; a ``ValueError`` names the first
+    one that does not. Sector system lists are stored only when they differ
+    from the lists implied by each system's ``sector`` field. Beyond those
+    name lists, memory use does not depend on the number of systems.
+    """
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with ExitStack() as stack:
+
+        def spool() -> BinaryIO:
+            return stack.enter_context(tempfile.TemporaryFile(dir=out.parent))
+
+        blob = spool()
+        strings = _StringTable(blob, _SpilledColumn("q", spool()))
+        columns = {
+            name: _SpilledColumn("q" if code == "s" else code, spool()) for name, code in (*_SYSTEM_COLUMNS, *_PLANET_COLUMNS)
+        }
+        planet_start = _SpilledColumn("q", spool())
+        planet_start.append(0)
+        planet_count = 0
+        system_sectors: list[str] = []
+        system_names: list[str] = []
+
+        for system in systems:
+            system = as_system_dict(system)
+            try:
+                star = system["star"]
+                system_values = {
+                    "sys_id": system["id"],
+                    "sys_n": system["n"],
+                    "sys_sector": system["sector"],
+                    "sys_tl": _compact_json(system["tl"]),
+                    "star_cls": star["cls"],
+                    "star_tk": star["tk"],
+                    "star_lum": star["lum"],
+                    "star_age": star["age"],
+                    "star_hz0": star["hz"][0],
+                    "star_hz1": star["hz"][1],
+                    "star_mult": star["mult"],
+                    "star_frost": star["frost"],
+                    "star_belt0": star["belt"][0],
+                    "star_belt1": star["belt"][1],
+                    "star_m": star["m"],
+                }
+                planet_rows = [
+                    {
+                        "n": planet["n"],
+                        "t": planet["t"],
+                        "m": planet["m"][0],
+                        "m_unit": planet["m"][1],
+                        "rad": planet["rad"][0],
+                        "rad_unit": planet["rad"][1],
+                        "g": planet["g"],
+                        "a": planet["a"],
+                        "op": planet["op"],
+                        "rp": planet["rp"],
+                        "rot_days": planet["rot_days"],
+                        "tilt": planet["tilt"],
+                        "temp0": planet["temp"][0],
+                        "temp1": planet["temp"][1],
+                        "atm": _compact_json(planet["atm"]),
+                        "pb": planet["pb"],
+                        "pb_int": isinstance(planet["pb"], int),
+                        "teq": planet["teq"],
+                        "tmean": planet["tmean"],
+                        "mag": planet["mag"],
+                        "alb": planet["alb"],
+                        "hab": planet["hab"],
+                        "v": planet["v"],
+                        "sci": planet["sci"],
+                        "x": _compact_json(planet["x"]),
+                        "locked": planet["locked"],
+                    }
+                    for planet in system["p"]
+                ]
+            except (KeyError, IndexError, TypeError) as exc:
+                raise ValueError(f"{system.get('n', '<unknown>')}: not exportable to the binary format ({exc!r}).") from exc
+
+            for name, code in _SYSTEM_COLUMNS:
+                value = system_values[name]
+                columns[name].append(strings.add(value, name) if code == "s" else value)
+            for row in planet_rows:
+                for name, code in _PLANET_COLUMNS:
+                    value = row[name]
+                    columns[name].append(strings.add(value, name) if code == "s" else value)
+            planet_count += len(planet_rows)
+            planet_start.append(planet_count)
+            system_sectors.append(system["sector"])
+            system_names.append(system["n"])
+
+        sectors = [dict(sector) for sector in document.get("sectors", [])]
+        derived = _derived_sector_lists(sectors, system_sectors, system_names)
+        derive_lists = all(sector.get("s") == derived_s for sector, derived_s in zip(sectors, derived))
+        if derive_lists:
+            for sector in sectors:
+                sector.pop("s", None)
+
+        # (name, typecode, spool, item count, byte size)
+        blocks: list[tuple[str, str, BinaryIO, int, int]] = [("string_blob", "B", blob, strings.size, strings.size)]
+        for name, column in [("planet_start", planet_start), ("string_offsets", strings.offsets), *columns.items()]:
+            nbytes = column.nbytes
+            column.flush()
+            blocks.append((name, column.typecode, column.spool, column.length, nbytes))
+
+        directory: dict[str, dict[str, Any]] = {}
+        offset = 0
+        for name, code, _, length, nbytes in blocks:
+            offset = _align(offset)
+            directory[name] = {"type": code, "offset": offset, "length": length}
+            offset += nbytes
+
+        header = {
+            "keys": list(document) if "systems" in document else [*document, "systems"],
+            "document": {key: value for key, value in document.items() if key not in {"sectors", "systems"}},
+            "sectors": sectors,
+            "derive_sector_lists": derive_lists,
+            "systems": len(system_names),
+            "planets": planet_count,
+            "columns": directory,
+        }
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+        with out.open("wb") as fh:
+            fh.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header_bytes)))
+            fh.write(header_bytes)
+            position = _PREAMBLE.size + len(header_bytes)
+            for name, _, source, _, nbytes in blocks:
+                start = data_start + directory[name]["offset"]
+                fh.write(b"\0" * (start - position))
+                source.seek(0)
+                shutil.copyfileobj(source, fh)
+                position = start + nbytes
+    return out
+
+
+def export_galaxy_binary(data: dict[str, Any], output_path: str | Path) -> Path:
+    return write_galaxy_binary(output_path, data, data["systems"])
+
+
+class _LazySystems(Sequence):
+    def __init__(self, galaxy: BinaryGalaxy) -> None:
+        self._galaxy = galaxy
+
+    def __len__(self) -> int:
+        return self._galaxy.system_count
+
+    def __getitem__(self, index: int) -> dict[str, Any]:  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self._galaxy.system(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("system index out of range")
+        return self._galaxy.system(index)
+
+
+class BinaryGalaxy:
+    """Read-only view over a memory-mapped binary galaxy file.
+
+    Only the header is parsed on open; ``systems[i]``, :meth:`planets` and
+    :meth:`column` decode from the mapping on demand.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = self.path.open("rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"{self.path}: not a galaxy binary file.") from None
+        self._columns: dict[str, Any] = {}
+        if len(self._map) < _PREAMBLE.size:
+            self.close()
+            raise ValueError(f"{self.path}: truncated or corrupt galaxy binary.")
+        magic, version, _, header_length = _PREAMBLE.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path}: not a galaxy binary file.")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{self.path}: unsupported galaxy binary version {version}.")
+        self._data_start = _align(_PREAMBLE.size + header_length)
+        self._view = memoryview(self._map)
+        try:
+            if self._data_start > len(self._map):
+                raise ValueError("header runs past the end of the file")
+            self._header = json.loads(self._map[_PREAMBLE.size:_PREAMBLE.size + header_length])
+            self._check_layout()
+        except (ValueError, KeyError, TypeError):
+            self.close()
+            raise ValueError(f"{self.path}: truncated or corrupt galaxy binary.") from None
+        self.system_count: int = self._header["systems"]
+        self.planet_count: int = self._header["planets"]
+        self.systems = _LazySystems(self)
+
+    def _check_layout(self) -> None:
+        """Raise ``ValueError`` unless every column the reader uses lies inside the file."""
+        header = self._header
+        systems, planets = header["systems"], header["planets"]
+        if not all(isinstance(count, int) and count >= 0 for count in (systems, planets)):
+            raise ValueError("bad record counts")
+        if not isinstance(header["document"], dict) or not isinstance(header["sectors"], list):
+            raise ValueError("bad document fields")
+        if not set(header["keys"]) <= {*header["document"], "sectors", "systems"}:
+            raise ValueError("bad document keys")
+        expected = {
+            "string_blob": ("B", None),
+            "planet_start": ("q", systems + 1),
+            "string_offsets": ("q", None),
+            **{name: ("q" if code == "s" else code, systems) for name, code in _SYSTEM_COLUMNS},
+            **{name: ("q" if code == "s" else code, planets) for name, code in _PLANET_COLUMNS},
+        }
+        for name, (typecode, length) in expected.items():
+            entry = header["columns"][name]
+            offset, count = entry["offset"], entry["length"]
+            if entry["type"] != typecode or not isinstance(offset, int) or not isinstance(count, int):
+                raise ValueError(f"bad column {name}")
+            if offset < 0 or offset % 8 or count < 0 or (length is not None and count != length):
+                raise ValueError(f"bad column {name}")
+            if self._data_start + offset + count * array(typecode).itemsize > len(self._map):
+                raise ValueError(f"column {name} runs past the end of the file")
+        offsets = self.column("string_offsets")
+        if not offsets or offsets[0] != 0 or offsets[-1] > len(self.column("string_blob")):
+            raise ValueError("bad string table")
+        starts = self.column("planet_start")
+        if starts[0] != 0 or starts[-1] != planets:
+            raise ValueError("bad planet index")
+
+    def __enter__(self) -> BinaryGalaxy:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._columns.clear()
+        view = getattr(self, "_view", None)
+        if view is not None:
+            view.release()
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def column(self, name: str) -> Any:
+        """Zero-copy typed view of a stored column (string columns hold table indexes)."""
+        cached = self._columns.get(name)
+        if cached is not None:
+            return cached
+        entry = self._header["columns"][name]
+        itemsize = array(entry["type"]).itemsize
+        start = self._data_start + entry["offset"]
+        raw = self._view[start:start + entry["length"] * itemsize]
+        if sys.byteorder == "little":
+            column = raw.cast(entry["type"])
+        else:
+            column = array(entry["type"], raw)
+            column.byteswap()
+        self._columns[name] = column
+        return column
+
+    def string(self, index: int) -> str:
+        offsets = self.column("string_offsets")
+        return bytes(self.column("string_blob")[offsets[index]:offsets[index + 1]]).decode("utf-8")
+
+    def _value(self, name: str, code: str, row: int) -> Any:
+        value = self.column(name)[row]
+        return self.string(value) if code == "s" else value
+
+    @property
+    def name(self) -> Any:
+        return self._header["document"].get("name")
+
+    @property
+    def sectors(self) -> list[dict[str, Any]]:
+        sectors = [dict(sector) for sector in self._header["sectors"]]
+        if self._header["derive_sector_lists"]:
+            sector_column = self.column("sys_sector")
+            name_column = self.column("sys_n")
+            names = [self.string(name_column[i]) for i in range(self.system_count)]
+            system_sectors = [self.string(sector_column[i]) for i in range(self.system_count)]
+            for sector, names_in_sector in zip(sectors, _derived_sector_lists(sectors, system_sectors, names)):
+                sector["s"] = names_in_sector
+        return sectors
+
+    def planets(self, system_index: int) -> list[dict[str, Any]]:
+        starts = self.column("planet_start")
+        return [self._planet(row) for row in range(starts[system_index], starts[system_index + 1])]
+
+    def _planet(self, row: int) -> dict[str, Any]:
+        v = {name: self._value(name, code, row) for name, code in _PLANET_COLUMNS}
+        return {
+            "n": v["n"],
+            "t": v["t"],
+            "m": [v["m"], v["m_unit"]],
+            "rad": [v["rad"], v["rad_unit"]],
+            "g": v["g"],
+            "a": v["a"],
+            "op": v["op"],
+            "rp": v["rp"],
+            "rot_days": v["rot_days"],
+            "tilt": v["tilt"],
+            "temp": [v["temp0"], v["temp1"]],
+            "atm": json.loads(v["atm"]),
+            "pb": int(v["pb"]) if v["pb_int"] else v["pb"],
+            "teq": v["teq"],
+            "tmean": v["tmean"],
+            "mag": v["mag"],
+            "alb": v["alb"],
+            "hab": v["hab"],
+            "v": v["v"],
+            "sci": v["sci"],
+            "x": json.loads(v["x"]),
+            "locked": bool(v["locked"]),
+        }
+
+    def system(self, index: int) -> dict[str, Any]:
+        v = {name: self._value(name, code, index) for name, code in _SYSTEM_COLUMNS}
+        return {
+            "id": v["sys_id"],
+            "n": v["sys_n"],
+            "sector": v["sys_sector"],
+            "star": {
+                "cls": v["star_cls"],
+                "tk": v["star_tk"],
+                "lum": v["star_lum"],
+                "age": v["star_age"],
+                "hz": [v["star_hz0"], v["star_hz1"]],
+                "mult": v["star_mult"],
+                "frost": v["star_frost"],
+                "belt": [v["star_belt0"], v["star_belt1"]],
+                "m": v["star_m"],
+            },
+            "tl": json.loads(v["sys_tl"]),
+            "p": self.planets(index),
+        }
+
+    def iter_systems(self) -> Iterator[dict[str, Any]]:
+        for index in range(self.system_count):
+            yield self.system(index)
+
+    def document(self) -> dict[str, Any]:
+        """The galaxy document with ``systems`` as a lazy sequence.
+
+        Accepted by :func:`galaxy.data_pipeline.validate_galaxy`, which walks
+        the systems without materialising them all.
+        """
+        parts = {**self._header["document"], "sectors": self.sectors, "systems": self.systems}
+        return {key: parts[key] for key in self._header["keys"]}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialise the full document in its original key order."""
+        return {**self.document(), "systems": list(self.iter_systems())}
+
+
+def open_galaxy_binary(path: str | Path) -> BinaryGalaxy:
+    return BinaryGalaxy(path)
+
+
+def stream_galaxy_binary(
+    output_path: str | Path,
+    *,
+    seed: int | None = None,
+    sector_count: int = 6,
+    system_count: int = 3,
+    planets_per_system: int = 6,
+    engine: str = "python",
+    workers: int | None = None,
+    cache: GenerationCache | None = None,
+) -> Path:
+    """Generate a galaxy straight into the binary format, one system at a time."""
+    seed, sectors, systems = _plan_galaxy(seed, sector_count, system_count, planets_per_system, engine, workers, cache)
+
+    def assign_sectors() -> Iterator[dict[str, Any]]:
+        for i, system in enumerate(systems):
+            sectors[i % len(sectors)]["s"].append(system["n"])
+            yield system
+
+    return write_galaxy_binary(output_path, _galaxy_document(sectors, [], seed), assign_sectors())
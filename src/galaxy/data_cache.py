@@ -0,0 +1,199 @@
+"""Content-addressed on-disk caches for system generation and validation.
+
+In per-system seed mode every chunk of ``SEEDED_CHUNK_SYSTEMS`` systems is a
+pure function of the master seed, its index range, the sector names, the
+generation parameters and the generator source. :class:`GenerationCache`
+stores each generated chunk under a hash of exactly those inputs, so growing
+a galaxy or regenerating it after an unrelated change only generates chunks
+that are new or whose inputs changed. Entries are evicted least-recently-used
+first once the directory exceeds its size budget, checked every
+``EVICT_EVERY_STORES`` writes so a long or abandoned run stays bounded.
+
+:class:`ValidationCache` keeps each system's validation result under a hash
+of its content, so re-validating a mostly unchanged dataset only runs
+the physics checks for systems whose content changed.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024 ** 3
+_ENTRY_SUFFIX = ".json"
+EVICT_EVERY_STORES = 16
+# Temporary files older than this were left behind by a crashed writer.
+_STALE_TMP_SECONDS = 3600
+
+
+@lru_cache(maxsize=1)
+def generator_fingerprint() -> str:
+    """Hash of the generator sources; any edit to them invalidates the cache."""
+    from galaxy import data_model, data_pipeline, data_vectorized, sampling
+
+    digest = hashlib.blake2b(digest_size=16)
+    for module in (data_pipeline, data_vectorized, sampling, data_model):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def validator_fingerprint() -> str:
+    """Hash of the validator sources; any edit to them invalidates cached results."""
+    from galaxy import data_pipeline, data_vectorized
+
+    digest = hashlib.blake2b(digest_size=16)
+    for module in (data_pipeline, data_vectorized):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+class GenerationCache:
+    """Directory of generated system chunks with a size-bounded LRU policy."""
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+
+    def key(
+        self,
+        seed: int,
+        start: int,
+        stop: int,
+        sector_names: list[str],
+        planets_per_system: int,
+        engine: str,
+    ) -> str:
+        payload = json.dumps(
+            [generator_fingerprint(), seed, start, stop, sector_names, planets_per_system, engine],
+            separators=(",", ":"),
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def load(self, key: str) -> list[dict[str, Any]] | None:
+        path = self._path(key)
+        try:
+            systems = json.loads(path.read_text(encoding="utf-8"))
+            # Bump the mtime so eviction treats the entry as recently used.
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return systems
+
+    def store(self, key: str, systems: list[dict[str, Any]]) -> None:
+        # Write-then-rename so concurrent readers never see a partial entry.
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                # json.dumps uses the C encoder; json.dump streams through the Python one.
+                fh.write(json.dumps(systems, separators=(",", ":")))
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._stores += 1
+        if self._stores % EVICT_EVERY_STORES == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries until the cache fits; return the count removed.
+
+        Temporary files orphaned by a crashed write are removed as well and
+        count towards the total.
+        """
+        entries = []
+        total = 0
+        removed = 0
+        stale_before = time.time_ns() - _STALE_TMP_SECONDS * 10**9
+        for path in self.directory.glob("*.tmp"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime_ns < stale_before:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                total += stat.st_size  # a write in progress
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total += sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+class ValidationCache:
+    """Per-system validation results in one JSON file, keyed by content hash.
+
+    Results are stored without the unknown-sector check, which depends on the
+    rest of the document and is always re-run. :meth:`save` keeps only the
+    entries used since the cache was opened, so the file tracks the latest
+    dataset instead of growing with every edit.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, list[Any]] = {}
+        self._used: dict[str, list[Any]] = {}
+        try:
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(stored, dict) and stored.get("validator") == validator_fingerprint():
+            self._entries = stored.get("entries", {})
+
+    @staticmethod
+    def key(system: dict[str, Any]) -> str:
+        # Canonical compact JSON, so equal content hashes alike however the
+        # system was built (parsed, generated or converted from records).
+        canonical = json.dumps(system, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def load(self, key: str) -> tuple[list[str], bool] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used[key] = entry
+        return entry[1], bool(entry[0])
+
+    def store(self, key: str, issues: list[str], is_m: bool) -> None:
+        self._used[key] = self._entries[key] = [is_m, issues]
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(json.dumps({"validator": validator_fingerprint(), "entries": self._used}, separators=(",", ":")))
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
@@ -3,11 +3,46 @@
 from __future__ import annotations
 
 import argparse
+from contextlib import ExitStack
+import functools
 import json
 from pathlib import Path
-from typing import Sequence
+import sys
+import time
+from typing import Callable, Sequence
 
-from galaxy.data_pipeline import export_galaxy_json, generate_galaxy, validate_galaxy
+from galaxy.bench import (
+    DEFAULT_MEMORY_THRESHOLD,
+    DEFAULT_REPEATS,
+    DEFAULT_SCALES,
+    DEFAULT_TIME_THRESHOLD,
+    build_baseline,
+    compare_to_baseline,
+    format_record,
+    run_benchmarks,
+)
+from galaxy.data_binary import export_galaxy_binary, is_galaxy_binary, open_galaxy_binary, stream_galaxy_binary
+from galaxy.data_cache import DEFAULT_CACHE_MAX_BYTES, GenerationCache, ValidationCache
+from galaxy.data_dictionary import decode_galaxy, export_galaxy_dictionary, stream_galaxy_dictionary
+from galaxy.data_ndjson import iter_galaxy_systems, read_galaxy_file, write_ndjson
+from galaxy.data_pipeline import (
+    ENGINES,
+    export_galaxy_json,
+    generate_galaxy,
+    iter_validate_galaxy,
+    stream_galaxy_json,
+    validate_galaxy,
+)
+from galaxy.data_shards import is_shard_manifest, load_manifest, validate_galaxy_shards, write_galaxy_shards
+from galaxy.data_snapshot import load_galaxy_state, load_snapshot, write_snapshot
+from galaxy.data_stream import iter_validate_stream
+from galaxy.profiling import StageTimings, profiling
+from galaxy.search import Query, parse_query, search_seeds
+from galaxy.serialization import JSON_STYLES
+from galaxy.sweep import parse_seed_range, sweep_seeds
+from galaxy.web_assets import precompress_assets
+
+FORMATS = ("json", "dictionary", "binary")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -25,7 +60,7 @@ def build_parser() -> argparse.ArgumentParser:
         "-o",
         "--output",
         default="web/galaxy-data.json",
-        help="Output JSON path.",
+        help="Output path.",
     )
     generate_parser.add_argument(
         "--seed",
@@ -51,33 +86,392 @@ def build_parser() -> argparse.ArgumentParser:
         default=6,
         help="Planet count per system.",
     )
+    generate_parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="json",
+        help="Output format: indented JSON, compact dictionary-encoded JSON, or the memory-mappable binary columnar format.",
+    )
+    generate_parser.add_argument(
+        "--json-style",
+        choices=JSON_STYLES,
+        default="pretty",
+        help="Layout for --format json: indented (pretty) or without whitespace (compact).",
+    )
+    generate_parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help="Planet generation engine (numpy falls back to python when NumPy is missing).",
+    )
+    generate_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Generate with per-system seed streams across N worker processes (output is identical for any N).",
+    )
+    generate_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream systems to the output file instead of building the galaxy in memory.",
+    )
+    generate_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Reuse unchanged chunks of systems from this directory (implies per-system seeds; --jobs defaults to 1).",
+    )
+    generate_parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+        help="Evict least-recently-used cache entries beyond this size.",
+    )
     generate_parser.add_argument(
         "--strict",
         action="store_true",
         help="Return non-zero exit code when validation finds issues.",
     )
+    _add_profile_arguments(generate_parser)
 
     validate_parser = subparsers.add_parser(
         "validate",
-        help="Validate an existing galaxy JSON file.",
+        help="Validate an existing galaxy JSON or binary file, or a shard manifest.",
+    )
+    validate_parser.add_argument(
+        "input",
+        type=Path,
+        help="Path to a JSON or binary galaxy file, or to a shard manifest.json (shards are checked across --jobs workers).",
+    )
+    validate_parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help="Validation kernel (numpy screens systems as arrays; falls back to python when NumPy is missing).",
+    )
+    validate_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Validate systems across N worker processes.",
+    )
+    validate_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Parse systems incrementally with bounded memory and report issues as they are found.",
+    )
+    validate_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first issue (implies --stream).",
     )
     validate_parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="Reuse per-system results stored in this file for systems whose content is unchanged.",
+    )
+    _add_profile_arguments(validate_parser)
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Convert an existing galaxy JSON or binary file for bulk consumers.",
+    )
+    export_parser.add_argument(
+        "input",
+        type=Path,
+        help="Path to a JSON or binary galaxy file.",
+    )
+    export_mode = export_parser.add_mutually_exclusive_group(required=True)
+    export_mode.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write one compact system per line (newline-delimited JSON), streaming with constant memory.",
+    )
+    export_mode.add_argument(
+        "--shards",
+        action="store_true",
+        help="Write one shard per sector plus manifest.json (with hashes and per-system byte offsets) into the -o directory.",
+    )
+    export_parser.add_argument(
+        "--sector",
+        default=None,
+        help="Only export systems in this sector (id or name).",
+    )
+    export_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Output file (default: standard output), or the output directory for --shards.",
+    )
+
+    snapshot_parser = subparsers.add_parser(
+        "snapshot",
+        help="Precompute the API's parsed and indexed dataset into a fast-load snapshot.",
+    )
+    snapshot_parser.add_argument(
         "input",
         type=Path,
-        help="Path to JSON file.",
+        nargs="?",
+        default=Path("web/galaxy-data.json"),
+        help="Galaxy JSON the API serves (default: web/galaxy-data.json).",
+    )
+    snapshot_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Snapshot path (default: galaxy-data.snapshot in the current directory, next to app.py where it looks for it).",
+    )
+
+    sweep_parser = subparsers.add_parser(
+        "sweep",
+        help="Summarise galaxies generated across a range of seeds without storing them.",
+    )
+    sweep_parser.add_argument(
+        "--seeds",
+        type=_seed_range,
+        required=True,
+        help="Seeds to generate, as START:STOP (stop exclusive) or a single seed.",
+    )
+    sweep_parser.add_argument(
+        "--sectors",
+        type=int,
+        default=6,
+        help="Sector count per galaxy.",
+    )
+    sweep_parser.add_argument(
+        "--systems",
+        type=int,
+        default=3,
+        help="System count per galaxy.",
+    )
+    sweep_parser.add_argument(
+        "--planets-per-system",
+        type=int,
+        default=6,
+        help="Planet count per system.",
+    )
+    sweep_parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help="Generation engine (numpy falls back to python when NumPy is missing).",
+    )
+    sweep_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Generate seed chunks across N worker processes.",
+    )
+    sweep_parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="Also write the full summary (moments, quantiles, histograms, type mix) to this JSON file.",
+    )
+
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Find seeds whose galaxy matches a query, pruning each seed as soon as it cannot match.",
+    )
+    search_parser.add_argument(
+        "--where",
+        type=_search_query,
+        required=True,
+        help="Query, e.g. 'planets(hab >= 70) >= 3 and no stars(cls in [O, B])'.",
+    )
+    search_parser.add_argument(
+        "--seeds",
+        type=_seed_range,
+        default=range(0, 1_000_000),
+        help="Seeds to search, as START:STOP (stop exclusive) or a single seed (default: 0:1000000).",
+    )
+    search_parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Stop after this many matching seeds.",
+    )
+    search_parser.add_argument(
+        "--sectors",
+        type=int,
+        default=6,
+        help="Sector count per galaxy.",
+    )
+    search_parser.add_argument(
+        "--systems",
+        type=int,
+        default=3,
+        help="System count per galaxy.",
+    )
+    search_parser.add_argument(
+        "--planets-per-system",
+        type=int,
+        default=6,
+        help="Planet count per system.",
+    )
+    search_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Search seed chunks across N worker processes.",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark generate/validate/export/load and compare with a baseline.",
+    )
+    bench_parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SCALES),
+        help="System counts to benchmark (default: 10 1000; add 100000 for the full run).",
+    )
+    bench_parser.add_argument(
+        "--repeats",
+        type=int,
+        default=DEFAULT_REPEATS,
+        help="Timed repetitions per operation (after one traced warm-up pass).",
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=Path("benchmarks/baseline.json"),
+        help="Baseline file to compare against.",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_TIME_THRESHOLD,
+        help="Allowed best-of-N slowdown before failing (0.25 = 25%%).",
+    )
+    bench_parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=DEFAULT_MEMORY_THRESHOLD,
+        help="Allowed peak-memory growth before failing.",
+    )
+    bench_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results to the baseline file instead of comparing.",
+    )
+    bench_parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="Also write the raw results to this JSON file.",
+    )
+
+    precompress_parser = subparsers.add_parser(
+        "precompress",
+        help="Write .gz/.br siblings for web assets so the app can serve them precompressed.",
+    )
+    precompress_parser.add_argument(
+        "directory",
+        type=Path,
+        nargs="?",
+        default=Path("web"),
+        help="Asset directory (default: web).",
     )
     return parser
 
 
+def _seed_range(text: str) -> range:
+    try:
+        return parse_seed_range(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _search_query(text: str) -> Query:
+    try:
+        return parse_query(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-stage timing breakdown when done.",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        default=None,
+        help="Write the stage breakdown to this JSON file (implies --profile).",
+    )
+
+
+def _profiled(handler: Callable[[argparse.Namespace], int], args: argparse.Namespace) -> int:
+    if not args.profile and args.profile_json is None:
+        return handler(args)
+    registry = StageTimings()
+    with profiling(registry):
+        status = handler(args)
+    print("Profile:")
+    print(registry.format())
+    if args.profile_json is not None:
+        args.profile_json.parent.mkdir(parents=True, exist_ok=True)
+        args.profile_json.write_text(json.dumps(registry.report(), indent=2) + "\n", encoding="utf-8")
+        print(f"Profile written: {args.profile_json}")
+    return status
+
+
 def handle_generate(args: argparse.Namespace) -> int:
+    cache = None
+    if args.cache_dir is not None:
+        cache = GenerationCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+        if args.jobs is None:
+            args.jobs = 1
+    try:
+        return _generate(args, cache)
+    finally:
+        if cache is not None:
+            print(f"Cache: {cache.hits} chunks reused, {cache.misses} generated")
+
+
+def _generate(args: argparse.Namespace, cache: GenerationCache | None) -> int:
+    if args.stream:
+        if args.format == "json":
+            writer = functools.partial(stream_galaxy_json, style=args.json_style)
+        else:
+            writer = {"dictionary": stream_galaxy_dictionary, "binary": stream_galaxy_binary}[args.format]
+        output = writer(
+            args.output,
+            seed=args.seed,
+            sector_count=args.sectors,
+            system_count=args.systems,
+            planets_per_system=args.planets_per_system,
+            engine=args.engine,
+            workers=args.jobs,
+            cache=cache,
+        )
+        print(f"Generated: {output}")
+        print(f"Systems: {args.systems}, sectors: {args.sectors}")
+        issue_count = _report_stream_issues(output, fail_fast=False)
+        return 1 if issue_count and args.strict else 0
+
     data = generate_galaxy(
         seed=args.seed,
         sector_count=args.sectors,
         system_count=args.systems,
         planets_per_system=args.planets_per_system,
+        engine=args.engine,
+        workers=args.jobs,
+        cache=cache,
     )
-    issues = validate_galaxy(data)
-    output = export_galaxy_json(data, args.output)
+    issues = validate_galaxy(data, workers=args.jobs, engine=args.engine)
+    if args.format == "json":
+        exporter = functools.partial(export_galaxy_json, style=args.json_style)
+    else:
+        exporter = {"dictionary": export_galaxy_dictionary, "binary": export_galaxy_binary}[args.format]
+    output = exporter(data, args.output)
 
     print(f"Generated: {output}")
     print(f"Systems: {len(data['systems'])}, sectors: {len(data['sectors'])}")
@@ -90,21 +484,233 @@ def handle_generate(args: argparse.Namespace) -> int:
     return 0
 
 
+def _report_stream_issues(path: Path, *, fail_fast: bool) -> int:
+    issue_count = 0
+    with ExitStack() as stack:
+        if is_galaxy_binary(path):
+            galaxy = stack.enter_context(open_galaxy_binary(path))
+            issues = iter_validate_galaxy(galaxy.sectors, galaxy.iter_systems())
+        else:
+            issues = iter_validate_stream(stack.enter_context(path.open("r", encoding="utf-8")))
+        for issue in issues:
+            issue_count += 1
+            print(f"- {issue}", flush=True)
+            if fail_fast:
+                break
+    print(f"Validation issues: {issue_count}{' (stopped at first issue)' if fail_fast and issue_count else ''}")
+    return issue_count
+
+
 def handle_validate(args: argparse.Namespace) -> int:
+    if args.cache is not None and (args.stream or args.fail_fast):
+        print("--cache cannot be combined with --stream or --fail-fast.")
+        return 2
+    if args.stream or args.fail_fast:
+        try:
+            issue_count = _report_stream_issues(args.input, fail_fast=args.fail_fast)
+        except FileNotFoundError:
+            print(f"Input file not found: {args.input}")
+            return 2
+        except json.JSONDecodeError as exc:
+            print(f"Invalid JSON ({args.input}): {exc}")
+            return 2
+        except ValueError as exc:
+            # Binary reader errors already name the file.
+            print(exc if is_galaxy_binary(args.input) else f"Invalid dictionary encoding ({args.input}): {exc}")
+            return 2
+        return 1 if issue_count else 0
+
+    cache = ValidationCache(args.cache) if args.cache is not None else None
+    if is_shard_manifest(args.input):
+        if cache is not None:
+            print("--cache cannot be combined with a shard manifest.")
+            return 2
+        try:
+            issues = validate_galaxy_shards(args.input, workers=args.jobs)
+        except (json.JSONDecodeError, ValueError) as exc:
+            print(f"Invalid shard manifest ({args.input}): {exc}")
+            return 2
+    elif is_galaxy_binary(args.input):
+        try:
+            galaxy = open_galaxy_binary(args.input)
+        except ValueError as exc:
+            print(exc)
+            return 2
+        with galaxy:
+            issues = validate_galaxy(galaxy.document(), workers=args.jobs, engine=args.engine, cache=cache)
+    else:
+        try:
+            payload = json.loads(args.input.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            print(f"Input file not found: {args.input}")
+            return 2
+        except json.JSONDecodeError as exc:
+            print(f"Invalid JSON ({args.input}): {exc}")
+            return 2
+        try:
+            payload = decode_galaxy(payload)
+        except ValueError as exc:
+            print(f"Invalid dictionary encoding ({args.input}): {exc}")
+            return 2
+        issues = validate_galaxy(payload, workers=args.jobs, engine=args.engine, cache=cache)
+
+    if cache is not None:
+        cache.save()
+        print(f"Cache: {cache.hits} systems reused, {cache.misses} validated")
+    print(f"Validation issues: {len(issues)}")
+    for issue in issues:
+        print(f"- {issue}")
+    return 1 if issues else 0
+
+
+def _export_shards(args: argparse.Namespace) -> int:
+    if args.output is None:
+        print("--shards needs an output directory (-o DIR).", file=sys.stderr)
+        return 2
+    if args.sector is not None:
+        print("--sector cannot be combined with --shards.", file=sys.stderr)
+        return 2
+    document, systems = read_galaxy_file(args.input)
+    try:
+        manifest = write_galaxy_shards(args.output, document, systems)
+    except json.JSONDecodeError as exc:
+        print(f"Invalid JSON ({args.input}): {exc}", file=sys.stderr)
+        return 2
+    except ValueError as exc:
+        print(f"Cannot export {args.input}: {exc}", file=sys.stderr)
+        return 2
+    shards = load_manifest(manifest)["shards"]
+    print(f"Exported {sum(len(shard['systems']) for shard in shards)} systems to {len(shards)} shards: {manifest}")
+    return 0
+
+
+def handle_export(args: argparse.Namespace) -> int:
+    if not args.input.is_file():
+        print(f"Input file not found: {args.input}", file=sys.stderr)
+        return 2
+    if args.shards:
+        return _export_shards(args)
+    systems = iter_galaxy_systems(args.input, sector=args.sector)
     try:
-        payload = json.loads(args.input.read_text(encoding="utf-8"))
-    except FileNotFoundError:
+        if args.output is None:
+            count = write_ndjson(sys.stdout, systems)
+            sys.stdout.flush()
+        else:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            with args.output.open("w", encoding="utf-8") as fh:
+                count = write_ndjson(fh, systems)
+    except json.JSONDecodeError as exc:
+        print(f"Invalid JSON ({args.input}): {exc}", file=sys.stderr)
+        return 2
+    except ValueError as exc:
+        print(f"Cannot export {args.input}: {exc}", file=sys.stderr)
+        return 2
+    # Keep stdout pure NDJSON when piping.
+    print(f"Exported {count} systems{f' to {args.output}' if args.output is not None else ''}", file=sys.stderr)
+    return 0
+
+
+def handle_snapshot(args: argparse.Namespace) -> int:
+    if not args.input.is_file():
         print(f"Input file not found: {args.input}")
         return 2
+    output = args.output or Path("galaxy-data.snapshot")
+    try:
+        write_snapshot(args.input, output)
     except json.JSONDecodeError as exc:
         print(f"Invalid JSON ({args.input}): {exc}")
         return 2
+    except ValueError as exc:
+        print(f"Invalid dictionary encoding ({args.input}): {exc}")
+        return 2
 
-    issues = validate_galaxy(payload)
-    print(f"Validation issues: {len(issues)}")
-    for issue in issues:
-        print(f"- {issue}")
-    return 1 if issues else 0
+    start = time.perf_counter()
+    load_galaxy_state(args.input)
+    from_json = time.perf_counter() - start
+    start = time.perf_counter()
+    load_snapshot(output, source=args.input)
+    from_snapshot = time.perf_counter() - start
+    print(f"Snapshot: {output} ({output.stat().st_size / 2**20:.1f} MiB)")
+    print(f"Load: {from_snapshot * 1e3:.1f} ms from snapshot, {from_json * 1e3:.1f} ms from JSON")
+    return 0
+
+
+def handle_sweep(args: argparse.Namespace) -> int:
+    summary = sweep_seeds(
+        args.seeds,
+        sector_count=args.sectors,
+        system_count=args.systems,
+        planets_per_system=args.planets_per_system,
+        engine=args.engine,
+        workers=args.jobs,
+    )
+    print(summary.format())
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(summary.report(), indent=2) + "\n", encoding="utf-8")
+        print(f"Summary written: {args.json}")
+    return 0
+
+
+def handle_search(args: argparse.Namespace) -> int:
+    try:
+        summary = search_seeds(
+            args.where,
+            args.seeds,
+            limit=args.limit,
+            sector_count=args.sectors,
+            system_count=args.systems,
+            planets_per_system=args.planets_per_system,
+            workers=args.jobs,
+        )
+    except ValueError as exc:
+        print(f"Search failed: {exc}")
+        return 2
+    print(summary.format(args.where))
+    return 0
+
+
+def handle_bench(args: argparse.Namespace) -> int:
+    baseline = None
+    if not args.update_baseline and args.baseline.is_file():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+
+    regressions: list[str] = []
+
+    def report(record: dict) -> None:
+        if baseline is not None:
+            regressions.extend(
+                compare_to_baseline([record], baseline, time_threshold=args.threshold, memory_threshold=args.memory_threshold)
+            )
+        print(format_record(record), flush=True)
+
+    results = run_benchmarks(args.scales, repeats=args.repeats, progress=report)
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(build_baseline(results), indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written: {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+    print(f"Regressions: {len(regressions)}")
+    for regression in regressions:
+        print(f"- {regression}")
+    return 1 if regressions else 0
+
+
+def handle_precompress(args: argparse.Namespace) -> int:
+    if not args.directory.is_dir():
+        print(f"Asset directory not found: {args.directory}")
+        return 2
+    written = precompress_assets(args.directory)
+    for path in written:
+        print(f"Wrote: {path}")
+    print(f"Compressed assets: {len(written)}")
+    return 0
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -112,8 +718,20 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "generate":
-        return handle_generate(args)
-    return handle_validate(args)
+        return _profiled(handle_generate, args)
+    if args.command == "export":
+        return handle_export(args)
+    if args.command == "snapshot":
+        return handle_snapshot(args)
+    if args.command == "sweep":
+        return handle_sweep(args)
+    if args.command == "search":
+        return handle_search(args)
+    if args.command == "bench":
+        return handle_bench(args)
+    if args.command == "precompress":
+        return handle_precompress(args)
+    return _profiled(handle_validate, args)
 
 
 if __name__ == "__main__":
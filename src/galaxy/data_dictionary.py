@@ -0,0 +1,228 @@
+"""Dictionary-encoded galaxy JSON export.
+
+Planet types, visual descriptions, science explanations, exploration status
+blocks and timeline events come from small template sets, so a plain export
+repeats the same text for every planet. The dictionary encoding moves them
+into a top-level ``tables`` object that precedes ``systems``:
+
+* ``t`` lists planet type labels; a planet's ``t`` is an index into it.
+* ``x`` lists distinct exploration status blocks; ``x`` is an index.
+* ``text`` lists text templates as fragments split around numbers. A text
+  field without numbers is a bare index; one with numbers is
+  ``[index, "0.123", "1.00", ...]`` with the numbers as written, so decoding
+  reproduces the original string exactly.
+
+Everything else is unchanged, and the file is written without indentation.
+:func:`decode_galaxy` (and ``decodeGalaxy`` in ``web/galaxy-codec.js``)
+restores the plain document.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import re
+import shutil
+import tempfile
+from typing import Any, Iterable, Iterator, TextIO
+
+from galaxy.data_cache import GenerationCache
+from galaxy.data_model import System, as_system_dict
+from galaxy.data_pipeline import _galaxy_document, _plan_galaxy
+from galaxy.serialization import dumps
+
+TABLES_VERSION = 1
+
+_NUMBER = re.compile(r"(\d+(?:\.\d+)?)")
+_COMPACT = (",", ":")
+
+
+class DictionaryEncoder:
+    """Encodes systems one at a time while collecting the shared tables."""
+
+    def __init__(self) -> None:
+        self._types: dict[str, int] = {}
+        self._statuses: dict[str, int] = {}
+        self._status_values: list[dict[str, Any]] = []
+        self._templates: dict[tuple[str, ...], int] = {}
+
+    def _text(self, value: str) -> int | list[Any]:
+        parts = _NUMBER.split(value)
+        fragments = tuple(parts[0::2])
+        slot = self._templates.setdefault(fragments, len(self._templates))
+        numbers = parts[1::2]
+        return [slot, *numbers] if numbers else slot
+
+    def _status(self, value: dict[str, Any]) -> int:
+        key = json.dumps(value, separators=_COMPACT)
+        slot = self._statuses.get(key)
+        if slot is None:
+            slot = self._statuses[key] = len(self._status_values)
+            self._status_values.append(value)
+        return slot
+
+    def planet(self, planet: dict[str, Any]) -> dict[str, Any]:
+        encoded = dict(planet)
+        if isinstance(planet.get("t"), str):
+            encoded["t"] = self._types.setdefault(planet["t"], len(self._types))
+        for key in ("v", "sci"):
+            if isinstance(planet.get(key), str):
+                encoded[key] = self._text(planet[key])
+        if isinstance(planet.get("x"), dict):
+            encoded["x"] = self._status(planet["x"])
+        return encoded
+
+    def system(self, system: dict[str, Any] | System) -> dict[str, Any]:
+        system = as_system_dict(system)
+        encoded = dict(system)
+        encoded["tl"] = [
+            [event[0], self._text(event[1])] if isinstance(event, list) and len(event) == 2 and isinstance(event[1], str) else event
+            for event in system.get("tl", [])
+        ]
+        encoded["p"] = [self.planet(planet) for planet in system.get("p", [])]
+        return encoded
+
+    def tables(self) -> dict[str, Any]:
+        return {
+            "version": TABLES_VERSION,
+            "t": list(self._types),
+            "x": self._status_values,
+            "text": [list(fragments) for fragments in self._templates],
+        }
+
+
+class DictionaryDecoder:
+    """Expands systems encoded against ``tables``; raises ``ValueError`` on bad references."""
+
+    def __init__(self, tables: Any) -> None:
+        if not isinstance(tables, dict) or tables.get("version") != TABLES_VERSION:
+            raise ValueError(f"Unsupported dictionary tables (expected version {TABLES_VERSION}).")
+        self._types = tables.get("t", [])
+        self._statuses = tables.get("x", [])
+        self._templates = ["".join(fragments) if len(fragments) == 1 else fragments for fragments in tables.get("text", [])]
+
+    @staticmethod
+    def _lookup(table: list[Any], ref: Any, field: str) -> Any:
+        if not isinstance(ref, int) or isinstance(ref, bool) or not 0 <= ref < len(table):
+            raise ValueError(f"Dictionary reference {ref!r} in '{field}' is out of range.")
+        return table[ref]
+
+    def _text(self, ref: Any, field: str) -> str:
+        if isinstance(ref, list) and ref:
+            fragments = self._lookup(self._templates, ref[0], field)
+            numbers = ref[1:]
+            if isinstance(fragments, str) or len(fragments) != len(numbers) + 1:
+                raise ValueError(f"Dictionary template {ref[0]} in '{field}' expects a different number of values.")
+            return fragments[0] + "".join(str(number) + fragment for number, fragment in zip(numbers, fragments[1:]))
+        template = self._lookup(self._templates, ref, field)
+        if not isinstance(template, str):
+            raise ValueError(f"Dictionary template {ref} in '{field}' needs numeric values.")
+        return template
+
+    def planet(self, planet: dict[str, Any]) -> dict[str, Any]:
+        decoded = dict(planet)
+        if "t" in planet:
+            decoded["t"] = self._lookup(self._types, planet["t"], "t")
+        for key in ("v", "sci"):
+            if key in planet:
+                decoded[key] = self._text(planet[key], key)
+        if "x" in planet:
+            decoded["x"] = dict(self._lookup(self._statuses, planet["x"], "x"))
+        return decoded
+
+    def system(self, system: dict[str, Any]) -> dict[str, Any]:
+        decoded = dict(system)
+        if isinstance(system.get("tl"), list):
+            decoded["tl"] = [
+                [event[0], self._text(event[1], "tl")] if isinstance(event, list) and len(event) == 2 else event
+                for event in system["tl"]
+            ]
+        if isinstance(system.get("p"), list):
+            decoded["p"] = [self.planet(planet) if isinstance(planet, dict) else planet for planet in system["p"]]
+        return decoded
+
+
+def is_dictionary_encoded(data: Any) -> bool:
+    return isinstance(data, dict) and "tables" in data
+
+
+def decode_galaxy(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the plain document for ``data``; plain documents pass through unchanged."""
+    if not is_dictionary_encoded(data):
+        return data
+    decoder = DictionaryDecoder(data["tables"])
+    decoded = {key: value for key, value in data.items() if key != "tables"}
+    if isinstance(data.get("systems"), list):
+        decoded["systems"] = [decoder.system(system) if isinstance(system, dict) else system for system in data["systems"]]
+    return decoded
+
+
+def _document_frame(document: dict[str, Any], tables: dict[str, Any]) -> tuple[str, str]:
+    head: dict[str, Any] = {}
+    for key, value in document.items():
+        if key == "systems":
+            head["tables"] = tables
+            break
+        head[key] = value
+    tail = {key: value for key, value in document.items() if key not in head and key != "systems"}
+    head_text = dumps(head, "compact")[:-1] + ',"systems":['
+    tail_text = dumps(tail, "compact")
+    return head_text, "]" + ("," + tail_text[1:] if tail else "}")
+
+
+def _write_encoded_systems(fh: TextIO, encoder: DictionaryEncoder, systems: Iterable[dict[str, Any]]) -> None:
+    for count, system in enumerate(systems):
+        if count:
+            fh.write(",")
+        fh.write(dumps(encoder.system(system), "compact"))
+
+
+def export_galaxy_dictionary(data: dict[str, Any], output_path: str | Path) -> Path:
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    encoder = DictionaryEncoder()
+    systems = [encoder.system(system) for system in data["systems"]]
+    head, tail = _document_frame(data, encoder.tables())
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write(head)
+        fh.write(",".join(dumps(system, "compact") for system in systems))
+        fh.write(tail)
+    return path
+
+
+def stream_galaxy_dictionary(
+    output_path: str | Path,
+    *,
+    seed: int | None = None,
+    sector_count: int = 6,
+    system_count: int = 3,
+    planets_per_system: int = 6,
+    engine: str = "python",
+    workers: int | None = None,
+    cache: GenerationCache | None = None,
+) -> Path:
+    """Generate a galaxy straight into the dictionary encoding.
+
+    The tables precede ``systems`` but are only complete once every system is
+    encoded, so systems are spooled to a temporary file next to the output
+    and copied in after the header.
+    """
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    seed, sectors, systems = _plan_galaxy(seed, sector_count, system_count, planets_per_system, engine, workers, cache)
+
+    def assign_sectors() -> Iterator[dict[str, Any]]:
+        for i, system in enumerate(systems):
+            sectors[i % len(sectors)]["s"].append(system["n"])
+            yield system
+
+    encoder = DictionaryEncoder()
+    with tempfile.TemporaryFile("w+", encoding="utf-8", dir=path.parent) as spool:
+        _write_encoded_systems(spool, encoder, assign_sectors())
+        head, tail = _document_frame(_galaxy_document(sectors, [], seed), encoder.tables())
+        spool.seek(0)
+        with path.open("w", encoding="utf-8") as fh:
+            fh.write(head)
+            shutil.copyfileobj(spool, fh)
+            fh.write(tail)
+    return path
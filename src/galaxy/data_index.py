@@ -0,0 +1,198 @@
+"""In-memory lookup index over a generated galaxy document.
+
+The web detail pages address sectors, systems and planets by slug tokens
+(``?system=halcyon-drift``). :class:`GalaxyIndex` builds every token → record
+mapping once so the API can answer single-entity requests in O(1).
+
+Planet listings use secondary indexes: every planet gets an ordinal in
+dataset order, and each filter value (type, star class, locked) keeps a
+posting list of ordinals in every sort order. A query walks the smallest
+matching posting list from the cursor position and stops after one page, so
+latency depends on the page size rather than the dataset size.
+"""
+
+from __future__ import annotations
+
+from array import array
+import base64
+from bisect import bisect_left, bisect_right
+import json
+from pathlib import Path
+import re
+from typing import Any
+
+from galaxy.data_dictionary import decode_galaxy
+
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+PLANET_SORTS = ("index", "hab", "-hab")
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def slugify(value: Any) -> str:
+    """Match ``slugify`` in the web pages so URL tokens resolve identically."""
+    return _NON_SLUG.sub("-", str(value or "").lower().strip()).strip("-")
+
+
+def planet_token(system_id: Any, planet_name: Any) -> str:
+    return f"{slugify(system_id)}-{slugify(planet_name)}"
+
+
+def _register(index: dict[str, Any], record: Any, *tokens: Any) -> None:
+    for token in tokens:
+        slug = slugify(token)
+        if slug:
+            # First record wins, mirroring Array.prototype.find on the client.
+            index.setdefault(slug, record)
+
+
+class GalaxyIndex:
+    """Token lookups for sectors, systems and planets built in one pass."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+        self._sectors: dict[str, dict[str, Any]] = {}
+        self._systems: dict[str, dict[str, Any]] = {}
+        self._planets: dict[int, dict[str, dict[str, Any]]] = {}
+        self._sector_systems: dict[str, list[dict[str, Any]]] = {}
+
+        for sector in data.get("sectors", []):
+            _register(self._sectors, sector, sector.get("id"), sector.get("n"))
+        for system in data.get("systems", []):
+            _register(self._systems, system, system.get("id"), system.get("n"))
+            self._sector_systems.setdefault(slugify(system.get("sector")), []).append(system)
+        self._build_planet_indexes()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The per-system planet lookups are keyed by id() and rebuilt on use.
+        return {**self.__dict__, "_planets": {}}
+
+    def _build_planet_indexes(self) -> None:
+        rows = [(system, planet) for system in self.data.get("systems", []) for planet in system.get("p", [])]
+        self._planet_rows = rows
+        habs = array("q", (int(planet.get("hab", 0)) for _, planet in rows))
+        self._habs = habs
+        count = max(len(rows), 1)
+        max_hab = max(habs, default=0)
+
+        type_slugs: dict[Any, str] = {}
+        self._planet_filters: list[tuple[tuple[str, Any], ...]] = []
+        for system, planet in rows:
+            planet_type = planet.get("t")
+            if planet_type not in type_slugs:
+                type_slugs[planet_type] = slugify(planet_type)
+            cls = str(system.get("star", {}).get("cls", "")).upper()
+            # dict.fromkeys drops the duplicate when the class is a bare letter.
+            filters = (("type", type_slugs[planet_type]), ("star_class", cls), ("star_class", cls[:1]), ("locked", bool(planet.get("locked"))))
+            self._planet_filters.append(tuple(dict.fromkeys(filters)))
+
+        groups: dict[tuple[str, Any], list[int]] = {("all", None): list(range(len(rows)))}
+        for ordinal, filters in enumerate(self._planet_filters):
+            for group in filters:
+                groups.setdefault(group, []).append(ordinal)
+
+        # Integer sort keys; stable sorts keep hab ties in dataset order.
+        ranks = {"hab": habs, "-hab": array("q", (max_hab - hab for hab in habs))}
+        self._postings: dict[tuple[str, Any], dict[str, tuple[array, array]]] = {}
+        for group, members in groups.items():
+            ordinals = array("q", members)
+            postings = {"index": (ordinals, ordinals)}
+            for sort, rank in ranks.items():
+                ordered = sorted(members, key=rank.__getitem__)
+                postings[sort] = (array("q", [rank[ordinal] * count + ordinal for ordinal in ordered]), array("q", ordered))
+            self._postings[group] = postings
+
+    def sector(self, token: str) -> dict[str, Any] | None:
+        return self._sectors.get(slugify(token))
+
+    def system(self, token: str) -> dict[str, Any] | None:
+        return self._systems.get(slugify(token))
+
+    def planet(self, system: dict[str, Any], token: str) -> dict[str, Any] | None:
+        planets = self._planets.get(id(system))
+        if planets is None:
+            # Built on first use; most systems never have a planet page opened.
+            planets = {}
+            for planet in system.get("p", []):
+                _register(planets, planet, planet_token(system.get("id"), planet.get("n")), planet.get("n"))
+            self._planets[id(system)] = planets
+        return planets.get(slugify(token))
+
+    def sector_of(self, system: dict[str, Any]) -> dict[str, Any] | None:
+        return self._sectors.get(slugify(system.get("sector")))
+
+    def systems_in(self, sector: dict[str, Any]) -> list[dict[str, Any]]:
+        return self._sector_systems.get(slugify(sector.get("n")), [])
+
+    def query_planets(
+        self,
+        *,
+        planet_type: str | None = None,
+        min_hab: int | None = None,
+        star_class: str | None = None,
+        locked: bool | None = None,
+        sort: str = "index",
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[list[tuple[dict[str, Any], dict[str, Any]]], str | None]:
+        """Return one page of ``(system, planet)`` matches and the next cursor.
+
+        ``star_class`` matches a full class (``K3V``) or a spectral letter
+        (``K``). Raises ``ValueError`` for an unknown sort or a bad cursor.
+        """
+        if sort not in PLANET_SORTS:
+            raise ValueError(f"Unknown sort '{sort}' (expected one of {', '.join(PLANET_SORTS)}).")
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        filters = []
+        if planet_type is not None:
+            filters.append(("type", slugify(planet_type)))
+        if star_class is not None:
+            filters.append(("star_class", star_class.strip().upper()))
+        if locked is not None:
+            filters.append(("locked", locked))
+        # Drive the scan from the most selective posting list; the remaining
+        # filters are checked per planet in O(1).
+        empty = (array("q"), array("q"))
+        keys, ordinals = min(
+            (self._postings.get(key, {}).get(sort, empty) for key in [("all", None), *filters]),
+            key=lambda posting: len(posting[1]),
+        )
+
+        start = bisect_right(keys, _decode_cursor(cursor, sort)) if cursor else 0
+        if sort == "hab" and min_hab is not None:
+            start = max(start, bisect_left(keys, min_hab * max(len(self._planet_rows), 1)))
+        matches: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        for position in range(start, len(ordinals)):
+            ordinal = ordinals[position]
+            if min_hab is not None and self._habs[ordinal] < min_hab:
+                if sort == "-hab":
+                    break  # every later planet scores lower
+                continue
+            if not all(key in self._planet_filters[ordinal] for key in filters):
+                continue
+            if len(matches) == limit:
+                # Resume after the last planet scanned, skipping known misses.
+                return matches, _encode_cursor(sort, keys[position - 1])
+            matches.append(self._planet_rows[ordinal])
+        return matches, None
+
+
+def _encode_cursor(sort: str, key: int) -> str:
+    return base64.urlsafe_b64encode(f"{sort}:{key}".encode("ascii")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> int:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        cursor_sort, key = raw.split(":")
+        if cursor_sort != sort:
+            raise ValueError
+        return int(key)
+    except ValueError:
+        raise ValueError("Invalid cursor for this query.") from None
+
+
+def load_galaxy_index(path: str | Path) -> GalaxyIndex:
+    return GalaxyIndex(decode_galaxy(json.loads(Path(path).read_text(encoding="utf-8"))))
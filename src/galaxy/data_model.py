@@ -0,0 +1,198 @@
+"""Compact slotted records for stars, planets and systems.
+
+The generator works with plain dicts that mirror the exported JSON. Holding
+millions of them costs several KB of heap per planet: every planet owns a
+dict, three two-item lists, an atmosphere dict, an exploration-status dict
+and its own copy of the visual description. :class:`Planet`, :class:`Star`
+and :class:`System` keep the same values in ``__slots__`` fields, store
+pairs as plain attributes and share the strings and small tuples that repeat
+across planets. ``to_dict()`` rebuilds the exact exported shape, and the
+exporters and ``validate_galaxy`` accept records directly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import sys
+from typing import Any
+
+_SHARED_LIMIT = 4096
+_shared: dict[Any, Any] = {}
+
+
+def _share(value: Any) -> Any:
+    """Return one canonical instance of a small repeated value."""
+    found = _shared.get(value)
+    if found is not None:
+        return found
+    if len(_shared) < _SHARED_LIMIT:
+        _shared[value] = value
+    return value
+
+
+@dataclass(slots=True)
+class Star:
+    cls: str
+    tk: int
+    lum: float
+    age: float
+    hz_inner: float
+    hz_outer: float
+    mult: str
+    frost: float
+    belt_inner: float
+    belt_outer: float
+    m: float
+
+    @classmethod
+    def from_dict(cls, star: dict[str, Any]) -> Star:
+        return cls(
+            star["cls"],
+            star["tk"],
+            star["lum"],
+            star["age"],
+            star["hz"][0],
+            star["hz"][1],
+            _share(star["mult"]),
+            star["frost"],
+            star["belt"][0],
+            star["belt"][1],
+            star["m"],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cls": self.cls,
+            "tk": self.tk,
+            "lum": self.lum,
+            "age": self.age,
+            "hz": [self.hz_inner, self.hz_outer],
+            "mult": self.mult,
+            "frost": self.frost,
+            "belt": [self.belt_inner, self.belt_outer],
+            "m": self.m,
+        }
+
+
+@dataclass(slots=True)
+class Planet:
+    n: str
+    t: str
+    mass: float
+    mass_unit: str
+    radius: float
+    radius_unit: str
+    g: float
+    a: float
+    op: float
+    rp: str
+    rot_days: float
+    tilt: float
+    temp_min: int
+    temp_max: int
+    atm_gases: tuple[str, ...]
+    atm_pct: tuple[float, ...]
+    pb: float
+    teq: float
+    tmean: float
+    mag: str
+    alb: float
+    hab: int
+    v: str
+    sci: str
+    x: tuple[tuple[str, str], ...]
+    locked: bool
+
+    @classmethod
+    def from_dict(cls, planet: dict[str, Any]) -> Planet:
+        return cls(
+            planet["n"],
+            _share(planet["t"]),
+            planet["m"][0],
+            _share(planet["m"][1]),
+            planet["rad"][0],
+            _share(planet["rad"][1]),
+            planet["g"],
+            planet["a"],
+            planet["op"],
+            planet["rp"],
+            planet["rot_days"],
+            planet["tilt"],
+            planet["temp"][0],
+            planet["temp"][1],
+            _share(tuple(planet["atm"])),
+            tuple(planet["atm"].values()),
+            planet["pb"],
+            planet["teq"],
+            planet["tmean"],
+            _share(planet["mag"]),
+            planet["alb"],
+            planet["hab"],
+            sys.intern(planet["v"]),
+            planet["sci"],
+            _share(tuple(planet["x"].items())),
+            planet["locked"],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "n": self.n,
+            "t": self.t,
+            "m": [self.mass, self.mass_unit],
+            "rad": [self.radius, self.radius_unit],
+            "g": self.g,
+            "a": self.a,
+            "op": self.op,
+            "rp": self.rp,
+            "rot_days": self.rot_days,
+            "tilt": self.tilt,
+            "temp": [self.temp_min, self.temp_max],
+            "atm": dict(zip(self.atm_gases, self.atm_pct)),
+            "pb": self.pb,
+            "teq": self.teq,
+            "tmean": self.tmean,
+            "mag": self.mag,
+            "alb": self.alb,
+            "hab": self.hab,
+            "v": self.v,
+            "sci": self.sci,
+            "x": dict(self.x),
+            "locked": self.locked,
+        }
+
+
+@dataclass(slots=True)
+class System:
+    id: str
+    n: str
+    sector: str
+    star: Star
+    tl: tuple[tuple[int, str], ...]
+    p: tuple[Planet, ...]
+
+    @classmethod
+    def from_dict(cls, system: dict[str, Any]) -> System:
+        """Convert a generator-shaped system; raises ``KeyError``/``IndexError`` on other shapes."""
+        return cls(
+            system["id"],
+            system["n"],
+            _share(system["sector"]),
+            Star.from_dict(system["star"]),
+            tuple((myr, _share(event)) for myr, event in system["tl"]),
+            tuple(Planet.from_dict(planet) for planet in system["p"]),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "n": self.n,
+            "sector": self.sector,
+            "star": self.star.to_dict(),
+            "tl": [[myr, event] for myr, event in self.tl],
+            "p": [planet.to_dict() for planet in self.p],
+        }
+
+
+def as_system_dict(system: Any) -> Any:
+    """The exported dict shape of ``system``; dicts and other values pass through."""
+    return system.to_dict() if isinstance(system, System) else system
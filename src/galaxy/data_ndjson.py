@@ -0,0 +1,115 @@
+"""Newline-delimited JSON (NDJSON) views of the galaxy's systems.
+
+Bulk consumers want to start on the first system before the last one is
+read. NDJSON puts one compact system object per line, so a reader can parse
+and process line by line with constant memory. :func:`iter_ndjson_chunks`
+encodes any iterable of systems and groups lines into chunks of about
+``chunk_size`` characters: large enough to keep write and syscall counts low,
+small enough that a slow client holds up at most one chunk of encoded output.
+:func:`read_galaxy_file` and :func:`iter_galaxy_systems` read systems from an
+export (plain, dictionary encoded or binary) without loading the whole
+document.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+from galaxy.data_binary import is_galaxy_binary, open_galaxy_binary
+from galaxy.data_dictionary import DictionaryDecoder
+from galaxy.data_index import slugify
+from galaxy.data_model import System, as_system_dict
+from galaxy.data_stream import CHUNK_SIZE, iter_galaxy_events
+from galaxy.serialization import dumps
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def iter_ndjson_chunks(systems: Iterable[dict[str, Any] | System], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yield NDJSON text for ``systems``, whole lines only, about ``chunk_size`` characters at a time."""
+    lines: list[str] = []
+    pending = 0
+    for system in systems:
+        line = dumps(as_system_dict(system), "compact") + "\n"
+        lines.append(line)
+        pending += len(line)
+        if pending >= chunk_size:
+            yield "".join(lines)
+            lines.clear()
+            pending = 0
+    if lines:
+        yield "".join(lines)
+
+
+def _sector_filter(sectors: Any, token: str) -> str:
+    for sector in sectors if isinstance(sectors, list) else []:
+        if isinstance(sector, dict) and slugify(token) in (slugify(sector.get("id")), slugify(sector.get("n"))):
+            return slugify(sector.get("n"))
+    raise ValueError(f"Unknown sector '{token}'.")
+
+
+def _iter_file_systems(path: Path, document: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    if is_galaxy_binary(path):
+        with open_galaxy_binary(path) as galaxy:
+            document.update(galaxy.document())
+            document["systems"] = []
+            yield from galaxy.iter_systems()
+        return
+    decoder: DictionaryDecoder | None = None
+    with path.open("r", encoding="utf-8") as fh:
+        for key, value in iter_galaxy_events(fh):
+            if key == "tables":
+                decoder = DictionaryDecoder(value)
+            elif key == "system":
+                yield decoder.system(value) if decoder is not None and isinstance(value, dict) else value
+            else:
+                document[key] = value
+
+
+def read_galaxy_file(path: str | Path) -> tuple[dict[str, Any], Iterator[dict[str, Any]]]:
+    """Open the export at ``path`` (plain, dictionary encoded or binary) for one streaming pass.
+
+    Returns ``(document, systems)``. ``systems`` yields decoded systems one at
+    a time; ``document`` collects every other top-level key, with an empty
+    ``systems`` list in its place, as the file is read. Keys that precede
+    ``systems`` (``sectors`` in exports) are present once the first system
+    arrives and the rest once ``systems`` is exhausted. Iterating raises
+    ``ValueError`` on bad dictionary references and ``json.JSONDecodeError``
+    on malformed JSON.
+    """
+    document: dict[str, Any] = {}
+    return document, _iter_file_systems(Path(path), document)
+
+
+def iter_galaxy_systems(path: str | Path, *, sector: str | None = None) -> Iterator[dict[str, Any]]:
+    """Yield the systems of the export at ``path`` one at a time.
+
+    ``sector`` keeps only systems in the sector with that id or name (as URL
+    token or verbatim); raises ``ValueError`` when no sector matches.
+    """
+    document, systems = read_galaxy_file(path)
+    wanted: str | None = None
+    for system in systems:
+        if sector is not None:
+            if wanted is None:
+                # Exports list sectors before systems; otherwise match by name.
+                wanted = _sector_filter(document["sectors"], sector) if "sectors" in document else slugify(sector)
+            if not isinstance(system, dict) or slugify(system.get("sector")) != wanted:
+                continue
+        yield system
+
+
+def write_ndjson(fh: TextIO, systems: Iterable[dict[str, Any] | System]) -> int:
+    """Write ``systems`` to ``fh`` as NDJSON; returns the number of systems written."""
+    count = 0
+
+    def counted() -> Iterator[dict[str, Any] | System]:
+        nonlocal count
+        for system in systems:
+            count += 1
+            yield system
+
+    for chunk in iter_ndjson_chunks(counted()):
+        fh.write(chunk)
+    return count
@@ -6,12 +6,27 @@ validates the generated physics constraints.
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
-import json
+import hashlib
+import itertools
 import math
 from pathlib import Path
 import random
-from typing import Any
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, TextIO
+
+from galaxy.data_model import System, as_system_dict
+from galaxy.profiling import increment, stage
+from galaxy.sampling import CategoricalSampler, LogUniformSampler, UniformSampler
+from galaxy.serialization import dumps
+
+if TYPE_CHECKING:
+    from galaxy.data_cache import GenerationCache, ValidationCache
 
 EARTH_MASS_PER_JUPITER = 317.8
 EARTH_RADIUS_PER_JUPITER = 11.21
@@ -110,21 +125,108 @@ PROFILE_LABEL_TO_KEY: dict[str, str] = {
     for key, profile in PLANET_PROFILES.items()
 }
 
+ATMOSPHERE_BASES: dict[str, dict[str, float]] = {
+    "volcanic": {"CO2": 58, "SO2": 17, "N2": 14, "CO": 8, "Ar": 3},
+    "hot_super_earth": {"CO2": 66, "N2": 23, "SO2": 5, "H2O": 3, "Ar": 3},
+    "temperate_terrestrial": {"N2": 76, "O2": 20, "Ar": 2, "CO2": 1, "H2O": 1},
+    "oceanic_super_earth": {"N2": 72, "O2": 13, "CO2": 8, "H2O": 5, "Ar": 2},
+    "cold_super_earth": {"N2": 64, "CO2": 24, "O2": 7, "Ar": 3, "CH4": 2},
+    "gas_giant": {"H2": 86, "He": 13, "CH4": 0.7, "NH3": 0.2, "Traces": 0.1},
+    "ice_giant": {"H2": 80, "He": 17, "CH4": 2.0, "NH3": 0.5, "H2S": 0.5},
+}
+
+PRESSURE_BASE_COLUMNS: dict[str, float] = {
+    "volcanic": 0.42,
+    "hot_super_earth": 1.35,
+    "temperate_terrestrial": 1.00,
+    "oceanic_super_earth": 1.55,
+    "cold_super_earth": 1.75,
+}
+
+GREENHOUSE_SCALES: dict[str, float] = {
+    "volcanic": 78.0,
+    "hot_super_earth": 70.0,
+    "temperate_terrestrial": 46.0,
+    "oceanic_super_earth": 40.0,
+    "cold_super_earth": 34.0,
+}
+
+LOCKED_TEMP_AMPLITUDES: dict[str, float] = {
+    "volcanic": 520.0,
+    "hot_super_earth": 230.0,
+    "temperate_terrestrial": 95.0,
+    "oceanic_super_earth": 78.0,
+    "cold_super_earth": 135.0,
+    "gas_giant": 72.0,
+    "ice_giant": 58.0,
+}
+
+FREE_TEMP_AMPLITUDES: dict[str, float] = {
+    "volcanic": 210.0,
+    "hot_super_earth": 110.0,
+    "temperate_terrestrial": 42.0,
+    "oceanic_super_earth": 35.0,
+    "cold_super_earth": 66.0,
+    "gas_giant": 58.0,
+    "ice_giant": 46.0,
+}
+
+
+@dataclass(frozen=True)
+class StarSamplers:
+    """Per-class star property samplers built from ``STAR_MODELS``/``AGE_RANGE_GYR``."""
+
+    temperature: UniformSampler
+    luminosity: LogUniformSampler
+    mass: UniformSampler
+    age: UniformSampler
+
+
+@dataclass(frozen=True)
+class PlanetSamplers:
+    """Per-profile bulk property samplers built from ``PLANET_PROFILES``."""
+
+    mass: UniformSampler
+    radius: UniformSampler
+    albedo: UniformSampler
+
+
+STAR_CLASS_SAMPLER: CategoricalSampler[str] = CategoricalSampler(STAR_WEIGHTS)
+
+STAR_SAMPLERS: dict[str, StarSamplers] = {
+    star_class: StarSamplers(
+        temperature=UniformSampler(*model["temperature"]),
+        luminosity=LogUniformSampler(*model["luminosity"]),
+        mass=UniformSampler(*model["mass"]),
+        age=UniformSampler(*AGE_RANGE_GYR[star_class]),
+    )
+    for star_class, model in STAR_MODELS.items()
+}
+
+PLANET_SAMPLERS: dict[str, PlanetSamplers] = {
+    key: PlanetSamplers(
+        mass=UniformSampler(*profile.mass_range),
+        radius=UniformSampler(*profile.radius_range),
+        albedo=UniformSampler(*profile.albedo_range),
+    )
+    for key, profile in PLANET_PROFILES.items()
+}
+
+ENGINES = ("python", "numpy")
+NUMPY_BATCH_SYSTEMS = 4096
+SEEDED_CHUNK_SYSTEMS = 256
+VALIDATION_CHUNK_SYSTEMS = 512
+
+_SYSTEMS_PLACEHOLDERS = {"pretty": '"systems": []', "compact": '"systems":[]'}
+
 
 def weighted_choice(rng: random.Random, weights: dict[str, float]) -> str:
-    items = list(weights.items())
-    total = sum(w for _, w in items)
-    value = rng.uniform(0, total)
-    running = 0.0
-    for key, weight in items:
-        running += weight
-        if value <= running:
-            return key
-    return items[-1][0]
+    """One-off weighted draw; reuse a :class:`CategoricalSampler` for fixed weights."""
+    return CategoricalSampler(weights).sample(rng)
 
 
 def log_uniform(rng: random.Random, low: float, high: float) -> float:
-    return math.exp(rng.uniform(math.log(low), math.log(high)))
+    return LogUniformSampler(low, high).sample(rng)
 
 
 def slugify(name: str) -> str:
@@ -152,16 +254,7 @@ def jitter_mix(rng: random.Random, base: dict[str, float], jitter: float = 0.18)
 
 
 def atmosphere_for_type(rng: random.Random, profile_key: str) -> dict[str, float]:
-    bases: dict[str, dict[str, float]] = {
-        "volcanic": {"CO2": 58, "SO2": 17, "N2": 14, "CO": 8, "Ar": 3},
-        "hot_super_earth": {"CO2": 66, "N2": 23, "SO2": 5, "H2O": 3, "Ar": 3},
-        "temperate_terrestrial": {"N2": 76, "O2": 20, "Ar": 2, "CO2": 1, "H2O": 1},
-        "oceanic_super_earth": {"N2": 72, "O2": 13, "CO2": 8, "H2O": 5, "Ar": 2},
-        "cold_super_earth": {"N2": 64, "CO2": 24, "O2": 7, "Ar": 3, "CH4": 2},
-        "gas_giant": {"H2": 86, "He": 13, "CH4": 0.7, "NH3": 0.2, "Traces": 0.1},
-        "ice_giant": {"H2": 80, "He": 17, "CH4": 2.0, "NH3": 0.5, "H2S": 0.5},
-    }
-    return jitter_mix(rng, bases[profile_key], jitter=0.12 if "giant" in profile_key else 0.20)
+    return jitter_mix(rng, ATMOSPHERE_BASES[profile_key], jitter=0.12 if "giant" in profile_key else 0.20)
 
 
 def infer_profile_key(planet_type: str) -> str | None:
@@ -207,13 +300,7 @@ def estimate_surface_pressure_bar(
     if "giant" in profile_key:
         return 1.0
 
-    base_column = {
-        "volcanic": 0.42,
-        "hot_super_earth": 1.35,
-        "temperate_terrestrial": 1.00,
-        "oceanic_super_earth": 1.55,
-        "cold_super_earth": 1.75,
-    }[profile_key]
+    base_column = PRESSURE_BASE_COLUMNS[profile_key]
     volatile_fraction = (
         atmosphere.get("N2", 0.0)
         + atmosphere.get("CO2", 0.0)
@@ -244,13 +331,7 @@ def mean_surface_temperature_k(
         internal_heat = 9.0 + (10.0 * min(2.0, gravity_g))
         return teq_k + internal_heat
 
-    greenhouse_scale = {
-        "volcanic": 78.0,
-        "hot_super_earth": 70.0,
-        "temperate_terrestrial": 46.0,
-        "oceanic_super_earth": 40.0,
-        "cold_super_earth": 34.0,
-    }[profile_key]
+    greenhouse_scale = GREENHOUSE_SCALES[profile_key]
     broadening = 4.0 * math.log1p(max(0.01, atmosphere.get("N2", 0.0) / 30.0))
     delta = greenhouse_scale * math.log1p(max(0.01, pressure_bar)) * (0.22 + greenhouse)
     lock_offset = 6.0 if tidally_locked else 0.0
@@ -409,26 +490,10 @@ def profile_temp_range(
     transport = max(0.25, min(1.25, 0.55 + 0.22 * math.log1p(max(0.01, pressure_bar)) + 0.15 * water_fraction + 0.10 * n2_fraction))
 
     if tidally_locked:
-        base_amp = {
-            "volcanic": 520.0,
-            "hot_super_earth": 230.0,
-            "temperate_terrestrial": 95.0,
-            "oceanic_super_earth": 78.0,
-            "cold_super_earth": 135.0,
-            "gas_giant": 72.0,
-            "ice_giant": 58.0,
-        }[profile_key]
+        base_amp = LOCKED_TEMP_AMPLITUDES[profile_key]
         amplitude = base_amp * (1.18 - 0.55 * transport)
     else:
-        base_amp = {
-            "volcanic": 210.0,
-            "hot_super_earth": 110.0,
-            "temperate_terrestrial": 42.0,
-            "oceanic_super_earth": 35.0,
-            "cold_super_earth": 66.0,
-            "gas_giant": 58.0,
-            "ice_giant": 46.0,
-        }[profile_key]
+        base_amp = FREE_TEMP_AMPLITUDES[profile_key]
         tilt_factor = 0.85 + (axial_tilt_deg / 55.0)
         amplitude = base_amp * tilt_factor * (1.10 - 0.35 * transport)
 
@@ -452,11 +517,11 @@ def generate_star(
     rng: random.Random,
     star_class: str,
 ) -> dict[str, Any]:
-    model = STAR_MODELS[star_class]
-    temperature = round(rng.uniform(*model["temperature"]))
-    luminosity = log_uniform(rng, *model["luminosity"])
-    mass = rng.uniform(*model["mass"])
-    age = rng.uniform(*AGE_RANGE_GYR[star_class])
+    samplers = STAR_SAMPLERS[star_class]
+    temperature = round(samplers.temperature.sample(rng))
+    luminosity = samplers.luminosity.sample(rng)
+    mass = samplers.mass.sample(rng)
+    age = samplers.age.sample(rng)
 
     hz_inner = 0.95 * math.sqrt(luminosity)
     hz_outer = 1.67 * math.sqrt(luminosity)
@@ -475,11 +540,10 @@ def generate_star(
     cls_with_subtype = f"{star_class}{rng.randint(0, 8)}V"
     mult_text = multiplicity
     if multiplicity == "Binary":
-        companion = weighted_choice(rng, STAR_WEIGHTS)
+        companion = STAR_CLASS_SAMPLER.sample(rng)
         mult_text = f"Binary ({companion}{rng.randint(0, 8)}V at {round(rng.uniform(15, 90), 1)} AU)"
     elif multiplicity == "Trinary":
-        c1 = weighted_choice(rng, STAR_WEIGHTS)
-        c2 = weighted_choice(rng, STAR_WEIGHTS)
+        c1, c2 = STAR_CLASS_SAMPLER.draw(rng, 2)
         mult_text = f"Trinary ({c1}{rng.randint(0, 8)}V + {c2}{rng.randint(0, 8)}V pair)"
 
     return {
@@ -507,88 +571,106 @@ def generate_planets(
     star_mass = star["m"]
     lum = star["lum"]
 
-    if star_class == "M":
-        start = rng.uniform(0.03, 0.08)
-    elif star_class == "K":
-        start = rng.uniform(0.05, 0.14)
-    else:
-        start = rng.uniform(0.10, 0.35)
+    with stage("planets.orbits"):
+        if star_class == "M":
+            start = rng.uniform(0.03, 0.08)
+        elif star_class == "K":
+            start = rng.uniform(0.05, 0.14)
+        else:
+            start = rng.uniform(0.10, 0.35)
 
-    distances = [start]
-    for _ in range(planet_count - 1):
-        distances.append(distances[-1] * rng.uniform(1.42, 2.05))
+        distances = [start]
+        for _ in range(planet_count - 1):
+            distances.append(distances[-1] * rng.uniform(1.42, 2.05))
 
-    if distances[-1] < frost * 1.10:
-        scale = (frost * 1.20) / distances[-1]
-        distances = [d * scale for d in distances]
+        if distances[-1] < frost * 1.10:
+            scale = (frost * 1.20) / distances[-1]
+            distances = [d * scale for d in distances]
 
     planets: list[dict[str, Any]] = []
     for index, distance in enumerate(distances):
-        profile_key = classify_planet_regime(rng, distance, hz_inner, hz_outer, frost)
-        profile = PLANET_PROFILES[profile_key]
-
-        mass = rng.uniform(*profile.mass_range)
-        radius = rng.uniform(*profile.radius_range)
-        gravity = gravity_from_mass_radius(mass, radius, profile.unit)
-        albedo = rng.uniform(*profile.albedo_range)
-        orbital_days = orbital_period_days(distance, star_mass)
-        tidally_locked = (star_class in {"M", "K"} and distance < hz_inner * 0.85) or (orbital_days < 20 and profile.unit == "Earth")
-        if tidally_locked:
-            rotation_days = orbital_days
-        elif "giant" in profile_key:
-            rotation_days = rng.uniform(0.35, 0.90)
-        else:
-            rotation_days = rng.uniform(0.60, 2.80)
+        with stage("planets.bulk"):
+            profile_key = classify_planet_regime(rng, distance, hz_inner, hz_outer, frost)
+            profile = PLANET_PROFILES[profile_key]
+
+            samplers = PLANET_SAMPLERS[profile_key]
+            mass = samplers.mass.sample(rng)
+            radius = samplers.radius.sample(rng)
+            gravity = gravity_from_mass_radius(mass, radius, profile.unit)
+            albedo = samplers.albedo.sample(rng)
+            orbital_days = orbital_period_days(distance, star_mass)
+            tidally_locked = (star_class in {"M", "K"} and distance < hz_inner * 0.85) or (orbital_days < 20 and profile.unit == "Earth")
+            if tidally_locked:
+                rotation_days = orbital_days
+            elif "giant" in profile_key:
+                rotation_days = rng.uniform(0.35, 0.90)
+            else:
+                rotation_days = rng.uniform(0.60, 2.80)
 
-        if tidally_locked:
-            tilt = rng.uniform(0.0, 6.0)
-        elif "giant" in profile_key:
-            tilt = rng.uniform(0.0, 32.0)
-        else:
-            tilt = rng.uniform(2.0, 35.0)
+            if tidally_locked:
+                tilt = rng.uniform(0.0, 6.0)
+            elif "giant" in profile_key:
+                tilt = rng.uniform(0.0, 32.0)
+            else:
+                tilt = rng.uniform(2.0, 35.0)
+
+        with stage("planets.atmosphere"):
+            atmosphere = atmosphere_for_type(rng, profile_key)
+        with stage("planets.climate"):
+            magnetic = "Yes" if rng.random() <= profile.magnetic_prob else "No"
+            teq = equilibrium_temperature_k(lum, distance, albedo)
+            if profile.unit == "Earth":
+                pressure_model = estimate_surface_pressure_bar(
+                    profile_key=profile_key,
+                    gravity_g=gravity,
+                    mass_value=mass,
+                    radius_value=radius,
+                    atmosphere=atmosphere,
+                    teq_k=teq,
+                )
+                pressure = max(profile.pressure_range[0], min(profile.pressure_range[1], pressure_model))
+            else:
+                pressure = 1.0
 
-        atmosphere = atmosphere_for_type(rng, profile_key)
-        magnetic = "Yes" if rng.random() <= profile.magnetic_prob else "No"
-        teq = equilibrium_temperature_k(lum, distance, albedo)
-        if profile.unit == "Earth":
-            pressure_model = estimate_surface_pressure_bar(
+            mean_temp = mean_surface_temperature_k(
                 profile_key=profile_key,
+                teq_k=teq,
+                pressure_bar=pressure,
+                atmosphere=atmosphere,
                 gravity_g=gravity,
-                mass_value=mass,
-                radius_value=radius,
+                tidally_locked=tidally_locked,
+            )
+            t_min, t_max = profile_temp_range(
+                profile_key,
+                mean_temp_k=mean_temp,
+                pressure_bar=pressure,
+                tidally_locked=tidally_locked,
+                axial_tilt_deg=tilt,
+                atmosphere=atmosphere,
+            )
+            hab = habitability_score(
+                profile_key=profile_key,
+                mean_temp_k=(t_min + t_max) / 2,
+                pressure_bar=pressure,
+                magnetic_field=magnetic,
+                semi_major_au=distance,
+                hz_inner_au=hz_inner,
+                hz_outer_au=hz_outer,
                 atmosphere=atmosphere,
-                teq_k=teq,
             )
-            pressure = max(profile.pressure_range[0], min(profile.pressure_range[1], pressure_model))
-        else:
-            pressure = 1.0
-
-        mean_temp = mean_surface_temperature_k(
-            profile_key=profile_key,
-            teq_k=teq,
-            pressure_bar=pressure,
-            atmosphere=atmosphere,
-            gravity_g=gravity,
-            tidally_locked=tidally_locked,
-        )
-        t_min, t_max = profile_temp_range(
-            profile_key,
-            mean_temp_k=mean_temp,
-            pressure_bar=pressure,
-            tidally_locked=tidally_locked,
-            axial_tilt_deg=tilt,
-            atmosphere=atmosphere,
-        )
-        hab = habitability_score(
-            profile_key=profile_key,
-            mean_temp_k=(t_min + t_max) / 2,
-            pressure_bar=pressure,
-            magnetic_field=magnetic,
-            semi_major_au=distance,
-            hz_inner_au=hz_inner,
-            hz_outer_au=hz_outer,
-            atmosphere=atmosphere,
-        )
+
+        with stage("planets.text"):
+            visual = build_visual_description(profile_key, magnetic, tidally_locked)
+            science = build_science_explanation(
+                profile_key,
+                semi_major_au=distance,
+                hz_inner_au=hz_inner,
+                hz_outer_au=hz_outer,
+                pressure_bar=pressure if profile.unit == "Earth" else 1.0,
+                gravity_g=gravity,
+                tidally_locked=tidally_locked,
+            )
+            exploration = exploration_status(hab, profile_key)
 
         name = name_pool[index % len(name_pool)]
         planet = {
@@ -610,21 +692,14 @@ def generate_planets(
             "mag": magnetic,
             "alb": round(albedo, 2),
             "hab": hab,
-            "v": build_visual_description(profile_key, magnetic, tidally_locked),
-            "sci": build_science_explanation(
-                profile_key,
-                semi_major_au=distance,
-                hz_inner_au=hz_inner,
-                hz_outer_au=hz_outer,
-                pressure_bar=pressure if profile.unit == "Earth" else 1.0,
-                gravity_g=gravity,
-                tidally_locked=tidally_locked,
-            ),
-            "x": exploration_status(hab, profile_key),
+            "v": visual,
+            "sci": science,
+            "x": exploration,
             "locked": tidally_locked,
         }
         planets.append(planet)
 
+    increment("planets", len(planets))
     return planets
 
 
@@ -664,53 +739,295 @@ def build_sector_list(rng: random.Random, sector_count: int) -> list[dict[str, A
     return sectors
 
 
-def generate_galaxy(
-    *,
-    seed: int | None = None,
-    sector_count: int = 6,
-    system_count: int = 3,
-    planets_per_system: int = 6,
+def planet_name_pool(index: int, planets_per_system: int) -> list[str]:
+    start_idx = (index * planets_per_system) % len(PLANET_NAME_PARTS)
+    return [
+        PLANET_NAME_PARTS[(start_idx + j) % len(PLANET_NAME_PARTS)]
+        for j in range(planets_per_system)
+    ]
+
+
+def _fill_planets_numpy(np_rng: Any, systems: list[dict[str, Any]], offset: int, planets_per_system: int) -> None:
+    from galaxy.data_vectorized import generate_planets_batch
+
+    planets = generate_planets_batch(
+        np_rng,
+        [system["star"] for system in systems],
+        planets_per_system,
+        [planet_name_pool(offset + row, planets_per_system) for row in range(len(systems))],
+    )
+    for system, system_planets in zip(systems, planets):
+        system["p"] = system_planets
+
+
+def derive_seed(seed: int, *path: int | str) -> int:
+    """Derive an independent 64-bit seed for a named sub-stream of ``seed``."""
+    key = ":".join(str(part) for part in (seed, *path)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+
+
+def seeded_star_class(seed: int, index: int) -> str:
+    """Star class of system ``index`` in per-system seed mode.
+
+    Systems are paired (2k, 2k + 1); one member of every pair, and both members
+    of the first pair, are M dwarfs while the other draws from
+    ``STAR_WEIGHTS``. That keeps the M-star majority rule for any system count
+    without looking at other systems.
+    """
+    pair = index // 2
+    forced = pair == 0 or index % 2 == derive_seed(seed, "pair", pair) % 2
+    if forced:
+        return "M"
+    return STAR_CLASS_SAMPLER.sample(random.Random(derive_seed(seed, "class", index)))
+
+
+def _build_system(
+    rng: random.Random,
+    index: int,
+    star_class: str,
+    sector_name: str,
+    planets_per_system: int,
+    engine: str,
 ) -> dict[str, Any]:
-    """Generate galaxy data with deterministic output for a given seed."""
-    rng = random.Random(seed)
+    base_name = SYSTEM_NAME_PARTS[index % len(SYSTEM_NAME_PARTS)]
+    code = rng.randint(10, 99)
+    system_name = f"{base_name}-{code}"
+    with stage("system.star"):
+        star = generate_star(rng, star_class)
 
-    sectors = build_sector_list(rng, sector_count)
+    planet_names = planet_name_pool(index, planets_per_system)
+    planets = generate_planets(rng, star, planets_per_system, planet_names) if engine == "python" else []
+    with stage("system.timeline"):
+        timeline = system_timeline(star["age"])
 
+    return {
+        "id": slugify(system_name),
+        "n": system_name,
+        "sector": sector_name,
+        "star": star,
+        "tl": timeline,
+        "p": planets,
+    }
+
+
+def _generate_seeded_chunk(
+    seed: int,
+    start: int,
+    stop: int,
+    sector_names: list[str],
+    planets_per_system: int,
+    engine: str,
+) -> list[dict[str, Any]]:
+    """Generate systems ``start..stop`` from their own derived seed streams.
+
+    Chunks are aligned to ``SEEDED_CHUNK_SYSTEMS`` so the NumPy engine always
+    draws full-size batches; the output of a system never depends on how many
+    systems or workers there are.
+    """
+    systems = [
+        _build_system(
+            random.Random(derive_seed(seed, "system", index)),
+            index,
+            seeded_star_class(seed, index),
+            sector_names[index % len(sector_names)],
+            planets_per_system,
+            engine,
+        )
+        for index in range(start, stop)
+    ]
+    if engine == "numpy" and systems:
+        import numpy as np
+
+        from galaxy.data_vectorized import generate_planets_batch
+
+        chunk = start // SEEDED_CHUNK_SYSTEMS
+        stars = [system["star"] for system in systems]
+        padding = SEEDED_CHUNK_SYSTEMS - len(stars)
+        with stage("planets.numpy_batch"):
+            planets = generate_planets_batch(
+                np.random.default_rng(derive_seed(seed, "planets", chunk)),
+                stars + [stars[-1]] * padding,
+                planets_per_system,
+                [planet_name_pool(index, planets_per_system) for index in range(start, stop)] + [[""]] * padding,
+            )
+        for system, system_planets in zip(systems, planets):
+            system["p"] = system_planets
+    return systems
+
+
+def _iter_seeded_systems(
+    seed: int,
+    sector_names: list[str],
+    system_count: int,
+    planets_per_system: int,
+    engine: str,
+    workers: int,
+    cache: GenerationCache | None = None,
+) -> Iterator[dict[str, Any]]:
+    args = [
+        (seed, start, min(start + SEEDED_CHUNK_SYSTEMS, system_count), sector_names, planets_per_system, engine)
+        for start in range(0, system_count, SEEDED_CHUNK_SYSTEMS)
+    ]
+    keys = [cache.key(*chunk_args) for chunk_args in args] if cache is not None else [None] * len(args)
+
+    def cached(key: str | None) -> list[dict[str, Any]] | None:
+        return cache.load(key) if cache is not None else None
+
+    def finished(key: str | None, systems: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if cache is not None:
+            cache.store(key, systems)
+        return systems
+
+    if workers <= 1 or len(args) <= 1:
+        for chunk_args, key in zip(args, keys):
+            systems = cached(key)
+            yield from systems if systems is not None else finished(key, _generate_seeded_chunk(*chunk_args))
+    else:
+        # Keep a bounded window of chunks in flight so streaming consumers do
+        # not buffer the whole galaxy when they are slower than the pool.
+        # Cache hits are resolved here and never reach the pool.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+
+            def submit(chunk_args: tuple[Any, ...], key: str | None) -> tuple[str | None, Any]:
+                systems = cached(key)
+                return key, systems if systems is not None else pool.submit(_generate_seeded_chunk, *chunk_args)
+
+            queued = zip(args, keys)
+            pending: deque[tuple[str | None, Any]] = deque(
+                submit(*item) for item in itertools.islice(queued, workers * 2)
+            )
+            while pending:
+                key, result = pending.popleft()
+                systems = finished(key, result.result()) if isinstance(result, Future) else result
+                next_item = next(queued, None)
+                if next_item is not None:
+                    pending.append(submit(*next_item))
+                yield from systems
+    if cache is not None:
+        cache.evict()
+
+
+def _draw_star_classes(rng: random.Random, system_count: int) -> list[str]:
+    """Spectral classes of a single-stream galaxy, drawn before any system is built."""
     required_m_stars = system_count // 2 + 1
     star_classes = ["M"] * required_m_stars
-    while len(star_classes) < system_count:
-        star_classes.append(weighted_choice(rng, STAR_WEIGHTS))
+    star_classes.extend(STAR_CLASS_SAMPLER.draw(rng, system_count - required_m_stars))
     rng.shuffle(star_classes)
+    return star_classes
 
-    systems: list[dict[str, Any]] = []
-    for i in range(system_count):
-        base_name = SYSTEM_NAME_PARTS[i % len(SYSTEM_NAME_PARTS)]
-        code = rng.randint(10, 99)
-        system_name = f"{base_name}-{code}"
-        star_class = star_classes[i]
-        star = generate_star(rng, star_class)
 
-        start_idx = (i * planets_per_system) % len(PLANET_NAME_PARTS)
-        planet_names = [
-            PLANET_NAME_PARTS[(start_idx + j) % len(PLANET_NAME_PARTS)]
-            for j in range(planets_per_system)
+def _iter_single_stream_systems(
+    rng: random.Random,
+    sector_names: list[str],
+    system_count: int,
+    planets_per_system: int,
+    engine: str,
+) -> Iterator[dict[str, Any]]:
+    star_classes = _draw_star_classes(rng, system_count)
+
+    if engine == "python":
+        for i in range(system_count):
+            yield _build_system(rng, i, star_classes[i], sector_names[i % len(sector_names)], planets_per_system, engine)
+        return
+
+    import numpy as np
+
+    np_rng = np.random.default_rng(rng.getrandbits(64))
+    for offset in range(0, system_count, NUMPY_BATCH_SYSTEMS):
+        batch = [
+            _build_system(rng, i, star_classes[i], sector_names[i % len(sector_names)], planets_per_system, engine)
+            for i in range(offset, min(offset + NUMPY_BATCH_SYSTEMS, system_count))
         ]
-        planets = generate_planets(rng, star, planets_per_system, planet_names)
-
-        sector = sectors[i % len(sectors)]
-        sector["s"].append(system_name)
-
-        systems.append(
-            {
-                "id": slugify(system_name),
-                "n": system_name,
-                "sector": sector["n"],
-                "star": star,
-                "tl": system_timeline(star["age"]),
-                "p": planets,
-            }
-        )
+        with stage("planets.numpy_batch"):
+            _fill_planets_numpy(np_rng, batch, offset, planets_per_system)
+        yield from batch
+
+
+def _plan_galaxy(
+    seed: int | None,
+    sector_count: int,
+    system_count: int,
+    planets_per_system: int,
+    engine: str,
+    workers: int | None,
+    cache: GenerationCache | None = None,
+) -> tuple[int | None, list[dict[str, Any]], Iterator[dict[str, Any]]]:
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {', '.join(ENGINES)}.")
+    if engine == "numpy":
+        from galaxy.data_vectorized import numpy_available
+
+        if not numpy_available():
+            engine = "python"
+    if cache is not None and workers is None:
+        raise ValueError("A generation cache needs per-system seed streams; pass workers=N.")
+    if workers is not None and seed is None:
+        seed = random.SystemRandom().randrange(2 ** 63)
+
+    rng = random.Random(seed)
+    with stage("generate.sectors"):
+        sectors = build_sector_list(rng, sector_count)
+    sector_names = [sector["n"] for sector in sectors]
+    if workers is not None:
+        systems = _iter_seeded_systems(seed, sector_names, system_count, planets_per_system, engine, workers, cache)
+    else:
+        systems = _iter_single_stream_systems(rng, sector_names, system_count, planets_per_system, engine)
+    return seed, sectors, systems
 
+
+def iter_systems(
+    *,
+    seed: int | None = None,
+    sector_count: int = 6,
+    system_count: int = 3,
+    planets_per_system: int = 6,
+    engine: str = "python",
+    workers: int | None = None,
+    cache: GenerationCache | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the systems of ``generate_galaxy`` one at a time, in order."""
+    _, _, systems = _plan_galaxy(seed, sector_count, system_count, planets_per_system, engine, workers, cache)
+    return systems
+
+
+def generate_galaxy(
+    *,
+    seed: int | None = None,
+    sector_count: int = 6,
+    system_count: int = 3,
+    planets_per_system: int = 6,
+    engine: str = "python",
+    workers: int | None = None,
+    cache: GenerationCache | None = None,
+    records: bool = False,
+) -> dict[str, Any]:
+    """Generate galaxy data with deterministic output for a given seed.
+
+    ``engine="numpy"`` computes planets in columnar batches through
+    :mod:`galaxy.data_vectorized`; it falls back to the scalar path when NumPy
+    is not installed.
+
+    ``workers=N`` switches to per-system seed streams derived from ``seed`` and
+    fans systems out over ``N`` processes. The result is identical for every
+    worker count (but differs from the single-stream ``workers=None`` layout).
+    In that mode a :class:`galaxy.data_cache.GenerationCache` can supply
+    unchanged chunks of systems instead of regenerating them.
+
+    ``records=True`` stores systems as compact :class:`galaxy.data_model.System`
+    records instead of dicts; the exporters and :func:`validate_galaxy` accept
+    either.
+    """
+    with stage("generate.total"):
+        seed, sectors, systems_iter = _plan_galaxy(seed, sector_count, system_count, planets_per_system, engine, workers, cache)
+        systems: list[Any] = []
+        for i, system in enumerate(systems_iter):
+            sectors[i % len(sectors)]["s"].append(system["n"])
+            systems.append(System.from_dict(system) if records else system)
+        increment("systems", len(systems))
+    return _galaxy_document(sectors, systems, seed)
+
+
+def _galaxy_document(sectors: list[dict[str, Any]], systems: list[Any], seed: int | None) -> dict[str, Any]:
     return {
         "name": "Sanguis Noctis",
         "sectors": sectors,
@@ -724,175 +1041,473 @@ def generate_galaxy(
     }
 
 
-def validate_galaxy(data: dict[str, Any]) -> list[str]:
-    """Validate astrophysics consistency and schema-level constraints."""
-    issues: list[str] = []
+def _sector_issues(sectors: list[Any]) -> tuple[list[str], set[Any]]:
+    sector_names = {s.get("n") for s in sectors if isinstance(s, dict)}
+    issues = [] if len(sector_names) == len(sectors) else ["Sector names must be unique."]
+    return issues, sector_names
 
-    sectors = data.get("sectors")
-    systems = data.get("systems")
-    if not isinstance(sectors, list) or not isinstance(systems, list):
-        return ["Missing required top-level lists: sectors/systems"]
 
-    sector_names = {s.get("n") for s in sectors if isinstance(s, dict)}
-    if len(sector_names) != len(sectors):
-        issues.append("Sector names must be unique.")
+def _population_issues(m_count: int, system_count: int) -> list[str]:
+    if system_count and m_count / system_count <= 0.5:
+        return ["Generated stellar population violates rule: majority of stars should be M-type."]
+    return []
+
+
+def _unknown_sector_issue(system: dict[str, Any]) -> str:
+    return f"{system.get('n', '<unknown>')}: references unknown sector '{system.get('sector')}'."
 
-    m_count = 0
-    for system in systems:
-        name = system.get("n", "<unknown>")
-        star = system.get("star", {})
-        planets = system.get("p", [])
-        if system.get("sector") not in sector_names:
-            issues.append(f"{name}: references unknown sector '{system.get('sector')}'.")
-
-        if not isinstance(star, dict) or not isinstance(planets, list):
-            issues.append(f"{name}: invalid star/planet payload.")
-            continue
 
-        cls = str(star.get("cls", ""))
-        if cls.startswith("M"):
-            m_count += 1
+def validate_system(system: dict[str, Any] | System, sector_names: set[Any] | None) -> tuple[list[str], bool]:
+    """Validate one system; returns its issues and whether it counts as an M star.
 
+    ``sector_names=None`` skips the unknown-sector check (for callers that
+    resolve sector references separately).
+    """
+    system = as_system_dict(system)
+    issues: list[str] = []
+    is_m = False
+    name = system.get("n", "<unknown>")
+    star = system.get("star", {})
+    planets = system.get("p", [])
+    if sector_names is not None and system.get("sector") not in sector_names:
+        issues.append(_unknown_sector_issue(system))
+
+    if not isinstance(star, dict) or not isinstance(planets, list):
+        issues.append(f"{name}: invalid star/planet payload.")
+        return issues, is_m
+
+    cls = str(star.get("cls", ""))
+    is_m = cls.startswith("M")
+
+    try:
+        mass = float(star["m"])
+        lum = float(star["lum"])
+        hz_inner, hz_outer = float(star["hz"][0]), float(star["hz"][1])
+        frost = float(star["frost"])
+    except Exception:
+        issues.append(f"{name}: star block is missing numeric fields.")
+        return issues, is_m
+
+    expected_hz_inner = 0.95 * math.sqrt(lum)
+    expected_hz_outer = 1.67 * math.sqrt(lum)
+    expected_frost = 4.85 * math.sqrt(lum)
+    if abs(expected_hz_inner - hz_inner) / max(expected_hz_inner, 1e-6) > 0.25:
+        issues.append(f"{name}: habitable-zone inner boundary is inconsistent with luminosity.")
+    if abs(expected_hz_outer - hz_outer) / max(expected_hz_outer, 1e-6) > 0.25:
+        issues.append(f"{name}: habitable-zone outer boundary is inconsistent with luminosity.")
+    if abs(expected_frost - frost) / max(expected_frost, 1e-6) > 0.30:
+        issues.append(f"{name}: frost line is inconsistent with luminosity.")
+
+    previous_distance = -1.0
+    for idx, planet in enumerate(planets):
+        pname = planet.get("n", f"{name}-planet-{idx}")
         try:
-            mass = float(star["m"])
-            lum = float(star["lum"])
-            hz_inner, hz_outer = float(star["hz"][0]), float(star["hz"][1])
-            frost = float(star["frost"])
+            distance = float(planet["a"])
+            period = float(planet["op"])
+            mass_value = float(planet["m"][0])
+            radius_value = float(planet["rad"][0])
+            unit = str(planet["m"][1])
+            gravity = float(planet["g"])
+            pressure = float(planet["pb"])
+            t_low, t_high = int(planet["temp"][0]), int(planet["temp"][1])
+            albedo = float(planet["alb"])
+            tilt = float(planet.get("tilt", 0.0))
+            planet_type = str(planet.get("t", ""))
         except Exception:
-            issues.append(f"{name}: star block is missing numeric fields.")
+            issues.append(f"{name}/{pname}: missing numeric fields.")
             continue
 
-        expected_hz_inner = 0.95 * math.sqrt(lum)
-        expected_hz_outer = 1.67 * math.sqrt(lum)
-        expected_frost = 4.85 * math.sqrt(lum)
-        if abs(expected_hz_inner - hz_inner) / max(expected_hz_inner, 1e-6) > 0.25:
-            issues.append(f"{name}: habitable-zone inner boundary is inconsistent with luminosity.")
-        if abs(expected_hz_outer - hz_outer) / max(expected_hz_outer, 1e-6) > 0.25:
-            issues.append(f"{name}: habitable-zone outer boundary is inconsistent with luminosity.")
-        if abs(expected_frost - frost) / max(expected_frost, 1e-6) > 0.30:
-            issues.append(f"{name}: frost line is inconsistent with luminosity.")
-
-        previous_distance = -1.0
-        for idx, planet in enumerate(planets):
-            pname = planet.get("n", f"{name}-planet-{idx}")
+        if distance <= previous_distance:
+            issues.append(f"{name}/{pname}: orbital distances must increase outward.")
+        previous_distance = distance
+
+        expected_period = orbital_period_days(distance, mass)
+        period_error = abs(expected_period - period) / max(expected_period, 1e-6)
+        if period_error > 0.18:
+            issues.append(f"{name}/{pname}: orbital period deviates from Kepler by >18%.")
+
+        expected_g = gravity_from_mass_radius(mass_value, radius_value, unit)
+        g_error = abs(expected_g - gravity) / max(expected_g, 1e-6)
+        if g_error > 0.15:
+            issues.append(f"{name}/{pname}: gravity mismatch for mass/radius.")
+
+        atm = planet.get("atm", {})
+        if not isinstance(atm, dict) or len(atm) == 0:
+            issues.append(f"{name}/{pname}: atmosphere payload missing.")
+        else:
+            atm_total = sum(float(v) for v in atm.values())
+            if abs(atm_total - 100.0) > 1.2:
+                issues.append(f"{name}/{pname}: atmosphere percentages must sum to ~100.")
+
+        if pressure <= 0:
+            issues.append(f"{name}/{pname}: surface pressure must be positive.")
+        if t_low >= t_high:
+            issues.append(f"{name}/{pname}: temperature range is invalid.")
+
+        ptype = planet_type.lower()
+        if ("gas giant" in ptype or "ice giant" in ptype) and distance < frost * 0.95:
+            issues.append(f"{name}/{pname}: giant planet appears inside frost line.")
+
+        rot_days = planet.get("rot_days")
+        rotation_days: float | None = None
+        if rot_days is not None:
             try:
-                distance = float(planet["a"])
-                period = float(planet["op"])
-                mass_value = float(planet["m"][0])
-                radius_value = float(planet["rad"][0])
-                unit = str(planet["m"][1])
-                gravity = float(planet["g"])
-                pressure = float(planet["pb"])
-                t_low, t_high = int(planet["temp"][0]), int(planet["temp"][1])
-                albedo = float(planet["alb"])
-                tilt = float(planet.get("tilt", 0.0))
-                planet_type = str(planet.get("t", ""))
+                rotation_days = float(rot_days)
             except Exception:
-                issues.append(f"{name}/{pname}: missing numeric fields.")
-                continue
-
-            if distance <= previous_distance:
-                issues.append(f"{name}/{pname}: orbital distances must increase outward.")
-            previous_distance = distance
-
-            expected_period = orbital_period_days(distance, mass)
-            period_error = abs(expected_period - period) / max(expected_period, 1e-6)
-            if period_error > 0.18:
-                issues.append(f"{name}/{pname}: orbital period deviates from Kepler by >18%.")
-
-            expected_g = gravity_from_mass_radius(mass_value, radius_value, unit)
-            g_error = abs(expected_g - gravity) / max(expected_g, 1e-6)
-            if g_error > 0.15:
-                issues.append(f"{name}/{pname}: gravity mismatch for mass/radius.")
-
-            atm = planet.get("atm", {})
-            if not isinstance(atm, dict) or len(atm) == 0:
-                issues.append(f"{name}/{pname}: atmosphere payload missing.")
-            else:
-                atm_total = sum(float(v) for v in atm.values())
-                if abs(atm_total - 100.0) > 1.2:
-                    issues.append(f"{name}/{pname}: atmosphere percentages must sum to ~100.")
-
-            if pressure <= 0:
-                issues.append(f"{name}/{pname}: surface pressure must be positive.")
-            if t_low >= t_high:
-                issues.append(f"{name}/{pname}: temperature range is invalid.")
-
-            ptype = planet_type.lower()
-            if ("gas giant" in ptype or "ice giant" in ptype) and distance < frost * 0.95:
-                issues.append(f"{name}/{pname}: giant planet appears inside frost line.")
-
-            rot_days = planet.get("rot_days")
-            rotation_days: float | None = None
-            if rot_days is not None:
-                try:
-                    rotation_days = float(rot_days)
-                except Exception:
-                    issues.append(f"{name}/{pname}: invalid rot_days value.")
-            if rotation_days is not None and distance < hz_inner * 0.80 and cls.startswith(("M", "K")):
-                lock_error = abs(rotation_days - period) / max(period, 1e-6)
-                if lock_error > 0.30:
-                    issues.append(f"{name}/{pname}: close-in planet should be near tidal synchronization.")
-
-            profile_key = infer_profile_key(planet_type)
-            if profile_key and isinstance(atm, dict) and len(atm) > 0:
-                teq = equilibrium_temperature_k(luminosity_solar=lum, semi_major_au=distance, albedo=albedo)
-                tidally_locked = False
-                if rotation_days is not None:
-                    tidally_locked = abs(rotation_days - period) / max(period, 1e-6) <= 0.25
-                elif distance < hz_inner * 0.80 and cls.startswith(("M", "K")):
-                    tidally_locked = True
-
-                if profile_key not in {"gas_giant", "ice_giant"}:
-                    modeled_pressure = estimate_surface_pressure_bar(
-                        profile_key=profile_key,
-                        gravity_g=gravity,
-                        mass_value=mass_value,
-                        radius_value=radius_value,
-                        atmosphere=atm,
-                        teq_k=teq,
-                    )
-                    min_p, max_p = PLANET_PROFILES[profile_key].pressure_range
-                    modeled_pressure = max(min_p, min(max_p, modeled_pressure))
-                    pressure_error = abs(modeled_pressure - pressure) / max(modeled_pressure, 0.05)
-                    if pressure_error > 0.75:
-                        issues.append(f"{name}/{pname}: surface pressure inconsistent with gravity/volatile/thermal model.")
-
-                modeled_mean = mean_surface_temperature_k(
+                issues.append(f"{name}/{pname}: invalid rot_days value.")
+        if rotation_days is not None and distance < hz_inner * 0.80 and cls.startswith(("M", "K")):
+            lock_error = abs(rotation_days - period) / max(period, 1e-6)
+            if lock_error > 0.30:
+                issues.append(f"{name}/{pname}: close-in planet should be near tidal synchronization.")
+
+        profile_key = infer_profile_key(planet_type)
+        if profile_key and isinstance(atm, dict) and len(atm) > 0:
+            teq = equilibrium_temperature_k(luminosity_solar=lum, semi_major_au=distance, albedo=albedo)
+            tidally_locked = False
+            if rotation_days is not None:
+                tidally_locked = abs(rotation_days - period) / max(period, 1e-6) <= 0.25
+            elif distance < hz_inner * 0.80 and cls.startswith(("M", "K")):
+                tidally_locked = True
+
+            if profile_key not in {"gas_giant", "ice_giant"}:
+                modeled_pressure = estimate_surface_pressure_bar(
                     profile_key=profile_key,
-                    teq_k=teq,
-                    pressure_bar=pressure,
-                    atmosphere=atm,
                     gravity_g=gravity,
-                    tidally_locked=tidally_locked,
-                )
-                modeled_low, modeled_high = profile_temp_range(
-                    profile_key=profile_key,
-                    mean_temp_k=modeled_mean,
-                    pressure_bar=pressure,
-                    tidally_locked=tidally_locked,
-                    axial_tilt_deg=tilt,
+                    mass_value=mass_value,
+                    radius_value=radius_value,
                     atmosphere=atm,
+                    teq_k=teq,
                 )
-                observed_mean = (t_low + t_high) / 2.0
-                mean_error = abs(observed_mean - modeled_mean)
-                if mean_error > max(65.0, 0.45 * modeled_mean):
-                    issues.append(f"{name}/{pname}: temperature range inconsistent with irradiation/greenhouse model.")
+                min_p, max_p = PLANET_PROFILES[profile_key].pressure_range
+                modeled_pressure = max(min_p, min(max_p, modeled_pressure))
+                pressure_error = abs(modeled_pressure - pressure) / max(modeled_pressure, 0.05)
+                if pressure_error > 0.75:
+                    issues.append(f"{name}/{pname}: surface pressure inconsistent with gravity/volatile/thermal model.")
+
+            modeled_mean = mean_surface_temperature_k(
+                profile_key=profile_key,
+                teq_k=teq,
+                pressure_bar=pressure,
+                atmosphere=atm,
+                gravity_g=gravity,
+                tidally_locked=tidally_locked,
+            )
+            modeled_low, modeled_high = profile_temp_range(
+                profile_key=profile_key,
+                mean_temp_k=modeled_mean,
+                pressure_bar=pressure,
+                tidally_locked=tidally_locked,
+                axial_tilt_deg=tilt,
+                atmosphere=atm,
+            )
+            observed_mean = (t_low + t_high) / 2.0
+            mean_error = abs(observed_mean - modeled_mean)
+            if mean_error > max(65.0, 0.45 * modeled_mean):
+                issues.append(f"{name}/{pname}: temperature range inconsistent with irradiation/greenhouse model.")
+
+            modeled_span = max(1.0, modeled_high - modeled_low)
+            observed_span = max(1.0, t_high - t_low)
+            if observed_span > modeled_span * 2.4 or observed_span < modeled_span * 0.30:
+                issues.append(f"{name}/{pname}: temperature span inconsistent with circulation model.")
+
+    return issues, is_m
+
+
+def iter_validate_galaxy(sectors: list[Any], systems: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Yield validation issues progressively while walking ``systems`` once."""
+    with stage("validate.sectors"):
+        sector_issues, sector_names = _sector_issues(sectors)
+    yield from sector_issues
+
+    m_count = 0
+    system_count = 0
+    for system in systems:
+        with stage("validate.system"):
+            system_issues, is_m = validate_system(system, sector_names)
+        yield from system_issues
+        m_count += is_m
+        system_count += 1
 
-                modeled_span = max(1.0, modeled_high - modeled_low)
-                observed_span = max(1.0, t_high - t_low)
-                if observed_span > modeled_span * 2.4 or observed_span < modeled_span * 0.30:
-                    issues.append(f"{name}/{pname}: temperature span inconsistent with circulation model.")
+    yield from _population_issues(m_count, system_count)
 
-    if systems:
-        if m_count / len(systems) <= 0.5:
-            issues.append("Generated stellar population violates rule: majority of stars should be M-type.")
 
+def _validate_chunk(systems: list[dict[str, Any]], sector_names: set[Any], engine: str = "python") -> tuple[list[str], int]:
+    issues: list[str] = []
+    m_count = 0
+    if engine == "numpy":
+        from galaxy.data_vectorized import screen_systems
+
+        systems = [as_system_dict(system) for system in systems]
+        with stage("validate.numpy_screen"):
+            flagged, m_count = screen_systems(systems, sector_names)
+        increment("validate.rechecked", sum(flagged))
+        for system, suspect in zip(systems, flagged):
+            if suspect:
+                with stage("validate.system"):
+                    issues.extend(validate_system(system, sector_names)[0])
+        return issues, m_count
+
+    for system in systems:
+        with stage("validate.system"):
+            system_issues, is_m = validate_system(system, sector_names)
+        issues.extend(system_issues)
+        m_count += is_m
+    return issues, m_count
+
+
+def validate_galaxy(
+    data: dict[str, Any],
+    *,
+    workers: int | None = None,
+    engine: str = "python",
+    cache: ValidationCache | None = None,
+) -> list[str]:
+    """Validate astrophysics consistency and schema-level constraints.
+
+    ``workers=N`` validates chunks of systems on a process pool; issues are
+    merged in system order and the global rules run once at the end, so the
+    result matches the serial path exactly.
+
+    ``engine="numpy"`` screens chunks with the columnar kernel in
+    :mod:`galaxy.data_vectorized` and only runs the scalar checks on systems
+    it cannot clear; the issues are identical. Falls back to the scalar path
+    when NumPy is not installed.
+
+    A :class:`galaxy.data_cache.ValidationCache` reuses the stored result of
+    every system whose content hash is unchanged. Only changed systems are
+    checked (with ``engine``, across ``workers`` when there are many),
+    and sector references and the global rules are always re-evaluated.
+    The caller saves the cache.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {', '.join(ENGINES)}.")
+    if engine == "numpy":
+        from galaxy.data_vectorized import numpy_available
+
+        if not numpy_available():
+            engine = "python"
+
+    sectors = data.get("sectors")
+    systems = data.get("systems")
+    if not isinstance(sectors, list) or not isinstance(systems, Sequence) or isinstance(systems, (str, bytes)):
+        return ["Missing required top-level lists: sectors/systems"]
+    parallel = workers is not None and workers > 1 and len(systems) > VALIDATION_CHUNK_SYSTEMS
+    with stage("validate.total"):
+        if cache is not None:
+            return _validate_with_cache(sectors, systems, workers, engine, cache)
+        if not parallel and engine == "python":
+            return list(iter_validate_galaxy(sectors, systems))
+        return _validate_in_chunks(sectors, systems, workers if parallel else None, engine)
+
+
+def _validate_in_chunks(sectors: list[Any], systems: Sequence[dict[str, Any]], workers: int | None, engine: str) -> list[str]:
+    parallel = workers is not None
+    with stage("validate.sectors"):
+        issues, sector_names = _sector_issues(sectors)
+    # Serial NumPy screens are chunked too: _validate_chunk turns records into
+    # dicts, and only one chunk of them should be alive at a time.
+    chunks = [systems[start:start + VALIDATION_CHUNK_SYSTEMS] for start in range(0, len(systems), VALIDATION_CHUNK_SYSTEMS)]
+    m_count = 0
+    if parallel:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_validate_chunk, chunks, itertools.repeat(sector_names), itertools.repeat(engine)))
+    else:
+        results = [_validate_chunk(chunk, sector_names, engine) for chunk in chunks]
+    for chunk_issues, chunk_m_count in results:
+        issues.extend(chunk_issues)
+        m_count += chunk_m_count
+    issues.extend(_population_issues(m_count, len(systems)))
     return issues
 
 
-def export_galaxy_json(data: dict[str, Any], output_path: str | Path) -> Path:
+def _validate_detached(
+    systems: list[dict[str, Any]],
+    sector_names: set[Any],
+    engine: str = "python",
+) -> list[tuple[list[str], bool]]:
+    # Results are cached without the sector check, so flagged systems are
+    # re-checked with ``None`` and clean ones only need their M-star flag.
+    if engine == "numpy":
+        from galaxy.data_vectorized import screen_systems
+
+        with stage("validate.numpy_screen"):
+            flagged, _ = screen_systems(systems, sector_names)
+        increment("validate.rechecked", sum(flagged))
+        return [
+            validate_system(system, None) if suspect else ([], str(system["star"].get("cls", "")).startswith("M"))
+            for system, suspect in zip(systems, flagged)
+        ]
+    return [validate_system(system, None) for system in systems]
+
+
+def _validate_with_cache(
+    sectors: list[Any],
+    systems: Sequence[dict[str, Any] | System],
+    workers: int | None,
+    engine: str,
+    cache: ValidationCache,
+) -> list[str]:
+    issues, sector_names = _sector_issues(sectors)
+    # Systems are converted and hashed one window at a time; only the dicts of
+    # cache misses stay alive, until their batch has been validated, so a
+    # records galaxy is never expanded into dicts all at once.
+    keys: list[str] = []
+    results: list[tuple[list[str], bool] | None] = []
+    unknown_sector: dict[int, str] = {}
+    missing_indexes: list[int] = []
+    missing: list[dict[str, Any]] = []
+    pending: deque[tuple[list[int], Future]] = deque()
+
+    def finish(indexes: list[int], validated: list[tuple[list[str], bool]]) -> None:
+        for index, result in zip(indexes, validated):
+            results[index] = result
+            cache.store(keys[index], *result)
+
+    with ExitStack() as stack:
+        pool: ProcessPoolExecutor | None = None
+
+        def flush(final: bool) -> None:
+            nonlocal pool, missing_indexes, missing
+            if not missing:
+                return
+            # A single batch of misses is not worth starting a pool for.
+            if pool is None and workers is not None and workers > 1 and not (final and not pending):
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            if pool is None:
+                finish(missing_indexes, _validate_detached(missing, sector_names, engine))
+            else:
+                if len(pending) >= workers * 2:
+                    finish(*_resolved(pending.popleft()))
+                pending.append((missing_indexes, pool.submit(_validate_detached, missing, sector_names, engine)))
+            missing_indexes, missing = [], []
+
+        for start in range(0, len(systems), VALIDATION_CHUNK_SYSTEMS):
+            window = [as_system_dict(system) for system in systems[start:start + VALIDATION_CHUNK_SYSTEMS]]
+            with stage("validate.hash"):
+                window_keys = [cache.key(system) for system in window]
+            for index, (system, key) in enumerate(zip(window, window_keys), start):
+                result = cache.load(key)
+                keys.append(key)
+                results.append(result)
+                if system.get("sector") not in sector_names:
+                    unknown_sector[index] = _unknown_sector_issue(system)
+                if result is None:
+                    missing_indexes.append(index)
+                    missing.append(system)
+            del window, system
+            if len(missing) >= VALIDATION_CHUNK_SYSTEMS:
+                flush(final=False)
+        flush(final=True)
+        while pending:
+            finish(*_resolved(pending.popleft()))
+
+    m_count = 0
+    for index, result in enumerate(results):
+        system_issues, is_m = result
+        if index in unknown_sector:
+            issues.append(unknown_sector[index])
+        issues.extend(system_issues)
+        m_count += is_m
+    issues.extend(_population_issues(m_count, len(results)))
+    return issues
+
+
+def _resolved(item: tuple[list[int], Future]) -> tuple[list[int], list[tuple[list[str], bool]]]:
+    indexes, future = item
+    return indexes, future.result()
+
+
+def _document_frame(document: dict[str, Any], style: str = "pretty") -> tuple[str, str]:
+    text = dumps({**document, "systems": []}, style)
+    placeholder = _SYSTEMS_PLACEHOLDERS[style]
+    head, tail = text.split(placeholder, 1)
+    return head + placeholder[:-1], tail
+
+
+def _write_system_items(fh: TextIO, systems: Iterable[dict[str, Any] | System], style: str = "pretty") -> int:
+    pretty = style == "pretty"
+    count = 0
+    for system in systems:
+        with stage("export.encode"):
+            text = dumps(as_system_dict(system), style)
+            if pretty:
+                text = text.replace("\n", "\n    ")
+        with stage("export.write"):
+            if pretty:
+                fh.write(",\n    " if count else "\n    ")
+            elif count:
+                fh.write(",")
+            fh.write(text)
+        count += 1
+    return count
+
+
+def _systems_close(count: int, style: str) -> str:
+    return "\n  ]" if count and style == "pretty" else "]"
+
+
+def write_galaxy_document(
+    fh: TextIO,
+    document: dict[str, Any],
+    systems: Iterable[dict[str, Any]],
+    style: str = "pretty",
+) -> int:
+    """Write ``document`` to ``fh`` with ``systems`` streamed in as its system list.
+
+    The output is byte-identical to ``dumps(document | {"systems": [...]},
+    style)`` (see :mod:`galaxy.serialization`) but only one system is encoded
+    at a time. Returns the number of systems written.
+    """
+    head, tail = _document_frame(document, style)
+    fh.write(head)
+    count = _write_system_items(fh, systems, style)
+    fh.write(_systems_close(count, style) + tail)
+    return count
+
+
+def export_galaxy_json(data: dict[str, Any], output_path: str | Path, *, style: str = "pretty") -> Path:
+    """Write ``data`` as JSON; ``style`` is ``"pretty"`` (indented) or ``"compact"``."""
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        write_galaxy_document(fh, data, data["systems"], style)
+    return path
+
+
+def stream_galaxy_json(
+    output_path: str | Path,
+    *,
+    seed: int | None = None,
+    sector_count: int = 6,
+    system_count: int = 3,
+    planets_per_system: int = 6,
+    engine: str = "python",
+    workers: int | None = None,
+    cache: GenerationCache | None = None,
+    style: str = "pretty",
+) -> Path:
+    """Generate a galaxy straight to ``output_path`` without holding it in memory.
+
+    Produces the same file as ``export_galaxy_json(generate_galaxy(...), style=style)``.
+    Sectors precede systems in the document but list their system names, so
+    systems are spooled to a temporary file next to the output while the
+    (small) name lists are collected, then copied into place.
+    """
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    seed, sectors, systems = _plan_galaxy(seed, sector_count, system_count, planets_per_system, engine, workers, cache)
+
+    def assign_sectors() -> Iterator[dict[str, Any]]:
+        for i, system in enumerate(systems):
+            sectors[i % len(sectors)]["s"].append(system["n"])
+            yield system
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8", dir=path.parent) as spool:
+        count = _write_system_items(spool, assign_sectors(), style)
+        head, tail = _document_frame(_galaxy_document(sectors, [], seed), style)
+        spool.seek(0)
+        with path.open("w", encoding="utf-8") as fh:
+            fh.write(head)
+            shutil.copyfileobj(spool, fh)
+            fh.write(_systems_close(count, style) + tail)
     return path
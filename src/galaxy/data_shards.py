@@ -0,0 +1,241 @@
+"""Per-sector sharded galaxy export with a byte-offset manifest.
+
+A page that shows one sector should not have to download every system.
+:func:`write_galaxy_shards` writes each sector's systems to its own compact
+JSON array (``<sector-id>.json``) plus a ``manifest.json``:
+
+* ``document`` is the galaxy document with an empty ``systems`` list, so
+  sectors, topics and metadata are available from the manifest alone.
+* ``shards`` has one entry per shard: the sector name, the ``file``, its
+  ``sha256`` and ``bytes``, and ``systems`` rows of
+  ``[id, index, offset, length]``. ``index`` is the system's position in the
+  unsharded document; ``offset``/``length`` locate its JSON object in the
+  shard, so a client can ``Range``-read a single system.
+
+:func:`validate_galaxy_shards` checks the shards on a process pool and
+reports the same issues as validating the unsharded document, plus
+integrity issues for missing or altered shards.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import hashlib
+import itertools
+import json
+from pathlib import Path
+import re
+from typing import Any, BinaryIO, Iterable
+
+from galaxy.data_index import slugify
+from galaxy.data_model import System, as_system_dict
+from galaxy.data_pipeline import _population_issues, _sector_issues, validate_system
+from galaxy.serialization import dumps
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+SYSTEM_FIELDS = ("id", "index", "offset", "length")
+
+# Manifests are written with "manifest" as their first key, so they can be
+# told apart from (possibly multi-GB) galaxy documents by their first bytes.
+_MANIFEST_PREFIX = re.compile(rb'\s*\{\s*"manifest"\s*:')
+
+
+class _ShardWriter:
+    def __init__(self, fh: BinaryIO, sector: Any, file: str) -> None:
+        self.fh = fh
+        self.sector = sector
+        self.file = file
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.rows: list[list[Any]] = []
+
+    def _write(self, data: bytes) -> None:
+        self.fh.write(data)
+        self.digest.update(data)
+        self.size += len(data)
+
+    def add(self, system: dict[str, Any], index: int) -> None:
+        self._write(b"," if self.rows else b"[")
+        data = dumps(system, "compact").encode("utf-8")
+        self.rows.append([system.get("id"), index, self.size, len(data)])
+        self._write(data)
+
+    def close(self) -> dict[str, Any]:
+        self._write(b"]" if self.rows else b"[]")
+        return {
+            "sector": self.sector,
+            "file": self.file,
+            "sha256": self.digest.hexdigest(),
+            "bytes": self.size,
+            "systems": self.rows,
+        }
+
+
+def _shard_file(document: dict[str, Any], sector_name: Any, taken: set[str]) -> str:
+    sector_ids = {s.get("n"): s.get("id") for s in document.get("sectors", []) if isinstance(s, dict)}
+    stem = slugify(sector_ids.get(sector_name) or sector_name) or "unassigned"
+    if stem == slugify(Path(MANIFEST_NAME).stem):
+        stem += "-sector"
+    name = stem
+    for suffix in itertools.count(2):
+        if name not in taken:
+            break
+        name = f"{stem}-{suffix}"
+    taken.add(name)
+    return f"{name}.json"
+
+
+def write_galaxy_shards(output_dir: str | Path, document: dict[str, Any], systems: Iterable[dict[str, Any] | System]) -> Path:
+    """Write ``systems`` as one shard per sector into ``output_dir``; returns the manifest path.
+
+    Only one system is encoded at a time. ``document`` supplies the other
+    top-level keys and is read after ``systems`` is exhausted, so it may be
+    filled while streaming (see :func:`galaxy.data_ndjson.read_galaxy_file`).
+    """
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    writers: dict[Any, _ShardWriter] = {}
+    taken: set[str] = set()
+    with ExitStack() as stack:
+        for index, system in enumerate(systems):
+            system = as_system_dict(system)
+            sector = system.get("sector")
+            writer = writers.get(sector)
+            if writer is None:
+                file = _shard_file(document, sector, taken)
+                writer = writers[sector] = _ShardWriter(stack.enter_context((directory / file).open("wb")), sector, file)
+            writer.add(system, index)
+        shards = [writer.close() for writer in writers.values()]
+
+    manifest = {
+        "manifest": MANIFEST_VERSION,
+        "document": {key: [] if key == "systems" else value for key, value in document.items()},
+        "system_fields": list(SYSTEM_FIELDS),
+        "shards": shards,
+    }
+    path = directory / MANIFEST_NAME
+    path.write_text(dumps(manifest, "compact"), encoding="utf-8")
+    return path
+
+
+def export_galaxy_shards(data: dict[str, Any], output_dir: str | Path) -> Path:
+    return write_galaxy_shards(output_dir, data, data["systems"])
+
+
+def _shard_path(manifest_path: Path, shard: dict[str, Any]) -> Path:
+    # Shards always sit next to their manifest.
+    return manifest_path.parent / Path(str(shard.get("file"))).name
+
+
+def is_shard_manifest(path: str | Path) -> bool:
+    try:
+        with open(path, "rb") as fh:
+            return _MANIFEST_PREFIX.match(fh.read(64)) is not None
+    except OSError:
+        return False
+
+
+def load_manifest(path: str | Path) -> dict[str, Any]:
+    """Read a shard manifest; raises ``ValueError`` if ``path`` is not a supported one."""
+    manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(manifest, dict) or manifest.get("manifest") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported shard manifest (expected version {MANIFEST_VERSION}).")
+    if not isinstance(manifest.get("document"), dict) or not isinstance(manifest.get("shards"), list):
+        raise ValueError("Shard manifest needs 'document' and 'shards'.")
+    return manifest
+
+
+def read_shard_system(manifest_path: str | Path, system_id: str) -> dict[str, Any] | None:
+    """Read one system by reading only its byte range; ``None`` if the manifest does not list it."""
+    manifest_path = Path(manifest_path)
+    for shard in load_manifest(manifest_path)["shards"]:
+        for row in shard["systems"]:
+            if row[0] == system_id:
+                with _shard_path(manifest_path, shard).open("rb") as fh:
+                    fh.seek(row[2])
+                    return json.loads(fh.read(row[3]))
+    return None
+
+
+def load_sharded_galaxy(manifest_path: str | Path) -> dict[str, Any]:
+    """Reassemble the unsharded document, with systems in their original order."""
+    manifest_path = Path(manifest_path)
+    manifest = load_manifest(manifest_path)
+    placed: list[tuple[int, dict[str, Any]]] = []
+    for shard in manifest["shards"]:
+        systems = json.loads(_shard_path(manifest_path, shard).read_text(encoding="utf-8"))
+        placed.extend(zip((row[1] for row in shard["systems"]), systems))
+    placed.sort(key=lambda item: item[0])
+    return {**manifest["document"], "systems": [system for _, system in placed]}
+
+
+def _validate_shard(
+    path: Path,
+    shard: dict[str, Any],
+    sector_names: set[Any],
+) -> tuple[list[str], list[tuple[int, list[str]]], int, int]:
+    """Integrity issues, ``(index, issues)`` per system, M-star count and system count for one shard."""
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return [f"Shard {shard.get('file')}: file is missing."], [], 0, 0
+    integrity = []
+    if len(raw) != shard.get("bytes") or hashlib.sha256(raw).hexdigest() != shard.get("sha256"):
+        integrity.append(f"Shard {shard.get('file')}: content does not match the manifest hash/size.")
+    try:
+        systems = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        return [*integrity, f"Shard {shard.get('file')}: invalid JSON ({exc})."], [], 0, 0
+    if not isinstance(systems, list):
+        return [*integrity, f"Shard {shard.get('file')}: expected a list of systems."], [], 0, 0
+    rows = shard.get("systems", [])
+    if len(rows) != len(systems):
+        integrity.append(f"Shard {shard.get('file')}: manifest lists {len(rows)} systems, shard holds {len(systems)}.")
+
+    results = []
+    m_count = 0
+    for position, system in enumerate(systems):
+        issues, is_m = validate_system(system, sector_names)
+        index = rows[position][1] if position < len(rows) else position
+        results.append((index, issues))
+        m_count += is_m
+    return integrity, results, m_count, len(systems)
+
+
+def validate_galaxy_shards(manifest_path: str | Path, *, workers: int | None = None) -> list[str]:
+    """Validate every shard listed in the manifest at ``manifest_path``.
+
+    ``workers=N`` checks shards on a process pool. System issues are merged
+    in unsharded document order, so they match
+    :func:`galaxy.data_pipeline.validate_galaxy` on the original document;
+    shard integrity issues follow the sector issues. Raises ``ValueError``
+    for an unsupported manifest.
+    """
+    manifest_path = Path(manifest_path)
+    manifest = load_manifest(manifest_path)
+    sectors = manifest["document"].get("sectors")
+    if not isinstance(sectors, list):
+        return ["Missing required top-level lists: sectors/systems"]
+    issues, sector_names = _sector_issues(sectors)
+    shards = manifest["shards"]
+    paths = [_shard_path(manifest_path, shard) for shard in shards]
+    if workers is not None and workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_validate_shard, paths, shards, itertools.repeat(sector_names)))
+    else:
+        results = [_validate_shard(path, shard, sector_names) for path, shard in zip(paths, shards)]
+
+    system_results: list[tuple[int, list[str]]] = []
+    m_count = system_count = 0
+    for integrity, shard_results, shard_m_count, shard_count in results:
+        issues.extend(integrity)
+        system_results.extend(shard_results)
+        m_count += shard_m_count
+        system_count += shard_count
+    system_results.sort(key=lambda item: item[0])
+    for _, system_issues in system_results:
+        issues.extend(system_issues)
+    issues.extend(_population_issues(m_count, system_count))
+    return issues
@@ -0,0 +1,111 @@
+"""Fast-load snapshot of the API's in-memory galaxy state.
+
+Serving the API needs the parsed galaxy, its :class:`GalaxyIndex` and the
+sector k-d tree. Deriving them from ``galaxy-data.json`` means parsing the
+whole document and rebuilding every posting list, on every cold start.
+``galaxy-data snapshot`` does that once at build time and pickles the
+result. Loading a snapshot restores the same objects without re-deriving
+anything, with the collector paused while the object graph is rebuilt.
+
+A snapshot file starts with a one-line JSON header recording the format
+version, the Python version, a hash of the modules whose classes are
+pickled, and the content hash of the JSON it was built from. A snapshot that
+does not match is rejected and callers fall back to the JSON. Snapshots are
+pickles: only load files you built.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import gc
+import hashlib
+import json
+from pathlib import Path
+import pickle
+import platform
+
+from galaxy.data_index import GalaxyIndex, load_galaxy_index
+from galaxy.spatial import KDTree, build_sector_tree
+from galaxy.web_assets import content_hash
+
+SNAPSHOT_MAGIC = b"GLXSNAP"
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class GalaxySnapshot:
+    index: GalaxyIndex
+    sector_tree: KDTree
+
+    @classmethod
+    def from_index(cls, index: GalaxyIndex) -> GalaxySnapshot:
+        return cls(index, build_sector_tree(index.data["sectors"]))
+
+
+@lru_cache(maxsize=1)
+def code_fingerprint() -> str:
+    """Hash of the modules whose objects a snapshot pickles; any edit invalidates snapshots."""
+    from galaxy import data_index, spatial
+
+    digest = hashlib.blake2b(digest_size=16)
+    for module in (data_index, spatial):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def _header(source: str | Path | None) -> dict[str, object]:
+    header: dict[str, object] = {"version": SNAPSHOT_VERSION, "python": platform.python_version(), "code": code_fingerprint()}
+    if source is not None:
+        header["source"] = content_hash(source)
+    return header
+
+
+def write_snapshot(source: str | Path, output_path: str | Path) -> Path:
+    """Load ``source`` (any JSON export the API accepts) and snapshot its indexed state."""
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    snapshot = GalaxySnapshot.from_index(load_galaxy_index(source))
+    with path.open("wb") as fh:
+        fh.write(SNAPSHOT_MAGIC + json.dumps(_header(source), separators=(",", ":")).encode("utf-8") + b"\n")
+        pickle.dump(snapshot, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def load_snapshot(path: str | Path, *, source: str | Path | None = None) -> GalaxySnapshot:
+    """Load a snapshot; raises ``ValueError`` if it is malformed, from another build, or stale for ``source``."""
+    with Path(path).open("rb") as fh:
+        line = fh.readline()
+        if not line.startswith(SNAPSHOT_MAGIC):
+            raise ValueError("Not a galaxy snapshot.")
+        try:
+            header = json.loads(line[len(SNAPSHOT_MAGIC):])
+        except json.JSONDecodeError:
+            raise ValueError("Corrupt snapshot header.") from None
+        stale = [key for key, value in _header(source).items() if not isinstance(header, dict) or header.get(key) != value]
+        if stale:
+            raise ValueError(f"Snapshot does not match this build ({', '.join(stale)} changed).")
+        # Rebuilding millions of containers would otherwise trigger a
+        # collection every few hundred allocations.
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            snapshot = pickle.load(fh)
+        except (pickle.UnpicklingError, EOFError):
+            raise ValueError("Corrupt snapshot payload.") from None
+        finally:
+            if collecting:
+                gc.enable()
+    if not isinstance(snapshot, GalaxySnapshot):
+        raise ValueError("Snapshot payload is not a galaxy snapshot.")
+    return snapshot
+
+
+def load_galaxy_state(data_path: str | Path, snapshot_path: str | Path | None = None) -> GalaxySnapshot:
+    """The snapshot at ``snapshot_path`` when it is current for ``data_path``, else a fresh build from the JSON."""
+    if snapshot_path is not None:
+        try:
+            return load_snapshot(snapshot_path, source=data_path)
+        except (OSError, ValueError):
+            pass
+    return GalaxySnapshot.from_index(load_galaxy_index(data_path))
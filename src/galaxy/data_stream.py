@@ -0,0 +1,162 @@
+"""Incremental reader and validator for large galaxy JSON exports.
+
+The exported document is one JSON object whose ``systems`` list dominates its
+size. :func:`iter_galaxy_events` walks the top-level object with a bounded
+read buffer, decoding every other key whole but yielding ``systems`` one
+element at a time, so a multi-GB file never has to be held in memory.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+from galaxy.data_dictionary import DictionaryDecoder
+from galaxy.data_pipeline import _population_issues, _sector_issues, validate_system
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonCursor:
+    """Pull-based cursor over a text stream with a sliding buffer."""
+
+    def __init__(self, fh: TextIO, chunk_size: int = CHUNK_SIZE) -> None:
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        # Read at least as much as is already buffered so retries on a large
+        # value stay linear overall.
+        chunk = self._fh.read(max(self._chunk_size, len(self._buf) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buf, self._pos)
+        self._pos += 1
+
+    def accept(self, char: str) -> bool:
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number that ends exactly at the buffer edge may continue in
+            # the next chunk.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_galaxy_events(fh: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """Yield ``(key, value)`` pairs for the top-level galaxy object.
+
+    Each element of ``systems`` is yielded separately as ``("system", item)``;
+    every other key is yielded once with its fully decoded value. Raises
+    ``json.JSONDecodeError`` on malformed input.
+    """
+    cursor = _JsonCursor(fh, chunk_size)
+    cursor.expect("{")
+    if cursor.accept("}"):
+        return
+    while True:
+        key = cursor.value()
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting property name", "", 0)
+        cursor.expect(":")
+        if key == "systems" and cursor.accept("["):
+            yield ("systems", [])
+            if not cursor.accept("]"):
+                while True:
+                    yield ("system", cursor.value())
+                    if cursor.accept("]"):
+                        break
+                    cursor.expect(",")
+        else:
+            yield (key, cursor.value())
+        if cursor.accept("}"):
+            break
+        cursor.expect(",")
+    if cursor.peek():
+        raise json.JSONDecodeError("Extra data", "", 0)
+
+
+def iter_validate_stream(fh: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Validate a galaxy JSON stream, yielding issues as systems arrive.
+
+    Produces the same issues as :func:`galaxy.data_pipeline.validate_galaxy`.
+    Memory stays bounded when ``sectors`` precedes ``systems`` (as exported);
+    otherwise unknown-sector checks are deferred until the sectors are read.
+    Dictionary-encoded files are decoded system by system; their ``tables``
+    must precede ``systems``. Raises ``ValueError`` on bad table references.
+    """
+    sector_names: set[Any] | None = None
+    decoder: DictionaryDecoder | None = None
+    deferred: dict[Any, list[str]] = {}
+    systems_seen = False
+    systems_is_list = False
+    m_count = 0
+    system_count = 0
+
+    for key, value in iter_galaxy_events(fh, chunk_size):
+        if key == "sectors":
+            if not isinstance(value, list):
+                continue
+            sector_issues, sector_names = _sector_issues(value)
+            yield from sector_issues
+            for sector, names in deferred.items():
+                if sector not in sector_names:
+                    yield from (f"{name}: references unknown sector '{sector}'." for name in names)
+            deferred.clear()
+        elif key == "tables":
+            decoder = DictionaryDecoder(value)
+        elif key == "systems":
+            systems_seen = True
+            systems_is_list = isinstance(value, list)
+        elif key == "system":
+            if decoder is not None and isinstance(value, dict):
+                value = decoder.system(value)
+            if sector_names is None:
+                deferred.setdefault(value.get("sector"), []).append(value.get("n", "<unknown>"))
+            system_issues, is_m = validate_system(value, sector_names)
+            yield from system_issues
+            m_count += is_m
+            system_count += 1
+
+    if sector_names is None or not systems_seen or not systems_is_list:
+        yield "Missing required top-level lists: sectors/systems"
+        return
+    yield from _population_issues(m_count, system_count)
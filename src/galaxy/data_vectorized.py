@@ -0,0 +1,586 @@
+"""Columnar NumPy engine for planet generation.
+
+The scalar generator in :mod:`galaxy.data_pipeline` builds planets one at a
+time. This module evaluates the same orbit layout, regime classification and
+physics models over whole batches of systems as ``(systems, planets)`` arrays
+and only assembles the planet dicts at the end. NumPy is optional; callers
+should check :func:`numpy_available` first.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None  # type: ignore[assignment]
+
+from galaxy.data_pipeline import (
+    ATMOSPHERE_BASES,
+    EARTH_MASS_PER_JUPITER,
+    EARTH_RADIUS_PER_JUPITER,
+    FREE_TEMP_AMPLITUDES,
+    GREENHOUSE_SCALES,
+    LOCKED_TEMP_AMPLITUDES,
+    PLANET_PROFILES,
+    PRESSURE_BASE_COLUMNS,
+    build_science_explanation,
+    build_visual_description,
+    exploration_status,
+    format_rotation,
+    infer_profile_key,
+)
+
+PROFILE_KEYS: list[str] = list(PLANET_PROFILES)
+GASES: list[str] = list(dict.fromkeys(gas for base in ATMOSPHERE_BASES.values() for gas in base))
+
+_ROW_FIELDS = (
+    "mass", "radius", "gravity", "g", "distance", "a", "op", "rotation", "rot_days", "tilt",
+    "t_min", "t_max", "atm", "pressure", "pb", "teq", "tmean", "magnetic", "alb", "hab", "locked",
+)
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _profile_column(values: dict[str, float], default: float = 0.0) -> Any:
+    return np.array([values.get(key, default) for key in PROFILE_KEYS], dtype=float)
+
+
+def _gas(matrix: Any, gas: str) -> Any:
+    return matrix[..., GASES.index(gas)]
+
+
+def _jitter_atmospheres(np_rng: Any, profile_idx: Any) -> Any:
+    """Vectorized ``atmosphere_for_type``: jitter, normalise and round to 0.1%."""
+    base = np.array([[ATMOSPHERE_BASES[key].get(gas, 0.0) for gas in GASES] for key in PROFILE_KEYS])
+    present = base > 0
+    jitter = np.array([0.12 if "giant" in key else 0.20 for key in PROFILE_KEYS])
+
+    spread = jitter[profile_idx][..., None]
+    scale = 1.0 + np_rng.uniform(-1.0, 1.0, size=profile_idx.shape + (len(GASES),)) * spread
+    mask = present[profile_idx]
+    values = np.where(mask, np.maximum(0.05, base[profile_idx] * scale), 0.0)
+
+    normalized = values / values.sum(axis=-1, keepdims=True) * 100.0
+    rounded = np.round(normalized, 1)
+    diff = np.round(100.0 - rounded.sum(axis=-1), 1)
+    top = np.argmax(np.where(mask, rounded, -np.inf), axis=-1)
+    np.put_along_axis(
+        rounded,
+        top[..., None],
+        np.round(np.take_along_axis(rounded, top[..., None], axis=-1) + diff[..., None], 1),
+        axis=-1,
+    )
+    return rounded
+
+
+def generate_planets_batch(
+    np_rng: Any,
+    stars: list[dict[str, Any]],
+    planet_count: int,
+    name_pools: list[list[str]],
+) -> list[list[dict[str, Any]]]:
+    """Generate planets for many systems at once.
+
+    Mirrors :func:`galaxy.data_pipeline.generate_planets` row by row, drawing
+    from a NumPy ``Generator`` instead of ``random.Random``.
+    """
+    rows = len(stars)
+    if rows == 0 or planet_count <= 0:
+        return [[] for _ in stars]
+    shape = (rows, planet_count)
+
+    star_class = np.array([star["cls"][0] for star in stars])
+    hz_inner = np.array([float(star["hz"][0]) for star in stars])[:, None]
+    hz_outer = np.array([float(star["hz"][1]) for star in stars])[:, None]
+    frost = np.array([float(star["frost"]) for star in stars])[:, None]
+    star_mass = np.array([float(star["m"]) for star in stars])[:, None]
+    lum = np.array([float(star["lum"]) for star in stars])[:, None]
+    cool_star = np.isin(star_class, ["M", "K"])[:, None]
+
+    # Orbit layout: geometric spacing from a class-dependent inner edge.
+    start_low = np.select([star_class == "M", star_class == "K"], [0.03, 0.05], 0.10)
+    start_high = np.select([star_class == "M", star_class == "K"], [0.08, 0.14], 0.35)
+    start = start_low + (start_high - start_low) * np_rng.random(rows)
+    spacing = np_rng.uniform(1.42, 2.05, size=(rows, planet_count - 1))
+    distances = start[:, None] * np.concatenate([np.ones((rows, 1)), np.cumprod(spacing, axis=1)], axis=1)
+    outermost = distances[:, -1:]
+    distances = np.where(outermost < frost * 1.10, distances * (frost * 1.20) / outermost, distances)
+
+    # Regime classification.
+    roll = np_rng.random(shape)
+    pid = PROFILE_KEYS.index
+    profile_idx = np.select(
+        [
+            distances >= frost * 2.2,
+            distances >= frost,
+            distances < hz_inner * 0.65,
+            (distances >= hz_inner) & (distances <= hz_outer),
+        ],
+        [
+            pid("ice_giant"),
+            np.where(roll < 0.65, pid("gas_giant"), pid("ice_giant")),
+            np.where(roll < 0.55, pid("volcanic"), pid("hot_super_earth")),
+            np.where(roll < 0.55, pid("temperate_terrestrial"), pid("oceanic_super_earth")),
+        ],
+        pid("cold_super_earth"),
+    )
+
+    profiles = [PLANET_PROFILES[key] for key in PROFILE_KEYS]
+    earth = np.array([profile.unit == "Earth" for profile in profiles])[profile_idx]
+    giant = np.array(["giant" in key for key in PROFILE_KEYS])[profile_idx]
+
+    def draw(ranges: list[tuple[float, float]]) -> Any:
+        low = np.array([r[0] for r in ranges])[profile_idx]
+        high = np.array([r[1] for r in ranges])[profile_idx]
+        return low + (high - low) * np_rng.random(shape)
+
+    mass = draw([profile.mass_range for profile in profiles])
+    radius = draw([profile.radius_range for profile in profiles])
+    gravity = np.where(
+        earth,
+        mass / radius ** 2,
+        (mass * EARTH_MASS_PER_JUPITER) / (radius * EARTH_RADIUS_PER_JUPITER) ** 2,
+    )
+    albedo = draw([profile.albedo_range for profile in profiles])
+    orbital_days = np.sqrt(distances ** 3 / star_mass) * 365.25
+    locked = (cool_star & (distances < hz_inner * 0.85)) | ((orbital_days < 20) & earth)
+
+    rotation = np.where(
+        locked,
+        orbital_days,
+        np.where(giant, np_rng.uniform(0.35, 0.90, size=shape), np_rng.uniform(0.60, 2.80, size=shape)),
+    )
+    tilt = np.where(
+        locked,
+        np_rng.uniform(0.0, 6.0, size=shape),
+        np.where(giant, np_rng.uniform(0.0, 32.0, size=shape), np_rng.uniform(2.0, 35.0, size=shape)),
+    )
+
+    atmosphere = _jitter_atmospheres(np_rng, profile_idx)
+    magnetic = np_rng.random(shape) <= np.array([profile.magnetic_prob for profile in profiles])[profile_idx]
+    teq = 278.0 * lum ** 0.25 / np.sqrt(distances) * (1.0 - albedo) ** 0.25
+
+    # Surface pressure (rocky worlds only; giants report the 1 bar level).
+    volatile = sum(_gas(atmosphere, gas) for gas in ("N2", "CO2", "H2O", "CH4", "SO2")) / 100.0
+    retention = np.clip(np.sqrt(np.maximum(0.05, mass / np.maximum(radius, 0.05))), 0.45, 2.4)
+    escape = np.clip(1.0 - np.maximum(0.0, teq - 420.0) / 900.0 * (1.1 / retention), 0.18, 1.0)
+    condensation = np.clip(0.55 + (np.minimum(teq, 420.0) / 420.0) * 0.65, 0.35, 1.2)
+    column = _profile_column(PRESSURE_BASE_COLUMNS)[profile_idx]
+    modeled = np.maximum(0.02, column * gravity * (0.65 + volatile) * retention * escape * condensation)
+    p_low = np.array([profile.pressure_range[0] for profile in profiles])[profile_idx]
+    p_high = np.array([profile.pressure_range[1] for profile in profiles])[profile_idx]
+    pressure = np.where(earth, np.clip(modeled, p_low, p_high), 1.0)
+
+    # Mean surface temperature.
+    greenhouse = np.clip(
+        1.35 * _gas(atmosphere, "CO2") / 100.0
+        + 2.05 * _gas(atmosphere, "CH4") / 100.0
+        + 1.30 * _gas(atmosphere, "H2O") / 100.0
+        + 1.10 * _gas(atmosphere, "SO2") / 100.0
+        + 1.50 * _gas(atmosphere, "NH3") / 100.0
+        + 0.10 * _gas(atmosphere, "N2") / 100.0,
+        0.0,
+        1.8,
+    )
+    capped_gravity = np.minimum(2.0, gravity)
+    rocky_mean = (
+        teq
+        + _profile_column(GREENHOUSE_SCALES)[profile_idx] * np.log1p(np.maximum(0.01, pressure)) * (0.22 + greenhouse)
+        + 4.0 * np.log1p(np.maximum(0.01, _gas(atmosphere, "N2") / 30.0))
+        + np.where(locked, 6.0, 0.0)
+    )
+    gas_giant = profile_idx == pid("gas_giant")
+    ice_giant = profile_idx == pid("ice_giant")
+    mean_temp = np.select(
+        [gas_giant, ice_giant],
+        [teq + 14.0 + 18.0 * capped_gravity, teq + 9.0 + 10.0 * capped_gravity],
+        rocky_mean,
+    )
+
+    # Day/night and seasonal range.
+    transport = np.clip(
+        0.55
+        + 0.22 * np.log1p(np.maximum(0.01, pressure))
+        + 0.15 * _gas(atmosphere, "H2O") / 100.0
+        + 0.10 * _gas(atmosphere, "N2") / 100.0,
+        0.25,
+        1.25,
+    )
+    amplitude = np.where(
+        locked,
+        _profile_column(LOCKED_TEMP_AMPLITUDES)[profile_idx] * (1.18 - 0.55 * transport),
+        _profile_column(FREE_TEMP_AMPLITUDES)[profile_idx] * (0.85 + tilt / 55.0) * (1.10 - 0.35 * transport),
+    )
+    amplitude = np.maximum(6.0, amplitude)
+    low = np.maximum(25.0, mean_temp - 0.56 * amplitude)
+    high = np.maximum(low + 4.0, mean_temp + np.where(locked, 0.50, 0.44) * amplitude)
+    t_min = np.rint(low).astype(int)
+    t_max = np.rint(high).astype(int)
+
+    # Habitability score.
+    range_mean = (t_min + t_max) / 2
+    oxygen = _gas(atmosphere, "O2")
+    score = (
+        np.select([(range_mean >= 240) & (range_mean <= 320), (range_mean >= 200) & (range_mean <= 360)], [35, 20], 0)
+        + np.select([(pressure >= 0.5) & (pressure <= 3.0), (pressure >= 0.1) & (pressure <= 5.0)], [20, 10], 0)
+        + np.select([(oxygen >= 10) & (oxygen <= 30), oxygen >= 1], [15, 8], 0)
+        + np.where(magnetic, 10, 0)
+        + np.where((distances >= hz_inner) & (distances <= hz_outer), 15, 0)
+        - np.select([range_mean > 420, range_mean < 180], [20, 15], 0)
+        - np.where(np.isin(profile_idx, [pid("volcanic"), pid("hot_super_earth")]), 8, 0)
+    )
+    hab = np.where(giant, 0, np.clip(score, 0, 100))
+
+    # Reorder each planet's gases into its profile's own key order so the
+    # dicts can be zipped together without per-gas lookups.
+    width = max(len(base) for base in ATMOSPHERE_BASES.values())
+    slots = np.array([
+        [GASES.index(gas) for gas in ATMOSPHERE_BASES[key]] + [0] * (width - len(ATMOSPHERE_BASES[key]))
+        for key in PROFILE_KEYS
+    ])
+    gas_values = np.take_along_axis(atmosphere, slots[profile_idx], axis=-1)
+
+    return _assemble(
+        stars,
+        name_pools,
+        profile_idx.tolist(),
+        {
+            "mass": np.round(mass, 2).tolist(),
+            "radius": np.round(radius, 2).tolist(),
+            "gravity": gravity.tolist(),
+            "g": np.round(gravity, 2).tolist(),
+            "distance": distances.tolist(),
+            "a": np.round(distances, 4).tolist(),
+            "op": np.round(orbital_days, 2).tolist(),
+            "rotation": rotation.tolist(),
+            "rot_days": np.round(rotation, 4).tolist(),
+            "tilt": np.round(tilt, 1).tolist(),
+            "t_min": t_min.tolist(),
+            "t_max": t_max.tolist(),
+            "atm": gas_values.tolist(),
+            "pressure": pressure.tolist(),
+            "pb": np.round(pressure, 2).tolist(),
+            "teq": np.round(teq, 1).tolist(),
+            "tmean": np.round(mean_temp, 1).tolist(),
+            "magnetic": magnetic.tolist(),
+            "alb": np.round(albedo, 2).tolist(),
+            "hab": hab.tolist(),
+            "locked": locked.tolist(),
+        },
+    )
+
+
+def _assemble(
+    stars: list[dict[str, Any]],
+    name_pools: list[list[str]],
+    profile_idx: list[list[int]],
+    columns: dict[str, list[list[Any]]],
+) -> list[list[dict[str, Any]]]:
+    profiles = [PLANET_PROFILES[key] for key in PROFILE_KEYS]
+    gas_names = [list(ATMOSPHERE_BASES[key]) for key in PROFILE_KEYS]
+    visuals: dict[tuple[int, bool, bool], str] = {}
+    batches: list[list[dict[str, Any]]] = []
+    for row, star in enumerate(stars):
+        hz_inner, hz_outer = star["hz"]
+        name_pool = name_pools[row]
+        fields = [columns[name][row] for name in _ROW_FIELDS]
+        planets: list[dict[str, Any]] = []
+        for col, (
+            pidx, mass, radius, gravity, g, distance, a, op, rotation, rot_days, tilt,
+            t_min, t_max, atm, pressure, pb, teq, tmean, magnetic, alb, hab, locked,
+        ) in enumerate(zip(profile_idx[row], *fields)):
+            profile_key = PROFILE_KEYS[pidx]
+            profile = profiles[pidx]
+            earth = profile.unit == "Earth"
+            mag = "Yes" if magnetic else "No"
+            visual_key = (pidx, magnetic, locked)
+            if visual_key not in visuals:
+                visuals[visual_key] = build_visual_description(profile_key, mag, locked)
+
+            planets.append(
+                {
+                    "n": name_pool[col % len(name_pool)],
+                    "t": profile.label,
+                    "m": [mass, profile.unit],
+                    "rad": [radius, profile.unit],
+                    "g": g,
+                    "a": a,
+                    "op": op,
+                    "rp": format_rotation(rotation),
+                    "rot_days": rot_days,
+                    "tilt": tilt,
+                    "temp": [t_min, t_max],
+                    "atm": dict(zip(gas_names[pidx], atm)),
+                    "pb": pb if earth else 1,
+                    "teq": teq,
+                    "tmean": tmean,
+                    "mag": mag,
+                    "alb": alb,
+                    "hab": hab,
+                    "v": visuals[visual_key],
+                    "sci": build_science_explanation(
+                        profile_key,
+                        semi_major_au=distance,
+                        hz_inner_au=hz_inner,
+                        hz_outer_au=hz_outer,
+                        pressure_bar=pressure if earth else 1.0,
+                        gravity_g=gravity,
+                        tidally_locked=locked,
+                    ),
+                    "x": exploration_status(hab, profile_key),
+                    "locked": locked,
+                }
+            )
+        batches.append(planets)
+    return batches
+
+
+# -- Columnar validation kernel ------------------------------------------------
+
+_NUMERIC_TYPES = frozenset({int, float})
+# Relative slack applied to every threshold so float differences between the
+# array expressions and ``math`` never hide an issue the scalar validator would
+# report; rows inside the slack are re-checked by the scalar path.
+_SLACK = 1e-9
+
+
+def _exceeds(value: Any, limit: Any) -> Any:
+    return ~(value <= limit * (1.0 - _SLACK))
+
+
+def _near(value: Any, edge: Any) -> Any:
+    return np.abs(value - edge) <= _SLACK * np.maximum(1.0, np.abs(edge))
+
+
+def screen_systems(systems: list[Any], sector_names: set[Any]) -> tuple[list[bool], int]:
+    """Find the systems that need the scalar validator.
+
+    Planet fields are pulled into arrays once and the Kepler, gravity,
+    atmosphere, frost-line, tidal-lock, pressure-model and temperature-model
+    tolerances are evaluated as array expressions. Returns a per-system flag
+    (``True`` when the system may have issues, or could not be screened) and
+    the M-star count. Clean systems are guaranteed to have no issues.
+    """
+    flagged = [False] * len(systems)
+    m_count = 0
+
+    star_rows: list[tuple[float, float, float, float, float, bool]] = []
+    star_system: list[int] = []
+    planet_sys: list[int] = []
+    numeric: list[tuple[float, ...]] = []
+    gas_rows: list[tuple[float, ...]] = []
+    profile_rows: list[int] = []
+    giant_rows: list[bool] = []
+    profile_cache: dict[str, tuple[int, bool]] = {}
+
+    for index, system in enumerate(systems):
+        star = system.get("star", {})
+        planets = system.get("p", [])
+        if system.get("sector") not in sector_names or not isinstance(star, dict) or not isinstance(planets, list):
+            flagged[index] = True
+            if isinstance(star, dict) and isinstance(planets, list):
+                m_count += str(star.get("cls", "")).startswith("M")
+            continue
+        cls = str(star.get("cls", ""))
+        m_count += cls.startswith("M")
+        try:
+            star_row = (
+                float(star["m"]),
+                float(star["lum"]),
+                float(star["hz"][0]),
+                float(star["hz"][1]),
+                float(star["frost"]),
+                cls.startswith(("M", "K")),
+            )
+            rows = []
+            for planet in planets:
+                atm = planet["atm"]
+                if not isinstance(atm, dict) or not atm or planet.get("rot_days") is None:
+                    raise ValueError("irregular planet payload")
+                if not _NUMERIC_TYPES.issuperset(map(type, atm.values())):
+                    raise ValueError("non-numeric atmosphere")
+                planet_type = str(planet.get("t", ""))
+                if planet_type not in profile_cache:
+                    key = infer_profile_key(planet_type)
+                    ptype = planet_type.lower()
+                    profile_cache[planet_type] = (
+                        -1 if key is None else PROFILE_KEYS.index(key),
+                        "gas giant" in ptype or "ice giant" in ptype,
+                    )
+                rows.append(
+                    (
+                        (
+                            float(planet["a"]),
+                            float(planet["op"]),
+                            float(planet["m"][0]),
+                            float(planet["rad"][0]),
+                            str(planet["m"][1]) == "Earth",
+                            float(planet["g"]),
+                            float(planet["pb"]),
+                            int(planet["temp"][0]),
+                            int(planet["temp"][1]),
+                            float(planet["alb"]),
+                            float(planet.get("tilt", 0.0)),
+                            float(planet["rot_days"]),
+                            float(sum(atm.values())),
+                        ),
+                        (
+                            atm.get("N2", 0.0),
+                            atm.get("CO2", 0.0),
+                            atm.get("H2O", 0.0),
+                            atm.get("CH4", 0.0),
+                            atm.get("SO2", 0.0),
+                            atm.get("NH3", 0.0),
+                        ),
+                        profile_cache[planet_type],
+                    )
+                )
+        except Exception:
+            flagged[index] = True
+            continue
+
+        star_rows.append(star_row)
+        star_system.append(index)
+        for row, gases, (profile, giant) in rows:
+            planet_sys.append(len(star_rows) - 1)
+            numeric.append(row)
+            gas_rows.append(gases)
+            profile_rows.append(profile)
+            giant_rows.append(giant)
+
+    if not star_rows:
+        return flagged, m_count
+
+    with np.errstate(all="ignore"):
+        bad_star = _screen_stars(np.array(star_rows, dtype=float))
+        if numeric:
+            bad_planet = _screen_planets(
+                np.array(star_rows, dtype=float)[np.array(planet_sys)],
+                np.array(numeric, dtype=float),
+                np.array(gas_rows, dtype=float),
+                np.array(profile_rows),
+                np.array(giant_rows, dtype=bool),
+                np.array(planet_sys),
+            )
+            np.logical_or.at(bad_star, np.array(planet_sys)[bad_planet], True)
+
+    for row in np.flatnonzero(bad_star).tolist():
+        flagged[star_system[row]] = True
+    return flagged, m_count
+
+
+def _screen_stars(stars: Any) -> Any:
+    lum = stars[:, 1]
+    root = np.sqrt(lum)
+    bad = np.zeros(len(stars), dtype=bool)
+    for column, factor, limit in ((2, 0.95, 0.25), (3, 1.67, 0.25), (4, 4.85, 0.30)):
+        expected = factor * root
+        error = np.abs(expected - stars[:, column]) / np.maximum(expected, 1e-6)
+        bad |= _exceeds(error, limit)
+    return bad
+
+
+def _screen_planets(star: Any, rows: Any, gases: Any, profile: Any, giant: Any, planet_sys: Any) -> Any:
+    star_mass, lum, hz_inner, frost, cool = star[:, 0], star[:, 1], star[:, 2], star[:, 4], star[:, 5] > 0
+    (
+        distance, period, mass, radius, earth, gravity, pressure,
+        t_low, t_high, albedo, tilt, rotation, atm_total,
+    ) = rows.T
+    earth = earth > 0
+    n2, co2, h2o, ch4, so2, nh3 = gases.T
+
+    bad = np.zeros(len(rows), dtype=bool)
+
+    same_system = np.concatenate([[False], planet_sys[1:] == planet_sys[:-1]])
+    previous = np.concatenate([[-np.inf], distance[:-1]])
+    bad |= same_system & ~(distance > previous)
+
+    expected_period = np.sqrt(distance ** 3 / star_mass) * 365.25
+    bad |= _exceeds(np.abs(expected_period - period) / np.maximum(expected_period, 1e-6), 0.18)
+
+    expected_g = np.where(
+        earth,
+        mass / radius ** 2,
+        (mass * EARTH_MASS_PER_JUPITER) / (radius * EARTH_RADIUS_PER_JUPITER) ** 2,
+    )
+    bad |= _exceeds(np.abs(expected_g - gravity) / np.maximum(expected_g, 1e-6), 0.15)
+    bad |= _exceeds(np.abs(atm_total - 100.0), 1.2)
+    bad |= ~(pressure > 0) | ~(t_low < t_high)
+    bad |= giant & ~(distance >= frost * 0.95)
+
+    close_in = cool & ~(distance >= hz_inner * 0.80 * (1.0 + _SLACK))
+    lock_ratio = np.abs(rotation - period) / np.maximum(period, 1e-6)
+    bad |= close_in & _exceeds(lock_ratio, 0.30)
+
+    modeled = profile >= 0
+    pidx = np.where(modeled, profile, 0)
+    locked = lock_ratio <= 0.25
+    bad |= modeled & _near(lock_ratio, 0.25)
+
+    teq = 278.0 * lum ** 0.25 / np.sqrt(distance) * (1.0 - albedo) ** 0.25
+
+    rocky = modeled & ~np.isin(pidx, [PROFILE_KEYS.index("gas_giant"), PROFILE_KEYS.index("ice_giant")])
+    volatile = (n2 + co2 + h2o + ch4 + so2) / 100.0
+    retention = np.clip(np.sqrt(np.maximum(0.05, mass / np.maximum(radius, 0.05))), 0.45, 2.4)
+    escape = np.clip(1.0 - np.maximum(0.0, teq - 420.0) / 900.0 * (1.1 / retention), 0.18, 1.0)
+    condensation = np.clip(0.55 + (np.minimum(teq, 420.0) / 420.0) * 0.65, 0.35, 1.2)
+    modeled_pressure = np.maximum(
+        0.02,
+        _profile_column(PRESSURE_BASE_COLUMNS)[pidx] * gravity * (0.65 + volatile) * retention * escape * condensation,
+    )
+    profiles = [PLANET_PROFILES[key] for key in PROFILE_KEYS]
+    modeled_pressure = np.clip(
+        modeled_pressure,
+        np.array([profile.pressure_range[0] for profile in profiles])[pidx],
+        np.array([profile.pressure_range[1] for profile in profiles])[pidx],
+    )
+    pressure_error = np.abs(modeled_pressure - pressure) / np.maximum(modeled_pressure, 0.05)
+    bad |= rocky & (_exceeds(pressure_error, 0.75) | ~np.isfinite(pressure_error))
+
+    greenhouse = np.clip(
+        (1.35 * co2 + 2.05 * ch4 + 1.30 * h2o + 1.10 * so2 + 1.50 * nh3 + 0.10 * n2) / 100.0,
+        0.0,
+        1.8,
+    )
+    capped_gravity = np.minimum(2.0, gravity)
+    modeled_mean = np.select(
+        [pidx == PROFILE_KEYS.index("gas_giant"), pidx == PROFILE_KEYS.index("ice_giant")],
+        [teq + 14.0 + 18.0 * capped_gravity, teq + 9.0 + 10.0 * capped_gravity],
+        teq
+        + _profile_column(GREENHOUSE_SCALES)[pidx] * np.log1p(np.maximum(0.01, pressure)) * (0.22 + greenhouse)
+        + 4.0 * np.log1p(np.maximum(0.01, n2 / 30.0))
+        + np.where(locked, 6.0, 0.0),
+    )
+    transport = np.clip(
+        0.55 + 0.22 * np.log1p(np.maximum(0.01, pressure)) + 0.15 * h2o / 100.0 + 0.10 * n2 / 100.0,
+        0.25,
+        1.25,
+    )
+    amplitude = np.maximum(
+        6.0,
+        np.where(
+            locked,
+            _profile_column(LOCKED_TEMP_AMPLITUDES)[pidx] * (1.18 - 0.55 * transport),
+            _profile_column(FREE_TEMP_AMPLITUDES)[pidx] * (0.85 + tilt / 55.0) * (1.10 - 0.35 * transport),
+        ),
+    )
+    low = np.maximum(25.0, modeled_mean - 0.56 * amplitude)
+    high = np.maximum(low + 4.0, modeled_mean + np.where(locked, 0.50, 0.44) * amplitude)
+    # profile_temp_range rounds to whole kelvin; rows sitting on a .5 edge
+    # could round differently, so leave those to the scalar path.
+    bad |= modeled & (_near(low % 1.0, 0.5) | _near(high % 1.0, 0.5))
+
+    observed_mean = (t_low + t_high) / 2.0
+    mean_error = np.abs(observed_mean - modeled_mean)
+    bad |= modeled & ~(mean_error <= np.maximum(65.0, 0.45 * modeled_mean) * (1.0 - _SLACK))
+
+    modeled_span = np.maximum(1.0, np.rint(high) - np.rint(low))
+    observed_span = np.maximum(1.0, t_high - t_low)
+    bad |= modeled & ~((observed_span <= modeled_span * 2.4) & (observed_span >= modeled_span * 0.30))
+
+    bad |= ~np.isfinite(teq) & modeled
+    return bad
@@ -0,0 +1,104 @@
+"""Opt-in stage timers and counters for the data pipeline.
+
+Pipeline code wraps its stages in ``with stage("planets.climate"):`` and bumps
+``increment("planets")``. Nothing is recorded unless a :class:`StageTimings`
+registry is active (see :func:`profiling`); while none is, ``stage`` hands
+back a shared no-op context manager, so the hooks cost a function call.
+
+Stage times are inclusive: a stage that encloses others includes their time.
+Only the current process is measured, so with ``workers=N`` the work done in
+the pool shows up as the enclosing parent stage.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+import time
+from typing import Any, Callable, Iterator
+
+
+class StageTimings:
+    """Accumulated wall time and call counts per stage, plus named counters."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.seconds: defaultdict[str, float] = defaultdict(float)
+        self.calls: defaultdict[str, int] = defaultdict(int)
+        self.counters: defaultdict[str, int] = defaultdict(int)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.seconds[name] += seconds
+        self.calls[name] += 1
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "stages": {
+                name: {"seconds": self.seconds[name], "calls": self.calls[name]}
+                for name in sorted(self.seconds, key=self.seconds.__getitem__, reverse=True)
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def format(self) -> str:
+        lines = [f"{'stage':<28}{'seconds':>10}{'calls':>12}{'us/call':>10}"]
+        for name, entry in self.report()["stages"].items():
+            per_call = entry["seconds"] / entry["calls"] * 1e6 if entry["calls"] else 0.0
+            lines.append(f"{name:<28}{entry['seconds']:>10.3f}{entry['calls']:>12}{per_call:>10.1f}")
+        lines.extend(f"{name:<28}{value:>10}" for name, value in self.counters.items())
+        return "\n".join(lines)
+
+
+class _Stage:
+    __slots__ = ("_registry", "_name", "_start")
+
+    def __init__(self, registry: StageTimings, name: str) -> None:
+        self._registry = registry
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._start = self._registry.clock()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._registry.add(self._name, self._registry.clock() - self._start)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+_active: StageTimings | None = None
+
+
+def stage(name: str) -> _Stage | _NullStage:
+    """Context manager timing ``name`` in the active registry, if any."""
+    registry = _active
+    return _NULL_STAGE if registry is None else _Stage(registry, name)
+
+
+def increment(name: str, amount: int = 1) -> None:
+    registry = _active
+    if registry is not None:
+        registry.count(name, amount)
+
+
+@contextmanager
+def profiling(registry: StageTimings | None = None) -> Iterator[StageTimings]:
+    """Activate ``registry`` (or a fresh one) for the duration of the block."""
+    global _active
+    previous = _active
+    _active = registry if registry is not None else StageTimings()
+    try:
+        yield _active
+    finally:
+        _active = previous
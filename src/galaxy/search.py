@@ -0,0 +1,512 @@
+"""Constraint-driven seed search.
+
+A query is one or more clauses joined by ``and``. A clause counts the stars
+or planets of a galaxy that meet its conditions and compares the count with
+a number; ``no`` and ``any`` are short for ``== 0`` and ``>= 1``::
+
+    planets(hab >= 70) >= 3 and no stars(cls in [O, B])
+    planets(t ~ ocean, star.cls == K, locked == false) >= 1
+
+Conditions are ``field OP value`` with ``OP`` one of ``== != >= > <= <``,
+``~`` (case-insensitive substring) or ``in [a, b, ...]``, separated by
+commas or ``and``. Planet clauses may test their star as ``star.<field>``.
+Text compares case-insensitively; ``cls`` is the spectral letter.
+
+Seeds are evaluated on the same single stream as ``generate_galaxy(seed=s)``
+(python engine), which draws every star class before the first system is
+built. That is the first pruning point: systems whose class fails a
+clause's ``cls`` conditions can never add to its count, and a star clause on
+``cls`` alone is settled outright. After each system every count is bounded
+by what has matched so far and what the remaining eligible systems could
+still add; a seed is abandoned as soon as no count in those bounds satisfies
+a clause, and accepted as soon as every count in them does.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import itertools
+from operator import eq, ge, gt, itemgetter, le, lt, ne
+import random
+import re
+from typing import Any, Callable, Iterator
+
+from galaxy.data_pipeline import (
+    EARTH_MASS_PER_JUPITER,
+    EARTH_RADIUS_PER_JUPITER,
+    _build_system,
+    _draw_star_classes,
+    build_sector_list,
+)
+
+SEARCH_CHUNK_SEEDS = 32
+SCOPES = {"planets": "planets", "planet": "planets", "stars": "stars", "star": "stars"}
+COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {">=": ge, ">": gt, "<=": le, "<": lt, "==": eq, "!=": ne}
+QUANTIFIERS = {"no": ("==", 0), "any": (">=", 1)}
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<number>-?(?:\d+\.?\d*|\.\d+))
+      | (?P<string>"[^"]*"|'[^']*')
+      | (?P<op>>=|<=|==|!=|>|<|~|[(),\[\]])
+      | (?P<word>[A-Za-z_][\w.+-]*)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _star_class(star: dict[str, Any]) -> str:
+    return str(star["cls"])[:1]
+
+
+def _planet_mass(planet: dict[str, Any]) -> float:
+    value, unit = planet["m"]
+    return value * EARTH_MASS_PER_JUPITER if unit == "Jupiter" else value
+
+
+def _planet_radius(planet: dict[str, Any]) -> float:
+    value, unit = planet["rad"]
+    return value * EARTH_RADIUS_PER_JUPITER if unit == "Jupiter" else value
+
+
+# name -> (getter, kind); kinds are "number", "text" and "flag".
+STAR_FIELDS: dict[str, tuple[Callable[[dict[str, Any]], Any], str]] = {
+    "cls": (_star_class, "text"),
+    "spectral": (itemgetter("cls"), "text"),
+    "tk": (itemgetter("tk"), "number"),
+    "lum": (itemgetter("lum"), "number"),
+    "age": (itemgetter("age"), "number"),
+    "m": (itemgetter("m"), "number"),
+    "frost": (itemgetter("frost"), "number"),
+    "mult": (itemgetter("mult"), "text"),
+}
+
+PLANET_FIELDS: dict[str, tuple[Callable[[dict[str, Any]], Any], str]] = {
+    "n": (itemgetter("n"), "text"),
+    "t": (itemgetter("t"), "text"),
+    "hab": (itemgetter("hab"), "number"),
+    "teq": (itemgetter("teq"), "number"),
+    "tmean": (itemgetter("tmean"), "number"),
+    "tmin": (lambda planet: planet["temp"][0], "number"),
+    "tmax": (lambda planet: planet["temp"][1], "number"),
+    "mass": (_planet_mass, "number"),
+    "radius": (_planet_radius, "number"),
+    "g": (itemgetter("g"), "number"),
+    "a": (itemgetter("a"), "number"),
+    "op": (itemgetter("op"), "number"),
+    "rot_days": (itemgetter("rot_days"), "number"),
+    "tilt": (itemgetter("tilt"), "number"),
+    "pb": (itemgetter("pb"), "number"),
+    "alb": (itemgetter("alb"), "number"),
+    "mag": (itemgetter("mag"), "text"),
+    "locked": (itemgetter("locked"), "flag"),
+}
+
+
+def _field(scope: str, name: str) -> tuple[str, bool, str]:
+    """``(field, on_star, kind)`` for ``name`` in a clause over ``scope``; raises ``ValueError``."""
+    on_star = scope == "stars" or name.startswith("star.")
+    field = name.removeprefix("star.") if on_star else name
+    if on_star:
+        if field not in STAR_FIELDS:
+            raise ValueError(f"Unknown star field '{name}' (expected one of {', '.join(STAR_FIELDS)}).")
+        return field, True, STAR_FIELDS[field][1]
+    if field.startswith("atm.") and len(field) > 4:
+        return field, False, "number"
+    if field not in PLANET_FIELDS:
+        raise ValueError(f"Unknown planet field '{name}' (expected one of {', '.join(PLANET_FIELDS)}, atm.<gas> or star.<field>).")
+    return field, False, PLANET_FIELDS[field][1]
+
+
+def _fold(value: Any) -> Any:
+    return value.casefold() if isinstance(value, str) else value
+
+
+class Condition:
+    """One ``field OP value`` test on a planet or star."""
+
+    def __init__(self, field: str, op: str, value: Any, *, on_star: bool, kind: str) -> None:
+        self.field = field
+        self.op = op
+        self.value = value
+        self.on_star = on_star
+        self.kind = kind
+        self._get = self._getter()
+
+    def _getter(self) -> Callable[[dict[str, Any]], Any]:
+        if self.on_star:
+            return STAR_FIELDS[self.field][0]
+        if self.field.startswith("atm."):
+            gas = self.field[4:]
+            return lambda planet: planet.get("atm", {}).get(gas, 0.0)
+        return PLANET_FIELDS[self.field][0]
+
+    # Getters may be lambdas; queries travel to worker processes without them.
+    def __getstate__(self) -> dict[str, Any]:
+        return {key: value for key, value in self.__dict__.items() if key != "_get"}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._get = self._getter()
+
+    def compare(self, actual: Any) -> bool:
+        actual = _fold(actual)
+        if self.op == "in":
+            return actual in self.value
+        if self.op == "~":
+            return self.value in actual
+        return COMPARISONS[self.op](actual, self.value)
+
+    def test(self, item: dict[str, Any], star: dict[str, Any]) -> bool:
+        return self.compare(self._get(star if self.on_star else item))
+
+
+class Clause:
+    """Count the matching stars or planets of a galaxy and compare the count with ``target``."""
+
+    def __init__(self, scope: str, conditions: list[Condition], comparison: str, target: int, text: str) -> None:
+        self.scope = scope
+        self.conditions = conditions
+        self.comparison = comparison
+        self.target = target
+        self.text = text
+        self.star_conditions = [condition for condition in conditions if condition.on_star]
+        self.planet_conditions = [condition for condition in conditions if not condition.on_star]
+        self.class_conditions = [condition for condition in self.star_conditions if condition.field == "cls"]
+        # Known exactly once the star classes are drawn.
+        self.settled_by_classes = scope == "stars" and len(self.class_conditions) == len(conditions)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def eligible(self, star_class: str) -> bool:
+        """Whether a system with this spectral letter can add to the count."""
+        return all(condition.compare(star_class) for condition in self.class_conditions)
+
+    def count(self, system: dict[str, Any]) -> int:
+        star = system["star"]
+        if not all(condition.test(star, star) for condition in self.star_conditions):
+            return 0
+        if self.scope == "stars":
+            return 1
+        return sum(all(condition.test(planet, star) for condition in self.planet_conditions) for planet in system["p"])
+
+    def verdict(self, low: int, high: int) -> bool | None:
+        """``True``/``False`` when every count in ``low..high`` does/does not satisfy the clause, else ``None``."""
+        satisfied = COMPARISONS[self.comparison]
+        target = self.target
+        if low == high:
+            return satisfied(low, target)
+        if self.comparison in (">=", ">"):
+            return True if satisfied(low, target) else False if not satisfied(high, target) else None
+        if self.comparison in ("<=", "<"):
+            return True if satisfied(high, target) else False if not satisfied(low, target) else None
+        inside = low <= target <= high
+        if self.comparison == "==":
+            return None if inside else False
+        return None if inside else True
+
+
+class Query:
+    def __init__(self, clauses: list[Clause], text: str) -> None:
+        self.clauses = clauses
+        self.text = text
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens: list[tuple[str, str, int]] = []
+        position = 0
+        while True:
+            match = _TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                if text[position:].strip():
+                    offset = len(text) - len(text[position:].lstrip())
+                    raise ValueError(f"Unexpected '{text[offset]}' at position {offset + 1}.")
+                break
+            kind = match.lastgroup or ""
+            self.tokens.append((kind, match.group(kind), match.start(kind)))
+            position = match.end()
+        self.index = 0
+
+    def peek(self) -> tuple[str, str, int] | None:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def take(self, expected: str) -> tuple[str, str, int]:
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Query ended early; expected {expected}.")
+        self.index += 1
+        return token
+
+    def fail(self, token: tuple[str, str, int], expected: str) -> ValueError:
+        return ValueError(f"Expected {expected} at position {token[2] + 1}, got '{token[1]}'.")
+
+    def at(self, text: str) -> bool:
+        token = self.peek()
+        return token is not None and token[1].lower() == text
+
+    def expect(self, text: str) -> None:
+        token = self.take(f"'{text}'")
+        if token[1].lower() != text:
+            raise self.fail(token, f"'{text}'")
+
+    def end(self) -> int:
+        token = self.peek()
+        return token[2] if token is not None else len(self.text)
+
+    def query(self) -> Query:
+        clauses = [self.clause()]
+        while self.at("and"):
+            self.index += 1
+            clauses.append(self.clause())
+        token = self.peek()
+        if token is not None:
+            raise self.fail(token, "'and' or end of query")
+        return Query(clauses, self.text.strip())
+
+    def clause(self) -> Clause:
+        start = self.end()
+        quantifier = None
+        token = self.peek()
+        if token is not None and token[1].lower() in QUANTIFIERS:
+            quantifier = QUANTIFIERS[token[1].lower()]
+            self.index += 1
+        token = self.take("'planets' or 'stars'")
+        scope = SCOPES.get(token[1].lower()) if token[0] == "word" else None
+        if scope is None:
+            raise self.fail(token, "'planets' or 'stars'")
+        conditions: list[Condition] = []
+        if self.at("("):
+            self.index += 1
+            conditions.append(self.condition(scope))
+            while self.at(",") or self.at("and"):
+                self.index += 1
+                conditions.append(self.condition(scope))
+            self.expect(")")
+        if quantifier is None:
+            token = self.take("a comparison")
+            if token[1] not in COMPARISONS:
+                raise self.fail(token, "a comparison (>=, >, <=, <, ==, !=)")
+            number = self.take("a count")
+            if number[0] != "number" or not number[1].lstrip("-").isdigit():
+                raise self.fail(number, "a whole number")
+            quantifier = (token[1], int(number[1]))
+        comparison, target = quantifier
+        return Clause(scope, conditions, comparison, target, self.text[start:self.end()].strip())
+
+    def condition(self, scope: str) -> Condition:
+        token = self.take("a field")
+        if token[0] != "word":
+            raise self.fail(token, "a field")
+        field, on_star, kind = _field(scope, token[1])
+        op_token = self.take("an operator")
+        op = op_token[1].lower()
+        if op not in COMPARISONS and op not in ("~", "in"):
+            raise self.fail(op_token, "an operator (==, !=, >=, >, <=, <, ~, in)")
+        if op == "in":
+            self.expect("[")
+            values = [self.value(kind)]
+            while self.at(","):
+                self.index += 1
+                values.append(self.value(kind))
+            self.expect("]")
+            return Condition(field, op, frozenset(values), on_star=on_star, kind=kind)
+        if op == "~" and kind != "text":
+            raise ValueError(f"'~' needs a text field; '{token[1]}' is a {kind}.")
+        if op in ("<", "<=", ">", ">=") and kind != "number":
+            raise ValueError(f"'{op}' needs a numeric field; '{token[1]}' is a {kind}.")
+        return Condition(field, op, self.value(kind), on_star=on_star, kind=kind)
+
+    def value(self, kind: str) -> Any:
+        token = self.take("a value")
+        token_kind, text, _ = token
+        if kind == "number":
+            if token_kind != "number":
+                raise self.fail(token, "a number")
+            return float(text)
+        if kind == "flag":
+            if text.lower() not in ("true", "false"):
+                raise self.fail(token, "true or false")
+            return text.lower() == "true"
+        if token_kind == "string":
+            return text[1:-1].casefold()
+        if token_kind in ("word", "number"):
+            return text.casefold()
+        raise self.fail(token, "a value")
+
+
+def parse_query(text: str) -> Query:
+    """Parse a search query; raises ``ValueError`` describing the first problem."""
+    return _Parser(text).query()
+
+
+@dataclass
+class SearchMatch:
+    seed: int
+    counts: list[int]
+    # False where the seed was accepted before the count was final; the
+    # count is then a lower bound.
+    exact: list[bool]
+
+    def format(self, query: Query) -> str:
+        counts = ", ".join(
+            f"{clause}: {count}{'' if exact else '+'}"
+            for clause, count, exact in zip(query.clauses, self.counts, self.exact)
+        )
+        return f"seed {self.seed}  {counts}"
+
+
+class SearchSummary:
+    """Matches in seed order plus how early the other seeds were decided."""
+
+    def __init__(self) -> None:
+        self.matches: list[SearchMatch] = []
+        self.seeds = 0
+        self.rejected_at_classes = 0
+        self.rejected_early = 0
+        self.accepted_early = 0
+        self.systems_built = 0
+        self.systems_total = 0
+
+    def merge(self, other: SearchSummary) -> None:
+        self.matches.extend(other.matches)
+        self.seeds += other.seeds
+        self.rejected_at_classes += other.rejected_at_classes
+        self.rejected_early += other.rejected_early
+        self.accepted_early += other.accepted_early
+        self.systems_built += other.systems_built
+        self.systems_total += other.systems_total
+
+    def format(self, query: Query) -> str:
+        lines = [match.format(query) for match in self.matches]
+        lines.append(
+            f"Matches: {len(self.matches)} in {self.seeds} seeds; rejected {self.rejected_at_classes} "
+            f"after star classes and {self.rejected_early} mid-galaxy, accepted {self.accepted_early} early; "
+            f"built {self.systems_built} of {self.systems_total} systems"
+        )
+        return "\n".join(lines)
+
+
+def _evaluate_seed(
+    seed: int,
+    query: Query,
+    sector_count: int,
+    system_count: int,
+    planets_per_system: int,
+) -> tuple[bool, int, list[int], list[int]]:
+    """``(matched, systems built, lower bounds, upper bounds)`` for one seed."""
+    rng = random.Random(seed)
+    sector_names = [sector["n"] for sector in build_sector_list(rng, sector_count)]
+    star_classes = _draw_star_classes(rng, system_count)
+
+    clauses = query.clauses
+    # generate_planets always places at least one planet.
+    weights = [1 if clause.scope == "stars" else max(planets_per_system, 1) for clause in clauses]
+    eligible = []
+    for clause in clauses:
+        by_class = {star_class: clause.eligible(star_class) for star_class in set(star_classes)}
+        eligible.append([by_class[star_class] for star_class in star_classes])
+    low = [0] * len(clauses)
+    high = [weight * sum(flags) for weight, flags in zip(weights, eligible)]
+    open_clauses = []
+    for k, clause in enumerate(clauses):
+        if clause.settled_by_classes:
+            low[k] = high[k]
+        else:
+            open_clauses.append(k)
+
+    def decide() -> bool | None:
+        verdicts = [clause.verdict(low[k], high[k]) for k, clause in enumerate(clauses)]
+        if False in verdicts:
+            return False
+        return True if all(verdicts) else None
+
+    decided = decide()
+    built = 0
+    while decided is None and built < system_count:
+        i = built
+        system = _build_system(rng, i, star_classes[i], sector_names[i % len(sector_names)], planets_per_system, "python")
+        built += 1
+        for k in open_clauses:
+            if eligible[k][i]:
+                count = clauses[k].count(system)
+                low[k] += count
+                high[k] += count - weights[k]
+        decided = decide()
+    return bool(decided), built, low, high
+
+
+def _search_chunk(
+    seeds: range,
+    query: Query,
+    sector_count: int,
+    system_count: int,
+    planets_per_system: int,
+    limit: int,
+) -> SearchSummary:
+    summary = SearchSummary()
+    for seed in seeds:
+        matched, built, low, high = _evaluate_seed(seed, query, sector_count, system_count, planets_per_system)
+        summary.seeds += 1
+        summary.systems_built += built
+        summary.systems_total += system_count
+        if matched:
+            summary.accepted_early += built < system_count
+            summary.matches.append(SearchMatch(seed, low, [a == b for a, b in zip(low, high)]))
+            if len(summary.matches) >= limit:
+                break
+        elif built == 0:
+            summary.rejected_at_classes += 1
+        elif built < system_count:
+            summary.rejected_early += 1
+    return summary
+
+
+def search_seeds(
+    query: Query | str,
+    seeds: range,
+    *,
+    limit: int = 10,
+    sector_count: int = 6,
+    system_count: int = 3,
+    planets_per_system: int = 6,
+    workers: int | None = None,
+) -> SearchSummary:
+    """Find the first ``limit`` seeds in ``seeds`` whose galaxy satisfies ``query``.
+
+    Galaxies are those of ``generate_galaxy(seed=s)`` with the python engine.
+    ``workers=N`` searches seed chunks on a process pool with a bounded
+    window in flight; chunks are merged in seed order and the rest are
+    cancelled once ``limit`` matches are in, so the result (statistics
+    included) is the same for every ``workers`` value.
+    """
+    if isinstance(query, str):
+        query = parse_query(query)
+    if limit < 1:
+        raise ValueError("limit must be at least 1.")
+    chunks: Iterator[range] = (seeds[start:start + SEARCH_CHUNK_SEEDS] for start in range(0, len(seeds), SEARCH_CHUNK_SEEDS))
+    args = (query, sector_count, system_count, planets_per_system, limit)
+    summary = SearchSummary()
+    if workers is not None and workers > 1 and len(seeds) > SEARCH_CHUNK_SEEDS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque(pool.submit(_search_chunk, chunk, *args) for chunk in itertools.islice(chunks, workers * 2))
+            while pending and len(summary.matches) < limit:
+                summary.merge(pending.popleft().result())
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.append(pool.submit(_search_chunk, chunk, *args))
+            pool.shutdown(cancel_futures=True)
+    else:
+        for chunk in chunks:
+            summary.merge(_search_chunk(chunk, *args))
+            if len(summary.matches) >= limit:
+                break
+    del summary.matches[limit:]
+    return summary
@@ -0,0 +1,62 @@
+"""JSON encoding for exports and API responses.
+
+Two layouts are supported: ``pretty`` (two-space indentation, the historical
+export format) and ``compact`` (no whitespace at all). Encoding goes through
+orjson when it is installed and through the stdlib encoder otherwise. For the
+generator's output (ASCII text, short rounded floats) both backends produce
+identical text, so the backend only changes speed there. Other values can
+encode differently: orjson writes ``1e-5`` as ``0.00001`` where the stdlib
+writes ``1e-05``, and it does not escape non-ASCII characters.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+JSON_STYLES = ("pretty", "compact")
+JSON_BACKENDS = ("orjson", "stdlib")
+
+
+def orjson_available() -> bool:
+    return orjson is not None
+
+
+def default_backend() -> str:
+    return "orjson" if orjson_available() else "stdlib"
+
+
+def dumps(
+    value: Any,
+    style: str = "pretty",
+    *,
+    backend: str | None = None,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Encode ``value`` in ``style``; ``backend=None`` picks the fastest available.
+
+    ``default`` converts values JSON cannot hold, as in :func:`json.dumps`.
+    With orjson it also receives datetimes and dataclasses, and non-string
+    keys are converted, so both backends encode such values the same way.
+    Raises ``ValueError`` for an unknown style or an unavailable backend.
+    """
+    if style not in JSON_STYLES:
+        raise ValueError(f"Unknown JSON style {style!r}; expected one of {', '.join(JSON_STYLES)}.")
+    backend = backend or default_backend()
+    if backend == "orjson":
+        if orjson is None:
+            raise ValueError("The orjson backend is not installed.")
+        option = orjson.OPT_INDENT_2 if style == "pretty" else 0
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(value, default=default, option=option).decode("utf-8")
+    if backend != "stdlib":
+        raise ValueError(f"Unknown JSON backend {backend!r}; expected one of {', '.join(JSON_BACKENDS)}.")
+    if style == "pretty":
+        return json.dumps(value, indent=2, default=default)
+    return json.dumps(value, separators=(",", ":"), default=default)
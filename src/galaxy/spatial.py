@@ -0,0 +1,114 @@
+"""Static 2-D k-d tree for sector map queries.
+
+Sector positions (the ``c`` pair) are indexed once after generation. The tree
+is stored implicitly: points are permuted so every subrange ``[lo, hi)`` is a
+node whose split point sits at ``(lo + hi) // 2``, and ranges of at most
+``LEAF_SIZE`` points are scanned linearly.
+"""
+
+from __future__ import annotations
+
+from array import array
+import heapq
+import math
+from typing import Any, Iterable, Sequence
+
+LEAF_SIZE = 16
+
+
+class KDTree:
+    """Range and nearest-neighbour queries over a fixed set of 2-D points.
+
+    Query results are indexes into the sequence the tree was built from.
+    """
+
+    def __init__(self, points: Iterable[Sequence[float]]) -> None:
+        coords = [(float(point[0]), float(point[1])) for point in points]
+        self._size = len(coords)
+        columns = ([x for x, _ in coords], [y for _, y in coords])
+        order = list(range(self._size))
+        # Split axis and value for each internal node, stored at the node's
+        # split index (the point there moves when its child range is sorted).
+        self._axes = bytearray(self._size)
+        self._splits = array("d", bytes(8 * self._size))
+
+        stack = [(0, self._size)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= LEAF_SIZE:
+                continue
+            segment = order[lo:hi]
+            # Split on the axis with the wider spread; sector layouts are far
+            # from uniform.
+            xs = list(map(columns[0].__getitem__, segment))
+            ys = list(map(columns[1].__getitem__, segment))
+            axis = 0 if max(xs) - min(xs) >= max(ys) - min(ys) else 1
+            order[lo:hi] = sorted(segment, key=columns[axis].__getitem__)
+            mid = (lo + hi) // 2
+            self._axes[mid] = axis
+            self._splits[mid] = columns[axis][order[mid]]
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+
+        self._order = array("q", order)
+        self._xs = array("d", map(columns[0].__getitem__, order))
+        self._ys = array("d", map(columns[1].__getitem__, order))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def in_box(self, xmin: float, ymin: float, xmax: float, ymax: float) -> list[int]:
+        """Indexes of points with ``xmin <= x <= xmax`` and ``ymin <= y <= ymax``."""
+        xs, ys, order, axes, splits = self._xs, self._ys, self._order, self._axes, self._splits
+        found: list[int] = []
+        stack = [(0, self._size)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= LEAF_SIZE:
+                found.extend(order[i] for i in range(lo, hi) if xmin <= xs[i] <= xmax and ymin <= ys[i] <= ymax)
+                continue
+            mid = (lo + hi) // 2
+            split = splits[mid]
+            low, high = (ymin, ymax) if axes[mid] else (xmin, xmax)
+            # Points equal to the split value can sit on either side.
+            if low <= split:
+                stack.append((lo, mid))
+            if high >= split:
+                stack.append((mid, hi))
+        found.sort()
+        return found
+
+    def nearest(self, x: float, y: float, k: int = 1) -> list[tuple[float, int]]:
+        """The ``k`` closest points as ``(distance, index)``, nearest first."""
+        if k <= 0 or not self._size:
+            return []
+        xs, ys, order, axes, splits = self._xs, self._ys, self._order, self._axes, self._splits
+        # Max-heap of (-squared distance, -index) holding the best k so far;
+        # ties prefer the lower index.
+        best: list[tuple[float, int]] = []
+        stack: list[tuple[float, int, int]] = [(0.0, 0, self._size)]
+        while stack:
+            bound, lo, hi = stack.pop()
+            if len(best) == k and bound > -best[0][0]:
+                continue
+            if hi - lo <= LEAF_SIZE:
+                for i in range(lo, hi):
+                    dist = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+                    entry = (-dist, -order[i])
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+                continue
+            mid = (lo + hi) // 2
+            diff = (y if axes[mid] else x) - splits[mid]
+            near, far = ((mid, hi), (lo, mid)) if diff >= 0 else ((lo, mid), (mid, hi))
+            # Push the far side first so the near side is searched first.
+            stack.append((max(bound, diff * diff), *far))
+            stack.append((bound, *near))
+        return [(math.sqrt(-neg_dist), -neg_index) for neg_dist, neg_index in sorted(best, reverse=True)]
+
+
+def build_sector_tree(sectors: Sequence[dict[str, Any]]) -> KDTree:
+    """Index sectors by their ``c`` map coordinate."""
+    return KDTree(sector["c"] for sector in sectors)
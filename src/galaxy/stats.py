@@ -0,0 +1,175 @@
+"""Mergeable streaming aggregates.
+
+Each aggregate folds values in one at a time with O(1) (or bounded) state,
+and ``a.merge(b)`` gives the same result as feeding ``b``'s values into
+``a``. Worker processes can summarise their share of the data and the parent
+combines the summaries, so no raw data has to be kept or shipped.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+import math
+from typing import Any
+
+
+class Moments:
+    """Count, mean, variance (Welford; Chan et al. to merge), min and max."""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: Moments) -> None:
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> dict[str, Any]:
+        if not self.count:
+            return {"count": 0}
+        return {"count": self.count, "mean": self.mean, "stdev": self.stdev, "min": self.min, "max": self.max}
+
+
+class Histogram:
+    """Fixed-width bins over ``[low, high)`` plus underflow and overflow counts."""
+
+    __slots__ = ("low", "high", "counts", "underflow", "overflow", "_width")
+
+    def __init__(self, low: float, high: float, bins: int) -> None:
+        if not high > low or bins < 1:
+            raise ValueError("A histogram needs high > low and at least one bin.")
+        self.low = low
+        self.high = high
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+        self._width = (high - low) / bins
+
+    def add(self, value: float) -> None:
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            self.counts[min(int((value - self.low) / self._width), len(self.counts) - 1)] += 1
+
+    def merge(self, other: Histogram) -> None:
+        if (other.low, other.high, len(other.counts)) != (self.low, self.high, len(self.counts)):
+            raise ValueError("Only histograms with identical bins can be merged.")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"low": self.low, "high": self.high, "counts": self.counts, "underflow": self.underflow, "overflow": self.overflow}
+
+
+class QuantileSketch:
+    """Relative-error quantile sketch (DDSketch with unbounded log buckets).
+
+    Values are counted in buckets ``(gamma**(k-1), gamma**k]`` with
+    ``gamma = (1 + a) / (1 - a)``, so any returned quantile is within a
+    relative error ``a`` of a true value at that rank. Merging adds bucket
+    counts and loses nothing. Zero and near-zero values share one bucket;
+    negative values use mirrored buckets.
+    """
+
+    __slots__ = ("relative_accuracy", "count", "zeros", "positive", "negative", "min", "max", "_log_gamma")
+
+    MIN_INDEXABLE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.count = 0
+        self.zeros = 0
+        self.positive: Counter[int] = Counter()
+        self.negative: Counter[int] = Counter()
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # The point with equal relative error to both bucket edges.
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma ** key / (gamma + 1)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value > self.MIN_INDEXABLE:
+            self.positive[self._key(value)] += 1
+        elif value < -self.MIN_INDEXABLE:
+            self.negative[self._key(-value)] += 1
+        else:
+            self.zeros += 1
+
+    def merge(self, other: QuantileSketch) -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        self.count += other.count
+        self.zeros += other.zeros
+        self.positive.update(other.positive)
+        self.negative.update(other.negative)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q`` quantile (``0 <= q <= 1``); ``None`` when empty."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return self._clamp(-self._value(key))
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._clamp(self._value(key))
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    def to_dict(self, quantiles: tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> dict[str, Any]:
+        return {f"p{round(q * 100):02d}": self.quantile(q) for q in quantiles}
@@ -0,0 +1,191 @@
+"""Seed sweeps: summary statistics over an ensemble of generated galaxies.
+
+A sweep generates one galaxy per seed, exactly as ``generate_galaxy(seed=s)``
+would, and folds every system into mergeable aggregates from
+:mod:`galaxy.stats` as it is produced, so no galaxy is kept. Seeds are cut
+into fixed chunks that workers summarise independently. Chunk summaries are
+merged in seed order, so the report is identical for every ``--jobs`` value.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+from typing import Any, Iterable
+
+from galaxy.data_pipeline import iter_systems
+from galaxy.stats import Histogram, Moments, QuantileSketch
+
+SWEEP_CHUNK_SEEDS = 16
+ALL_CLASSES = "all"
+HAB_BINS = (0, 100, 20)
+
+
+def parse_seed_range(text: str) -> range:
+    """Parse ``START:STOP`` (stop exclusive) or a single seed; raises ``ValueError``."""
+    try:
+        if ":" in text:
+            start, stop = (int(part) for part in text.split(":"))
+        else:
+            start = int(text)
+            stop = start + 1
+    except ValueError:
+        raise ValueError(f"Expected seeds as START:STOP or a single seed, got '{text}'.") from None
+    if stop <= start:
+        raise ValueError(f"Seed range '{text}' is empty.")
+    return range(start, stop)
+
+
+class GroupSummary:
+    """Aggregates for the systems of one star class (or of all classes)."""
+
+    def __init__(self) -> None:
+        self.systems = 0
+        self.planets = 0
+        self.locked = 0
+        self.types: Counter[str] = Counter()
+        self.hab = Moments()
+        self.hab_histogram = Histogram(*HAB_BINS)
+        self.hab_quantiles = QuantileSketch()
+        self.teq = Moments()
+        self.teq_quantiles = QuantileSketch()
+
+    def add_system(self, system: dict[str, Any]) -> None:
+        self.systems += 1
+        for planet in system.get("p", []):
+            self.planets += 1
+            self.locked += bool(planet.get("locked"))
+            self.types[planet.get("t")] += 1
+            self.hab.add(planet["hab"])
+            self.hab_histogram.add(planet["hab"])
+            self.hab_quantiles.add(planet["hab"])
+            self.teq.add(planet["teq"])
+            self.teq_quantiles.add(planet["teq"])
+
+    def merge(self, other: GroupSummary) -> None:
+        self.systems += other.systems
+        self.planets += other.planets
+        self.locked += other.locked
+        self.types.update(other.types)
+        self.hab.merge(other.hab)
+        self.hab_histogram.merge(other.hab_histogram)
+        self.hab_quantiles.merge(other.hab_quantiles)
+        self.teq.merge(other.teq)
+        self.teq_quantiles.merge(other.teq_quantiles)
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "systems": self.systems,
+            "planets": self.planets,
+            "locked_fraction": self.locked / self.planets if self.planets else None,
+            "types": {name: count / self.planets for name, count in self.types.most_common()},
+            "hab": {**self.hab.to_dict(), **self.hab_quantiles.to_dict(), "histogram": self.hab_histogram.to_dict()},
+            "teq": {**self.teq.to_dict(), **self.teq_quantiles.to_dict()},
+        }
+
+
+class SweepSummary:
+    """Per-star-class aggregates plus per-galaxy statistics across a sweep."""
+
+    def __init__(self) -> None:
+        self.seeds = 0
+        self.groups: dict[str, GroupSummary] = {}
+        self.m_fraction = Moments()
+
+    def _group(self, name: str) -> GroupSummary:
+        group = self.groups.get(name)
+        if group is None:
+            group = self.groups[name] = GroupSummary()
+        return group
+
+    def add_galaxy(self, systems: Iterable[dict[str, Any]]) -> None:
+        everything = self._group(ALL_CLASSES)
+        count = m_count = 0
+        for system in systems:
+            star_class = str(system.get("star", {}).get("cls", "?"))[:1]
+            self._group(star_class).add_system(system)
+            everything.add_system(system)
+            count += 1
+            m_count += star_class == "M"
+        self.seeds += 1
+        if count:
+            self.m_fraction.add(m_count / count)
+
+    def merge(self, other: SweepSummary) -> None:
+        self.seeds += other.seeds
+        for name, group in other.groups.items():
+            self._group(name).merge(group)
+        self.m_fraction.merge(other.m_fraction)
+
+    def _ordered_groups(self) -> list[str]:
+        classes = sorted((name for name in self.groups if name != ALL_CLASSES), key=lambda name: -self.groups[name].systems)
+        return classes + [ALL_CLASSES] if ALL_CLASSES in self.groups else classes
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "seeds": self.seeds,
+            "m_fraction_per_galaxy": self.m_fraction.to_dict(),
+            "star_classes": {name: self.groups[name].report() for name in self._ordered_groups()},
+        }
+
+    def format(self) -> str:
+        everything = self.groups.get(ALL_CLASSES, GroupSummary())
+        lines = [
+            f"Sweep: {self.seeds} seeds, {everything.systems} systems, {everything.planets} planets",
+            f"{'class':<6}{'systems':>10}{'planets':>11}{'locked':>8}{'hab mean':>10}{'sd':>7}{'p50':>6}{'p95':>6}{'teq p50':>9}  top types",
+        ]
+        for name in self._ordered_groups():
+            group = self.groups[name]
+            if not group.planets:
+                continue
+            top = ", ".join(f"{label} {count / group.planets:.0%}" for label, count in group.types.most_common(3))
+            lines.append(
+                f"{name:<6}{group.systems:>10}{group.planets:>11}{group.locked / group.planets:>8.1%}"
+                f"{group.hab.mean:>10.1f}{group.hab.stdev:>7.1f}{group.hab_quantiles.quantile(0.5):>6.0f}"
+                f"{group.hab_quantiles.quantile(0.95):>6.0f}{group.teq_quantiles.quantile(0.5):>9.0f}  {top}"
+            )
+        if self.m_fraction.count:
+            lines.append(
+                f"M-star fraction per galaxy: mean {self.m_fraction.mean:.3f} ± {self.m_fraction.stdev:.3f} "
+                f"[{self.m_fraction.min:.3f}, {self.m_fraction.max:.3f}]"
+            )
+        return "\n".join(lines)
+
+
+def _sweep_chunk(seeds: range, sector_count: int, system_count: int, planets_per_system: int, engine: str) -> SweepSummary:
+    summary = SweepSummary()
+    for seed in seeds:
+        summary.add_galaxy(
+            iter_systems(
+                seed=seed,
+                sector_count=sector_count,
+                system_count=system_count,
+                planets_per_system=planets_per_system,
+                engine=engine,
+            )
+        )
+    return summary
+
+
+def sweep_seeds(
+    seeds: range,
+    *,
+    sector_count: int = 6,
+    system_count: int = 3,
+    planets_per_system: int = 6,
+    engine: str = "python",
+    workers: int | None = None,
+) -> SweepSummary:
+    """Summarise one generated galaxy per seed; ``workers=N`` spreads seed chunks over processes."""
+    chunks = [seeds[start:start + SWEEP_CHUNK_SEEDS] for start in range(0, len(seeds), SWEEP_CHUNK_SEEDS)]
+    args = (sector_count, system_count, planets_per_system, engine)
+    summary = SweepSummary()
+    if workers is not None and workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial in pool.map(_sweep_chunk, chunks, *map(itertools.repeat, args)):
+                summary.merge(partial)
+    else:
+        for chunk in chunks:
+            summary.merge(_sweep_chunk(chunk, *args))
+    return summary
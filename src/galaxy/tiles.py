@@ -0,0 +1,100 @@
+"""Procedural galaxy tiles generated on demand from the master seed.
+
+The map square ``[-1, 1] x [-1, 1]`` is cut into quadtree tiles: tile
+``(z, x, y)`` spans ``2 / 2**z`` on each side. Every tile owns a handful of
+*anchor* systems placed inside it from ``derive_seed(seed, "tile", z, x, y)``.
+A tile request returns the anchors of the tile and of all its ancestors that
+fall inside its bounds, so zooming in only adds systems and every tile holds
+about ``4 / 3 * SYSTEMS_PER_TILE`` systems at any zoom. Each system is built
+from its own derived seed with the regular star and planet physics, so a tile
+never depends on which other tiles were generated.
+
+Only anchors and a bounded number of finished tiles are cached. Finished
+tiles are kept as compact JSON text and decoded on every request, so the
+cache stays small and callers can mutate what they get back.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import json
+import math
+import random
+from typing import Any
+
+from galaxy.data_pipeline import SECTOR_TEMPLATES, STAR_CLASS_SAMPLER, _build_system, derive_seed
+from galaxy.serialization import dumps
+
+MAX_TILE_ZOOM = 24
+SYSTEMS_PER_TILE = 8
+MIN_PLANETS, MAX_PLANETS = 3, 8
+TILE_CACHE_SIZE = 4096
+FINISHED_TILE_CACHE_SIZE = 256
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """``(xmin, ymin, xmax, ymax)`` of a tile in map coordinates."""
+    if not 0 <= z <= MAX_TILE_ZOOM or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise ValueError(f"Tile {z}/{x}/{y} is outside the map (zoom 0-{MAX_TILE_ZOOM}).")
+    width = 2.0 / 2 ** z
+    return (-1.0 + x * width, -1.0 + y * width, -1.0 + (x + 1) * width, -1.0 + (y + 1) * width)
+
+
+def _nearest_sector(px: float, py: float) -> str:
+    return min(SECTOR_TEMPLATES, key=lambda sector: math.dist(sector["c"], (px, py)))["n"]
+
+
+@lru_cache(maxsize=TILE_CACHE_SIZE)
+def _tile_anchors(seed: int, z: int, x: int, y: int) -> tuple[tuple[float, float], ...]:
+    """Positions of the systems a tile owns; cheap enough to compute for every ancestor."""
+    xmin, ymin, xmax, ymax = tile_bounds(z, x, y)
+    rng = random.Random(derive_seed(seed, "tile", z, x, y))
+    count = rng.randint(SYSTEMS_PER_TILE // 2, SYSTEMS_PER_TILE * 3 // 2)
+    return tuple((rng.uniform(xmin, xmax), rng.uniform(ymin, ymax)) for _ in range(count))
+
+
+def _tile_system(seed: int, z: int, x: int, y: int, slot: int) -> dict[str, Any]:
+    px, py = _tile_anchors(seed, z, x, y)[slot]
+    system_seed = derive_seed(seed, "tile-system", z, x, y, slot)
+    rng = random.Random(system_seed)
+    system = _build_system(
+        rng,
+        system_seed % 2 ** 31,
+        STAR_CLASS_SAMPLER.sample(rng),
+        _nearest_sector(px, py),
+        rng.randint(MIN_PLANETS, MAX_PLANETS),
+        "python",
+    )
+    # Procedural names repeat across an unbounded map; the tile path does not.
+    system["id"] = f"{system['id']}-{z}-{x}-{y}-{slot}"
+    system["pos"] = [round(px, 6), round(py, 6)]
+    return system
+
+
+def generate_tile(seed: int, z: int, x: int, y: int) -> dict[str, Any]:
+    """Systems inside tile ``(z, x, y)``, including those anchored by ancestor tiles.
+
+    Every call returns a fresh object. Raises ``ValueError`` for coordinates
+    outside the map.
+    """
+    tile_bounds(z, x, y)
+    return json.loads(_tile_text(seed, z, x, y))
+
+
+@lru_cache(maxsize=FINISHED_TILE_CACHE_SIZE)
+def _tile_text(seed: int, z: int, x: int, y: int) -> str:
+    xmin, ymin, xmax, ymax = bounds = tile_bounds(z, x, y)
+    systems = []
+    for level in range(z + 1):
+        shift = z - level
+        ax, ay = x >> shift, y >> shift
+        for slot, (px, py) in enumerate(_tile_anchors(seed, level, ax, ay)):
+            # Half-open bounds so a system on a shared edge belongs to one tile.
+            if xmin <= px < xmax and ymin <= py < ymax:
+                systems.append(_tile_system(seed, level, ax, ay, slot))
+    return dumps({"tile": [z, x, y], "bounds": list(bounds), "systems": systems}, "compact")
+
+
+def clear_tile_cache() -> None:
+    _tile_anchors.cache_clear()
+    _tile_text.cache_clear()
@@ -0,0 +1,112 @@
+"""Content hashing and precompression for the static web bundle.
+
+``precompress_assets`` writes ``.gz`` (and ``.br`` when the optional
+``brotli`` package is installed) siblings next to text assets at build time;
+the Flask app serves them to clients that accept the encoding.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import gzip
+import hashlib
+from pathlib import Path
+import re
+
+try:  # pragma: no cover - optional dependency
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+_DECODE_ERRORS: tuple[type[BaseException], ...] = (OSError, EOFError, ValueError)
+if brotli is not None:  # pragma: no cover - optional dependency
+    _DECODE_ERRORS += (brotli.error,)
+
+COMPRESSIBLE_SUFFIXES = frozenset({".css", ".html", ".js", ".json", ".svg", ".txt"})
+MIN_COMPRESS_BYTES = 1024
+# Preferred first when the client accepts several encodings.
+ENCODING_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+
+def is_hashed_asset(name: str) -> bool:
+    """True for fingerprinted names such as ``app.3f9c2a1b.js``."""
+    return _HASHED_NAME.search(name) is not None
+
+
+@lru_cache(maxsize=256)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def content_hash(path: str | Path) -> str:
+    """Hex digest of a file's bytes, cached until its mtime or size changes."""
+    stat = Path(path).stat()
+    return _hash_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _decompress(encoding: str, data: bytes) -> bytes | None:
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(data)
+    return None
+
+
+@lru_cache(maxsize=256)
+def _sibling_matches(encoding: str, sibling: str, mtime_ns: int, size: int, source_hash: str) -> bool:
+    try:
+        raw = _decompress(encoding, Path(sibling).read_bytes())
+    except _DECODE_ERRORS:
+        return False
+    return raw is not None and hashlib.blake2b(raw, digest_size=16).hexdigest() == source_hash
+
+
+def _is_current(encoding: str, sibling: Path, source_hash: str) -> bool:
+    if not sibling.is_file():
+        return False
+    stat = sibling.stat()
+    return _sibling_matches(encoding, str(sibling), stat.st_mtime_ns, stat.st_size, source_hash)
+
+
+def compressed_sibling(path: Path, accepted: set[str]) -> tuple[str, Path] | None:
+    """Return ``(encoding, sibling)`` for a precompressed variant of ``path``.
+
+    Siblings are checked once against the source's content hash (checkouts do
+    not preserve mtimes), so a stale ``.gz`` is never served.
+    """
+    source_hash = content_hash(path)
+    for encoding, suffix in ENCODING_SUFFIXES:
+        sibling = path.with_name(path.name + suffix)
+        if encoding in accepted and _is_current(encoding, sibling, source_hash):
+            return encoding, sibling
+    return None
+
+
+def precompress_assets(directory: str | Path) -> list[Path]:
+    """Write compressed siblings for text assets in ``directory``; return new files."""
+    written: list[Path] = []
+    for path in sorted(Path(directory).rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        raw = path.read_bytes()
+        if len(raw) < MIN_COMPRESS_BYTES:
+            continue
+        source_hash = content_hash(path)
+        variants = {"gzip": lambda: gzip.compress(raw, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants["br"] = lambda: brotli.compress(raw, quality=11)
+        for encoding, suffix in ENCODING_SUFFIXES:
+            if encoding not in variants:
+                continue
+            target = path.with_name(path.name + suffix)
+            if _is_current(encoding, target, source_hash):
+                continue
+            target.write_bytes(variants[encoding]())
+            written.append(target)
+    return written
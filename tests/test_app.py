@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+from datetime import datetime
+from decimal import Decimal
+import gzip
 import importlib.util
+import json
 from pathlib import Path
+import uuid
+
+from flask.json.provider import DefaultJSONProvider
+
+from galaxy.web_assets import precompress_assets
 
 
 def load_root_app():
@@ -17,6 +26,10 @@ def load_root_app():
 app = load_root_app()
 
 
+def client_galaxy() -> dict:
+    return json.loads((Path(__file__).resolve().parents[1] / "web" / "galaxy-data.json").read_text(encoding="utf-8"))
+
+
 def test_root_serves_index() -> None:
     client = app.test_client()
     response = client.get("/")
@@ -50,3 +63,165 @@ def test_health_endpoint() -> None:
     response = client.get("/api/health")
     assert response.status_code == 200
     assert response.get_json() == {"ok": True, "service": "galaxy"}
+
+
+def test_system_endpoint_returns_single_system() -> None:
+    client = app.test_client()
+    response = client.get("/api/systems/Kharon-41")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload["system"]["id"] == "kharon-41"
+    assert payload["sector"]["n"] == payload["system"]["sector"]
+
+
+def test_sector_endpoint_lists_member_systems() -> None:
+    client = app.test_client()
+    response = client.get("/api/sectors/hemlock")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload["sector"]["n"] == "Hemlock Core"
+    assert all(system["sector"] == "Hemlock Core" for system in payload["systems"])
+
+
+def test_planet_endpoint_accepts_page_tokens() -> None:
+    client = app.test_client()
+    by_token = client.get("/api/systems/kharon-41/planets/kharon-41-razor-ember").get_json()
+    by_name = client.get("/api/systems/kharon-41/planets/Razor%20Ember").get_json()
+    assert by_token == by_name
+    assert by_token["planet"]["n"] == "Razor Ember"
+    assert "p" not in by_token["system"]
+
+
+def test_detail_endpoints_return_404_for_unknown_ids() -> None:
+    client = app.test_client()
+    assert client.get("/api/sectors/nowhere").status_code == 404
+    assert client.get("/api/systems/nowhere").status_code == 404
+    assert client.get("/api/systems/kharon-41/planets/nowhere").status_code == 404
+
+
+def test_systems_ndjson_streams_one_system_per_line() -> None:
+    client = app.test_client()
+    response = client.get("/api/systems.ndjson")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.is_streamed
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [system["id"] for system in client_galaxy()["systems"]]
+
+    hemlock = client.get("/api/systems.ndjson?sector=hemlock").get_data(as_text=True).splitlines()
+    assert hemlock and all(json.loads(line)["sector"] == "Hemlock Core" for line in hemlock)
+    assert client.get("/api/systems.ndjson?sector=nowhere").status_code == 404
+
+
+def test_assets_carry_content_etag_and_revalidate() -> None:
+    client = app.test_client()
+    first = client.get("/app.js", headers={"Accept-Encoding": "identity"})
+    assert first.status_code == 200
+    assert first.headers["ETag"]
+    assert "no-cache" in first.headers["Cache-Control"]
+    second = client.get("/app.js", headers={"If-None-Match": first.headers["ETag"], "Accept-Encoding": "identity"})
+    assert second.status_code == 304
+    assert second.data == b""
+
+
+def test_api_responses_support_conditional_get() -> None:
+    client = app.test_client()
+    first = client.get("/api/systems/kharon-41")
+    assert first.headers["ETag"]
+    second = client.get("/api/systems/kharon-41", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+
+
+def test_json_provider_keeps_flask_defaults_for_other_values() -> None:
+    payload = {"when": datetime(2024, 5, 1, 12, 30), "id": uuid.UUID(int=7), "amount": Decimal("1.25"), 3: "three"}
+    stdlib = DefaultJSONProvider(app)
+    stdlib.sort_keys = False
+    assert app.json.dumps(payload, separators=(",", ":")) == stdlib.dumps(payload, separators=(",", ":"))
+    assert app.json.dumps(payload, indent=2) == stdlib.dumps(payload, indent=2)
+    assert app.json.dumps(payload, sort_keys=True) == stdlib.dumps(payload, sort_keys=True)
+
+
+def test_snapshots_are_never_served_as_web_assets(tmp_path, monkeypatch) -> None:
+    module = app.view_functions["root"].__globals__
+    assert module["WEB_DIR"] not in module["SNAPSHOT_PATH"].parents
+    (tmp_path / "galaxy-data.snapshot").write_bytes(b"GLXSNAP\n")
+    monkeypatch.setitem(module, "WEB_DIR", tmp_path)
+
+    client = app.test_client()
+    assert client.get("/galaxy-data.snapshot").status_code == 404
+    assert client.get("/web/galaxy-data.snapshot").status_code == 404
+
+
+def test_precompressed_sibling_is_served_when_accepted(tmp_path, monkeypatch) -> None:
+    module = app.view_functions["root"].__globals__
+    asset = tmp_path / "bundle.0123abcd.js"
+    asset.write_text("console.log('galaxy');\n" * 100, encoding="utf-8")
+    monkeypatch.setitem(module, "WEB_DIR", tmp_path)
+    precompress_assets(tmp_path)
+
+    client = app.test_client()
+    response = client.get("/bundle.0123abcd.js", headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data) == asset.read_bytes()
+    assert "immutable" in response.headers["Cache-Control"]
+    plain = client.get("/bundle.0123abcd.js", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["ETag"] != response.headers["ETag"]
+
+    asset.write_text("console.log('changed');\n" * 100, encoding="utf-8")
+    stale = client.get("/bundle.0123abcd.js", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in stale.headers
+
+
+def test_planet_listing_filters_and_paginates() -> None:
+    client = app.test_client()
+    everything = client.get("/api/planets?sort=-hab&limit=500").get_json()
+    assert everything["next_cursor"] is None
+    habs = [item["planet"]["hab"] for item in everything["planets"]]
+    assert habs == sorted(habs, reverse=True)
+
+    seen = []
+    url = "/api/planets?sort=-hab&limit=2"
+    while url:
+        payload = client.get(url).get_json()
+        seen.extend(item["planet"]["n"] for item in payload["planets"])
+        url = f"/api/planets?sort=-hab&limit=2&cursor={payload['next_cursor']}" if payload["next_cursor"] else None
+    assert seen == [item["planet"]["n"] for item in everything["planets"]]
+
+    filtered = client.get("/api/planets?star_class=M&locked=true&min_hab=1").get_json()["planets"]
+    assert filtered
+    assert all(item["star_class"].startswith("M") and item["planet"]["locked"] and item["planet"]["hab"] >= 1 for item in filtered)
+
+
+def test_planet_listing_rejects_bad_parameters() -> None:
+    client = app.test_client()
+    assert client.get("/api/planets?min_hab=high").status_code == 400
+    assert client.get("/api/planets?sort=mass").status_code == 400
+    assert client.get("/api/planets?cursor=bogus").status_code == 400
+
+
+def test_sectors_near_orders_by_distance() -> None:
+    client = app.test_client()
+    payload = client.get("/api/sectors/near?x=-0.11&y=-0.08&k=3").get_json()
+    distances = [item["distance"] for item in payload["sectors"]]
+    assert payload["sectors"][0]["sector"]["id"] == "hemlock"
+    assert distances == sorted(distances) and len(distances) == 3
+    assert "s" not in payload["sectors"][0]["sector"]
+
+
+def test_sectors_in_box_returns_contained_sectors() -> None:
+    client = app.test_client()
+    payload = client.get("/api/sectors/in-box?xmin=0&ymin=-0.5&xmax=1&ymax=0.5").get_json()
+    assert {sector["id"] for sector in payload["sectors"]} == {"cinder", "razor"}
+    assert client.get("/api/sectors/in-box?xmin=0&ymin=nan&xmax=1&ymax=1").status_code == 400
+    assert client.get("/api/sectors/near?x=1").status_code == 400
+
+
+def test_tile_endpoint_is_deterministic_and_bounded() -> None:
+    client = app.test_client()
+    first = client.get("/api/tiles/5/10/20").get_json()
+    assert first == client.get("/api/tiles/5/10/20").get_json()
+    xmin, ymin, xmax, ymax = first["bounds"]
+    assert first["systems"]
+    assert all(xmin <= s["pos"][0] < xmax and ymin <= s["pos"][1] < ymax for s in first["systems"])
+    assert client.get("/api/tiles/2/4/0").status_code == 404
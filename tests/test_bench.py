@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from galaxy.bench import build_baseline, compare_to_baseline, run_benchmarks
+from galaxy.data_cli import main
+
+
+def test_run_benchmarks_reports_every_operation() -> None:
+    results = run_benchmarks([4], repeats=2)
+    assert [record["operation"] for record in results] == ["generate", "validate", "export", "load", "cold_json", "cold_snap"]
+    for record in results:
+        assert record["systems"] == 4
+        assert record["min_s"] <= record["median_s"] <= record["max_s"]
+        assert record["planets_per_s"] > 0
+
+
+def test_compare_flags_slowdowns_beyond_threshold() -> None:
+    record = {"operation": "generate", "systems": 1000, "min_s": 1.0, "median_s": 1.0, "peak_bytes": 100}
+    baseline = build_baseline([record])
+    slower = dict(record, min_s=1.4, median_s=1.4, peak_bytes=200)
+    assert len(compare_to_baseline([slower], baseline, time_threshold=0.25, memory_threshold=0.5)) == 2
+    assert compare_to_baseline([slower], baseline, time_threshold=0.5, memory_threshold=1.5) == []
+    assert round(slower["time_change"], 6) == 0.4
+
+
+def test_bench_cli_writes_and_checks_baseline(tmp_path, capsys) -> None:
+    baseline = tmp_path / "baseline.json"
+    assert main(["bench", "--scales", "3", "--repeats", "1", "--baseline", str(baseline), "--update-baseline"]) == 0
+    assert baseline.is_file()
+    assert main(["bench", "--scales", "3", "--repeats", "1", "--baseline", str(baseline), "--threshold", "100", "--memory-threshold", "100"]) == 0
+    assert "Regressions: 0" in capsys.readouterr().out
+
+
+def test_bench_cli_compares_each_record_once(tmp_path, capsys, monkeypatch) -> None:
+    from galaxy import bench, data_cli
+
+    assert bench.DEFAULT_SCALES == (10, 1_000)
+    baseline = tmp_path / "baseline.json"
+    assert main(["bench", "--scales", "3", "--repeats", "1", "--baseline", str(baseline), "--update-baseline"]) == 0
+    compared = []
+    monkeypatch.setattr(data_cli, "compare_to_baseline", lambda results, *args, **kwargs: compared.extend(results) or ["slow"])
+    assert main(["bench", "--scales", "3", "--repeats", "1", "--baseline", str(baseline)]) == 1
+    assert len(compared) == 6
+    assert "Regressions: 6" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from galaxy import data_binary
+from galaxy.data_binary import export_galaxy_binary, is_galaxy_binary, open_galaxy_binary, stream_galaxy_binary
+from galaxy.data_cli import main
+from galaxy.data_pipeline import generate_galaxy, validate_galaxy
+
+
+def test_binary_round_trip_matches_json(tmp_path) -> None:
+    data = generate_galaxy(seed=42)
+    output = export_galaxy_binary(data, tmp_path / "galaxy.glxc")
+    assert is_galaxy_binary(output)
+    with open_galaxy_binary(output) as galaxy:
+        assert json.dumps(galaxy.to_dict(), indent=2) == json.dumps(data, indent=2)
+
+
+def test_binary_reader_is_lazy_and_validates(tmp_path) -> None:
+    data = generate_galaxy(seed=8, sector_count=6, system_count=40, planets_per_system=4)
+    output = export_galaxy_binary(data, tmp_path / "galaxy.glxc")
+    with open_galaxy_binary(output) as galaxy:
+        document = galaxy.document()
+        assert len(document["systems"]) == 40
+        assert document["systems"][17] == data["systems"][17]
+        assert list(document["systems"][-2:]) == data["systems"][-2:]
+        assert validate_galaxy(document) == []
+
+
+def test_stream_galaxy_binary_matches_export(tmp_path) -> None:
+    kwargs = dict(seed=11, sector_count=5, system_count=12, planets_per_system=3, workers=1)
+    streamed = stream_galaxy_binary(tmp_path / "streamed.glxc", **kwargs)
+    exported = export_galaxy_binary(generate_galaxy(**kwargs), tmp_path / "exported.glxc")
+    assert streamed.read_bytes() == exported.read_bytes()
+
+
+def test_spilled_columns_and_aged_out_strings_round_trip(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(data_binary, "_SPILL_ITEMS", 7)
+    monkeypatch.setattr(data_binary, "_DEDUP_GENERATION", 5)
+    data = generate_galaxy(seed=4, sector_count=6, system_count=30, planets_per_system=3)
+    output = export_galaxy_binary(data, tmp_path / "galaxy.glxc")
+    with open_galaxy_binary(output) as galaxy:
+        assert galaxy.to_dict() == data
+    assert not [path for path in tmp_path.iterdir() if path != output]
+
+
+def test_cli_generates_and_validates_binary(tmp_path, capsys) -> None:
+    output = tmp_path / "galaxy.glxc"
+    assert main(["generate", "--format", "binary", "--systems", "9", "-o", str(output)]) == 0
+    assert main(["validate", str(output)]) == 0
+    assert main(["validate", "--stream", str(output)]) == 0
+    assert capsys.readouterr().out.count("Validation issues: 0") == 3
+
+
+def test_truncated_binary_is_rejected(tmp_path, capsys) -> None:
+    data = export_galaxy_binary(generate_galaxy(seed=2, system_count=4), tmp_path / "galaxy.glxc").read_bytes()
+    truncated = tmp_path / "truncated.glxc"
+    for size in (4, 12, 64, len(data) // 2, len(data) - 1):
+        truncated.write_bytes(data[:size])
+        with pytest.raises(ValueError, match="truncated or corrupt"):
+            open_galaxy_binary(truncated)
+    for args in (["validate", str(truncated)], ["validate", "--stream", str(truncated)]):
+        assert main(args) == 2
+        assert capsys.readouterr().out == f"{truncated}: truncated or corrupt galaxy binary.\n"
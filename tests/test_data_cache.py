@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from galaxy import data_cache, data_pipeline, sampling
+from galaxy.data_cache import GenerationCache, ValidationCache
+from galaxy.data_pipeline import generate_galaxy, iter_systems
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(data_pipeline, "SEEDED_CHUNK_SYSTEMS", 4)
+
+
+def test_cached_generation_matches_uncached(tmp_path, small_chunks) -> None:
+    cache = GenerationCache(tmp_path)
+    kwargs = dict(seed=13, system_count=10, planets_per_system=3, workers=1)
+    first = generate_galaxy(cache=cache, **kwargs)
+    second = generate_galaxy(cache=cache, **kwargs)
+    assert first == second == generate_galaxy(**kwargs)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_growing_galaxy_only_generates_new_chunks(tmp_path, small_chunks) -> None:
+    cache = GenerationCache(tmp_path)
+    generate_galaxy(seed=13, system_count=8, planets_per_system=3, workers=1, cache=cache)
+    grown = generate_galaxy(seed=13, system_count=14, planets_per_system=3, workers=1, cache=cache)
+    assert grown == generate_galaxy(seed=13, system_count=14, planets_per_system=3, workers=1)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_generator_changes_invalidate_entries(tmp_path, small_chunks, monkeypatch) -> None:
+    cache = GenerationCache(tmp_path)
+    generate_galaxy(seed=13, system_count=4, planets_per_system=3, workers=1, cache=cache)
+    monkeypatch.setattr(data_cache, "generator_fingerprint", lambda: "edited")
+    generate_galaxy(seed=13, system_count=4, planets_per_system=3, workers=1, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_sampler_changes_invalidate_entries(tmp_path, small_chunks, monkeypatch) -> None:
+    cache = GenerationCache(tmp_path / "cache")
+    generate_galaxy(seed=13, system_count=4, planets_per_system=3, workers=1, cache=cache)
+    edited = tmp_path / "sampling.py"
+    edited.write_text(open(sampling.__file__, encoding="utf-8").read() + "\n# alias method\n", encoding="utf-8")
+    monkeypatch.setattr(sampling, "__file__", str(edited))
+    data_cache.generator_fingerprint.cache_clear()
+    try:
+        generate_galaxy(seed=13, system_count=4, planets_per_system=3, workers=1, cache=cache)
+    finally:
+        data_cache.generator_fingerprint.cache_clear()
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path) -> None:
+    cache = GenerationCache(tmp_path, max_bytes=0)
+    for index, key in enumerate(["old", "mid", "new"]):
+        cache.store(key, [{"n": key}])
+        os.utime(tmp_path / f"{key}.json", ns=(index * 10**9, index * 10**9))
+    entry_size = (tmp_path / "new.json").stat().st_size
+    cache.max_bytes = 2 * entry_size
+    assert cache.load("old") == [{"n": "old"}]  # touching makes it most recent
+    assert cache.evict() == 1
+    assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["new", "old"]
+
+
+def test_eviction_runs_during_generation_and_sweeps_orphaned_temp_files(tmp_path, small_chunks, monkeypatch) -> None:
+    monkeypatch.setattr(data_cache, "EVICT_EVERY_STORES", 1)
+    orphan = tmp_path / "crashed.tmp"
+    orphan.write_text("partial", encoding="utf-8")
+    os.utime(orphan, ns=(0, 0))
+    cache = GenerationCache(tmp_path)
+    cache.store("probe", data_pipeline._generate_seeded_chunk(13, 0, 4, ["A"], 3, "python"))
+    cache.max_bytes = 2 * (tmp_path / "probe.json").stat().st_size
+    assert not orphan.exists()
+
+    systems = iter_systems(seed=13, system_count=40, planets_per_system=3, workers=1, cache=cache)
+    for _ in range(30):  # stop early, before the end-of-run eviction
+        next(systems)
+        assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= cache.max_bytes
+
+
+def test_cache_requires_seeded_mode(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        generate_galaxy(seed=1, cache=GenerationCache(tmp_path))
+
+
+def test_validation_cache_reuses_unchanged_systems(tmp_path) -> None:
+    data = generate_galaxy(seed=19, sector_count=6, system_count=12, planets_per_system=4)
+    data["systems"][2]["p"][0]["g"] *= 2.0
+    data["systems"][5]["sector"] = "Nowhere"
+    expected = data_pipeline.validate_galaxy(data)
+
+    cache = ValidationCache(tmp_path / "validation.json")
+    assert data_pipeline.validate_galaxy(data, cache=cache) == expected
+    cache.save()
+    assert (cache.hits, cache.misses) == (0, 12)
+
+    data["systems"][7]["p"][1]["g"] *= 2.0
+    data["sectors"][0]["n"] = "Renamed"
+    cache = ValidationCache(tmp_path / "validation.json")
+    assert data_pipeline.validate_galaxy(data, cache=cache) == data_pipeline.validate_galaxy(data)
+    assert (cache.hits, cache.misses) == (11, 1)
+
+
+def test_validation_cache_is_dropped_when_the_validator_changes(tmp_path, monkeypatch) -> None:
+    data = generate_galaxy(seed=19, sector_count=6, system_count=3, planets_per_system=4)
+    cache = ValidationCache(tmp_path / "validation.json")
+    data_pipeline.validate_galaxy(data, cache=cache)
+    cache.save()
+    monkeypatch.setattr(data_cache, "validator_fingerprint", lambda: "edited")
+    cache = ValidationCache(tmp_path / "validation.json")
+    data_pipeline.validate_galaxy(data, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_validation_cache_batches_misses_across_workers(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(data_pipeline, "VALIDATION_CHUNK_SYSTEMS", 4)
+    data = generate_galaxy(seed=19, sector_count=6, system_count=30, planets_per_system=3)
+    data["systems"][9]["p"][0]["g"] *= 2.0
+    data["systems"][21]["sector"] = "Nowhere"
+    expected = data_pipeline.validate_galaxy(data)
+    records = generate_galaxy(seed=19, sector_count=6, system_count=30, planets_per_system=3, records=True)
+
+    cache = ValidationCache(tmp_path / "validation.json")
+    assert data_pipeline.validate_galaxy(data, cache=cache, workers=2) == expected
+    assert data_pipeline.validate_galaxy(data, cache=cache, workers=2) == expected
+    assert (cache.hits, cache.misses) == (30, 30)
+    assert data_pipeline.validate_galaxy(records, cache=cache, workers=2) == data_pipeline.validate_galaxy(records)
+    # Records hash like the equal dicts; only the two edited systems miss.
+    assert (cache.hits, cache.misses) == (58, 32)
+
+
+def test_validation_cache_runs_misses_on_the_requested_engine(tmp_path) -> None:
+    pytest.importorskip("numpy")
+    data = generate_galaxy(seed=23, sector_count=6, system_count=20, planets_per_system=4)
+    data["systems"][3]["p"][1]["g"] *= 2.0
+    data["systems"][11]["sector"] = "Nowhere"
+    expected = data_pipeline.validate_galaxy(data)
+    cache = ValidationCache(tmp_path / "validation.json")
+    assert data_pipeline.validate_galaxy(data, engine="numpy", cache=cache) == expected
+    assert data_pipeline.validate_galaxy(data, engine="numpy", cache=cache, workers=2) == expected
+    assert (cache.hits, cache.misses) == (20, 20)
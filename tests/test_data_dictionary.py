@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from galaxy.data_cli import main
+from galaxy.data_dictionary import decode_galaxy, export_galaxy_dictionary, stream_galaxy_dictionary
+from galaxy.data_pipeline import export_galaxy_json, generate_galaxy
+
+
+def test_dictionary_round_trip_is_exact_and_smaller(tmp_path) -> None:
+    data = generate_galaxy(seed=42, sector_count=6, system_count=60, planets_per_system=6)
+    encoded = export_galaxy_dictionary(data, tmp_path / "galaxy.json")
+    plain = export_galaxy_json(data, tmp_path / "plain.json")
+    payload = json.loads(encoded.read_text(encoding="utf-8"))
+    assert list(payload)[:4] == ["name", "sectors", "tables", "systems"]
+    assert json.dumps(decode_galaxy(payload), indent=2) == json.dumps(data, indent=2)
+    assert encoded.stat().st_size * 3 < plain.stat().st_size
+
+
+def test_stream_galaxy_dictionary_matches_export(tmp_path) -> None:
+    kwargs = dict(seed=11, sector_count=5, system_count=12, planets_per_system=3)
+    streamed = stream_galaxy_dictionary(tmp_path / "streamed.json", **kwargs)
+    exported = export_galaxy_dictionary(generate_galaxy(**kwargs), tmp_path / "exported.json")
+    assert streamed.read_text(encoding="utf-8") == exported.read_text(encoding="utf-8")
+
+
+def test_decoder_rejects_out_of_range_references() -> None:
+    payload = {"tables": {"version": 1, "t": [], "x": [], "text": []}, "systems": [{"p": [{"t": 3}]}]}
+    with pytest.raises(ValueError):
+        decode_galaxy(payload)
+
+
+def test_cli_validates_dictionary_files(tmp_path, capsys) -> None:
+    output = tmp_path / "galaxy.json"
+    assert main(["generate", "--format", "dictionary", "--systems", "9", "-o", str(output)]) == 0
+    assert main(["validate", str(output)]) == 0
+    assert main(["validate", "--stream", str(output)]) == 0
+    assert capsys.readouterr().out.count("Validation issues: 0") == 3
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+
+from galaxy.data_binary import export_galaxy_binary, open_galaxy_binary
+from galaxy.data_model import System
+from galaxy.data_pipeline import export_galaxy_json, generate_galaxy, validate_galaxy
+
+
+def test_records_round_trip_to_the_exported_shape(tmp_path) -> None:
+    data = generate_galaxy(seed=9, sector_count=6, system_count=8, planets_per_system=5)
+    compact = generate_galaxy(seed=9, sector_count=6, system_count=8, planets_per_system=5, records=True)
+    assert all(isinstance(system, System) for system in compact["systems"])
+    assert [system.to_dict() for system in compact["systems"]] == data["systems"]
+    plain = export_galaxy_json(data, tmp_path / "plain.json")
+    exported = export_galaxy_json(compact, tmp_path / "records.json")
+    assert exported.read_text(encoding="utf-8") == plain.read_text(encoding="utf-8")
+    with open_galaxy_binary(export_galaxy_binary(compact, tmp_path / "records.glxc")) as galaxy:
+        assert json.dumps(galaxy.to_dict()) == json.dumps(data)
+
+
+def test_validate_galaxy_accepts_records() -> None:
+    data = generate_galaxy(seed=19, sector_count=6, system_count=6, planets_per_system=4)
+    data["systems"][1]["p"][0]["g"] *= 2.0
+    compact = dict(data, systems=[System.from_dict(system) for system in data["systems"]])
+    issues = validate_galaxy(data)
+    assert issues
+    assert validate_galaxy(compact) == issues
+    assert validate_galaxy(compact, engine="numpy") == issues
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from galaxy.data_binary import export_galaxy_binary
+from galaxy.data_cli import main
+from galaxy.data_dictionary import export_galaxy_dictionary
+from galaxy.data_ndjson import iter_galaxy_systems, iter_ndjson_chunks
+from galaxy.data_pipeline import export_galaxy_json, generate_galaxy
+
+
+def test_chunks_hold_whole_lines() -> None:
+    data = generate_galaxy(seed=3, sector_count=3, system_count=20, planets_per_system=2)
+    chunks = list(iter_ndjson_chunks(data["systems"], chunk_size=4000))
+    assert len(chunks) > 1
+    assert all(chunk.endswith("\n") for chunk in chunks)
+    assert [json.loads(line) for line in "".join(chunks).splitlines()] == data["systems"]
+
+
+@pytest.mark.parametrize("exporter", [export_galaxy_json, export_galaxy_dictionary, export_galaxy_binary])
+def test_iter_galaxy_systems_reads_every_format(tmp_path, exporter) -> None:
+    data = generate_galaxy(seed=5, sector_count=4, system_count=12, planets_per_system=3)
+    path = exporter(data, tmp_path / "galaxy.out")
+    assert list(iter_galaxy_systems(path)) == data["systems"]
+    sector = data["sectors"][1]
+    by_id = list(iter_galaxy_systems(path, sector=sector["id"]))
+    assert by_id == [system for system in data["systems"] if system["sector"] == sector["n"]]
+    assert list(iter_galaxy_systems(path, sector=sector["n"])) == by_id
+    with pytest.raises(ValueError):
+        list(iter_galaxy_systems(path, sector="nowhere"))
+
+
+def test_cli_exports_ndjson_to_file_and_stdout(tmp_path, capsys) -> None:
+    source = tmp_path / "galaxy.json"
+    data = generate_galaxy(seed=8, sector_count=3, system_count=9, planets_per_system=2)
+    export_galaxy_json(data, source)
+
+    output = tmp_path / "galaxy.ndjson"
+    assert main(["export", "--ndjson", str(source), "-o", str(output)]) == 0
+    assert [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()] == data["systems"]
+    assert "Exported 9 systems" in capsys.readouterr().err
+
+    assert main(["export", "--ndjson", "--sector", data["sectors"][0]["id"], str(source)]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines and all(json.loads(line)["sector"] == data["sectors"][0]["n"] for line in lines)
+
+    assert main(["export", "--ndjson", str(tmp_path / "missing.json")]) == 2
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from galaxy.data_pipeline import export_galaxy_json, generate_galaxy, validate_galaxy
+import json
+
+import pytest
+
+from galaxy import data_pipeline, data_vectorized
+from galaxy.data_pipeline import (
+    export_galaxy_json,
+    generate_galaxy,
+    iter_systems,
+    stream_galaxy_json,
+    validate_galaxy,
+)
 
 
 def test_generate_galaxy_validates_cleanly() -> None:
@@ -51,3 +62,51 @@ def test_export_galaxy_json_writes_file(tmp_path) -> None:
     output = export_galaxy_json(data, tmp_path / "galaxy-data.json")
     assert output.exists()
     assert output.read_text(encoding="utf-8").startswith("{")
+
+
+def test_numpy_engine_falls_back_without_numpy(monkeypatch) -> None:
+    monkeypatch.setattr(data_vectorized, "np", None)
+    data = generate_galaxy(seed=5, sector_count=6, system_count=3, planets_per_system=6, engine="numpy")
+    assert data == generate_galaxy(seed=5, sector_count=6, system_count=3, planets_per_system=6)
+
+
+def test_generate_galaxy_rejects_unknown_engine() -> None:
+    with pytest.raises(ValueError):
+        generate_galaxy(seed=5, engine="fortran")
+
+
+def test_parallel_generation_is_identical_for_any_worker_count() -> None:
+    serial = generate_galaxy(seed=3, sector_count=6, system_count=300, planets_per_system=4, workers=1)
+    parallel = generate_galaxy(seed=3, sector_count=6, system_count=300, planets_per_system=4, workers=2)
+    assert json.dumps(serial, indent=2) == json.dumps(parallel, indent=2)
+    assert validate_galaxy(parallel) == []
+
+
+def test_seeded_systems_do_not_depend_on_system_count() -> None:
+    small = generate_galaxy(seed=3, sector_count=6, system_count=2, planets_per_system=4, workers=1)
+    large = generate_galaxy(seed=3, sector_count=6, system_count=9, planets_per_system=4, workers=1)
+    assert large["systems"][:2] == small["systems"]
+    assert validate_galaxy(small) == []
+
+
+def test_iter_systems_matches_generate_galaxy() -> None:
+    data = generate_galaxy(seed=23, sector_count=6, system_count=5, planets_per_system=6)
+    assert list(iter_systems(seed=23, sector_count=6, system_count=5, planets_per_system=6)) == data["systems"]
+
+
+def test_stream_galaxy_json_matches_export(tmp_path) -> None:
+    data = generate_galaxy(seed=23, sector_count=4, system_count=7, planets_per_system=5)
+    exported = export_galaxy_json(data, tmp_path / "export.json")
+    streamed = stream_galaxy_json(tmp_path / "stream.json", seed=23, sector_count=4, system_count=7, planets_per_system=5)
+    assert streamed.read_text(encoding="utf-8") == exported.read_text(encoding="utf-8")
+    assert exported.read_text(encoding="utf-8") == json.dumps(data, indent=2)
+
+
+def test_parallel_validation_matches_serial(monkeypatch) -> None:
+    monkeypatch.setattr(data_pipeline, "VALIDATION_CHUNK_SYSTEMS", 4)
+    data = generate_galaxy(seed=19, sector_count=6, system_count=15, planets_per_system=4)
+    data["systems"][2]["p"][0]["g"] *= 2.0
+    data["systems"][11]["sector"] = "Nowhere"
+    serial = validate_galaxy(data)
+    assert len(serial) >= 2
+    assert validate_galaxy(data, workers=3) == serial
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+from galaxy.data_cli import main
+from galaxy.data_pipeline import export_galaxy_json, generate_galaxy, validate_galaxy
+from galaxy.data_shards import (
+    export_galaxy_shards,
+    is_shard_manifest,
+    load_manifest,
+    load_sharded_galaxy,
+    read_shard_system,
+    validate_galaxy_shards,
+)
+
+
+def test_shards_round_trip_and_offsets_locate_systems(tmp_path) -> None:
+    data = generate_galaxy(seed=42, sector_count=4, system_count=20, planets_per_system=3)
+    manifest_path = export_galaxy_shards(data, tmp_path / "shards")
+    manifest = load_manifest(manifest_path)
+    assert is_shard_manifest(manifest_path)
+    assert len(manifest["shards"]) == 4
+    assert manifest["document"]["sectors"] == data["sectors"]
+    assert load_sharded_galaxy(manifest_path) == data
+
+    shard = manifest["shards"][1]
+    raw = (manifest_path.parent / shard["file"]).read_bytes()
+    assert len(raw) == shard["bytes"]
+    for system_id, index, offset, length in shard["systems"]:
+        assert json.loads(raw[offset:offset + length]) == data["systems"][index]
+        assert data["systems"][index]["id"] == system_id
+    assert read_shard_system(manifest_path, data["systems"][7]["id"]) == data["systems"][7]
+    assert read_shard_system(manifest_path, "nowhere") is None
+
+
+def test_shard_validation_matches_unsharded_and_flags_tampering(tmp_path) -> None:
+    data = generate_galaxy(seed=9, sector_count=3, system_count=12, planets_per_system=4)
+    data["systems"][5]["p"][0]["g"] = 999.0
+    data["systems"][2]["sector"] = "Nowhere Expanse"
+    manifest_path = export_galaxy_shards(data, tmp_path / "shards")
+    expected = validate_galaxy(data)
+    assert expected
+    assert validate_galaxy_shards(manifest_path) == expected
+    assert validate_galaxy_shards(manifest_path, workers=2) == expected
+
+    shard = load_manifest(manifest_path)["shards"][0]
+    (manifest_path.parent / shard["file"]).write_bytes(b"[]")
+    issues = validate_galaxy_shards(manifest_path)
+    assert any("does not match the manifest" in issue for issue in issues)
+    (manifest_path.parent / shard["file"]).unlink()
+    assert any("file is missing" in issue for issue in validate_galaxy_shards(manifest_path))
+
+
+def test_cli_exports_and_validates_shards(tmp_path, capsys) -> None:
+    source = tmp_path / "galaxy.json"
+    export_galaxy_json(generate_galaxy(seed=4, sector_count=3, system_count=9, planets_per_system=2), source)
+    assert main(["export", "--shards", str(source), "-o", str(tmp_path / "shards")]) == 0
+    assert "Exported 9 systems to 3 shards" in capsys.readouterr().out
+    assert main(["validate", "--jobs", "2", str(tmp_path / "shards" / "manifest.json")]) == 0
+    assert "Validation issues: 0" in capsys.readouterr().out
+    assert load_sharded_galaxy(tmp_path / "shards" / "manifest.json") == json.loads(source.read_text(encoding="utf-8"))
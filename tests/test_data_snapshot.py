@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from galaxy.data_cli import main
+from galaxy.data_index import load_galaxy_index
+from galaxy.data_pipeline import export_galaxy_json, generate_galaxy
+from galaxy.data_snapshot import load_galaxy_state, load_snapshot, write_snapshot
+
+
+def test_snapshot_restores_the_indexed_state(tmp_path) -> None:
+    source = export_galaxy_json(generate_galaxy(seed=42, sector_count=5, system_count=30, planets_per_system=4), tmp_path / "galaxy.json")
+    fresh = load_galaxy_index(source)
+    snapshot = load_snapshot(write_snapshot(source, tmp_path / "galaxy.snapshot"), source=source)
+
+    assert snapshot.index.data == fresh.data
+    system = fresh.data["systems"][3]
+    loaded = snapshot.index.system(system["id"])
+    assert loaded == system
+    assert snapshot.index.planet(loaded, system["p"][0]["n"]) == system["p"][0]
+    assert snapshot.index.sector_of(loaded) is snapshot.index.sector(system["sector"])
+    assert snapshot.index.query_planets(sort="-hab", limit=7) == fresh.query_planets(sort="-hab", limit=7)
+    assert snapshot.sector_tree.nearest(0.0, 0.0, 2) == load_galaxy_state(source).sector_tree.nearest(0.0, 0.0, 2)
+
+
+def test_stale_or_foreign_snapshots_fall_back_to_json(tmp_path) -> None:
+    source = export_galaxy_json(generate_galaxy(seed=1, sector_count=3, system_count=6, planets_per_system=2), tmp_path / "galaxy.json")
+    snapshot_path = write_snapshot(source, tmp_path / "galaxy.snapshot")
+    export_galaxy_json(generate_galaxy(seed=2, sector_count=3, system_count=6, planets_per_system=2), source)
+    with pytest.raises(ValueError, match="source"):
+        load_snapshot(snapshot_path, source=source)
+    assert load_galaxy_state(source, snapshot_path).index.data == load_galaxy_index(source).data
+
+    (tmp_path / "junk.snapshot").write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError):
+        load_snapshot(tmp_path / "junk.snapshot")
+    assert load_galaxy_state(source, tmp_path / "missing.snapshot").index.data["systems"]
+
+
+def test_cli_writes_snapshot_outside_the_web_directory(tmp_path, monkeypatch, capsys) -> None:
+    (tmp_path / "web").mkdir()
+    source = export_galaxy_json(generate_galaxy(seed=3, sector_count=3, system_count=6, planets_per_system=2), tmp_path / "web" / "galaxy-data.json")
+    monkeypatch.chdir(tmp_path)
+    assert main(["snapshot", str(source)]) == 0
+    assert "from snapshot" in capsys.readouterr().out
+    assert not (tmp_path / "web" / "galaxy-data.snapshot").exists()
+    assert load_snapshot(tmp_path / "galaxy-data.snapshot", source=source).index.data["systems"]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from galaxy.data_pipeline import generate_galaxy, validate_galaxy
+from galaxy.data_stream import iter_galaxy_events, iter_validate_stream
+
+
+def test_events_yield_systems_one_at_a_time() -> None:
+    data = generate_galaxy(seed=4, sector_count=6, system_count=5, planets_per_system=3)
+    events = list(iter_galaxy_events(io.StringIO(json.dumps(data, indent=2)), chunk_size=7))
+    assert [key for key, _ in events] == ["name", "sectors", "systems"] + ["system"] * 5 + ["topics", "meta"]
+    assert [value for key, value in events if key == "system"] == data["systems"]
+
+
+def test_stream_validation_matches_in_memory_validation() -> None:
+    data = generate_galaxy(seed=19, sector_count=6, system_count=4, planets_per_system=6)
+    data["systems"][1]["p"][0]["g"] *= 2.0
+    data["systems"][2]["sector"] = "Nowhere"
+    issues = list(iter_validate_stream(io.StringIO(json.dumps(data)), chunk_size=16))
+    assert issues == validate_galaxy(data)
+    assert any("gravity mismatch" in issue for issue in issues)
+
+
+def test_stream_validation_defers_sector_checks_when_systems_come_first() -> None:
+    data = generate_galaxy(seed=19, sector_count=6, system_count=3, planets_per_system=4)
+    data["systems"][0]["sector"] = "Nowhere"
+    reordered = {"systems": data["systems"], "sectors": data["sectors"]}
+    issues = list(iter_validate_stream(io.StringIO(json.dumps(reordered))))
+    assert sorted(issues) == sorted(validate_galaxy(data))
+
+
+def test_stream_validation_rejects_truncated_json() -> None:
+    data = generate_galaxy(seed=19, sector_count=6, system_count=3, planets_per_system=4)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_validate_stream(io.StringIO(json.dumps(data)[:-40])))
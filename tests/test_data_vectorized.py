@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from galaxy import data_pipeline  # noqa: E402
+from galaxy.data_pipeline import generate_galaxy, validate_galaxy  # noqa: E402
+from galaxy.data_vectorized import generate_planets_batch  # noqa: E402
+
+
+def test_numpy_engine_validates_cleanly() -> None:
+    data = generate_galaxy(seed=7, sector_count=6, system_count=200, planets_per_system=6, engine="numpy")
+    assert validate_galaxy(data) == []
+
+
+def test_numpy_engine_is_deterministic() -> None:
+    first = generate_galaxy(seed=13, sector_count=6, system_count=20, planets_per_system=5, engine="numpy")
+    second = generate_galaxy(seed=13, sector_count=6, system_count=20, planets_per_system=5, engine="numpy")
+    assert first == second
+    assert all(len(system["p"]) == 5 for system in first["systems"])
+
+
+def test_batch_planets_keep_scalar_shape() -> None:
+    scalar = generate_galaxy(seed=3, sector_count=6, system_count=2, planets_per_system=4)
+    stars = [system["star"] for system in scalar["systems"]]
+    batch = generate_planets_batch(np.random.default_rng(3), stars, 4, [["A", "B"], ["C", "D"]])
+    assert [planet["n"] for planet in batch[1]] == ["C", "D", "C", "D"]
+    for reference, planet in zip(scalar["systems"][0]["p"], batch[0]):
+        assert list(planet) == list(reference)
+        assert abs(sum(planet["atm"].values()) - 100.0) <= 1.2
+
+
+def test_numpy_validation_matches_scalar_issues() -> None:
+    rng = random.Random(0)
+    for seed in range(40):
+        data = generate_galaxy(seed=seed, sector_count=6, system_count=4, planets_per_system=5)
+        system = rng.choice(data["systems"])
+        planet = rng.choice(system["p"])
+        field = rng.choice(["a", "op", "g", "pb", "tilt", "rot_days"])
+        planet[field] = planet[field] * rng.uniform(0.2, 3.0)
+        if seed % 5 == 0:
+            planet["temp"] = [planet["temp"][0] - 300, planet["temp"][1] + 300]
+        if seed % 7 == 0:
+            planet["atm"] = {}
+        assert validate_galaxy(data, engine="numpy") == validate_galaxy(data)
+
+
+def test_numpy_validation_clears_clean_galaxy() -> None:
+    data = generate_galaxy(seed=2, sector_count=6, system_count=50, planets_per_system=6)
+    assert validate_galaxy(data, engine="numpy") == []
+
+
+def test_numpy_validation_of_records_screens_chunk_by_chunk(monkeypatch) -> None:
+    monkeypatch.setattr(data_pipeline, "VALIDATION_CHUNK_SYSTEMS", 8)
+    records = generate_galaxy(seed=5, sector_count=6, system_count=30, planets_per_system=4, records=True)
+    data = generate_galaxy(seed=5, sector_count=6, system_count=30, planets_per_system=4)
+    data["systems"][17]["p"][2]["g"] *= 2.0
+    assert validate_galaxy(records, engine="numpy") == validate_galaxy(records) == []
+    assert validate_galaxy(data, engine="numpy") == validate_galaxy(data) != []
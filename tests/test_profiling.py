@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+
+from galaxy.data_cli import main
+from galaxy.data_pipeline import export_galaxy_json, generate_galaxy, validate_galaxy
+from galaxy.profiling import StageTimings, increment, profiling, stage
+
+
+def test_stages_are_recorded_only_while_profiling() -> None:
+    ticks = iter(range(100))
+    registry = StageTimings(clock=lambda: float(next(ticks)))
+    with stage("ignored"):
+        increment("ignored")
+    with profiling(registry):
+        for _ in range(2):
+            with stage("outer"):
+                with stage("inner"):
+                    pass
+        increment("items", 3)
+    with stage("ignored"):
+        pass
+
+    report = registry.report()
+    assert report["stages"] == {"outer": {"seconds": 6.0, "calls": 2}, "inner": {"seconds": 2.0, "calls": 2}}
+    assert report["counters"] == {"items": 3}
+
+
+def test_pipeline_stages_cover_generate_validate_and_export(tmp_path) -> None:
+    with profiling() as registry:
+        data = generate_galaxy(seed=7, system_count=4, planets_per_system=3)
+        validate_galaxy(data)
+        export_galaxy_json(data, tmp_path / "galaxy.json")
+    stages = registry.report()["stages"]
+    for name in ("generate.total", "system.star", "planets.climate", "planets.text", "validate.system", "export.encode"):
+        assert name in stages
+    assert stages["validate.system"]["calls"] == 4
+    assert registry.counters["planets"] == 12
+
+
+def test_profile_output_does_not_change_generated_data(tmp_path) -> None:
+    plain = tmp_path / "plain.json"
+    profiled = tmp_path / "profiled.json"
+    report = tmp_path / "profile.json"
+    assert main(["generate", "-o", str(plain), "--systems", "5"]) == 0
+    assert main(["generate", "-o", str(profiled), "--systems", "5", "--profile-json", str(report)]) == 0
+    assert plain.read_bytes() == profiled.read_bytes()
+    assert "planets.orbits" in json.loads(report.read_text(encoding="utf-8"))["stages"]
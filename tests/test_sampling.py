@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import math
+import random
+
+from galaxy.data_pipeline import STAR_WEIGHTS
+from galaxy.sampling import CategoricalSampler, LogUniformSampler, UniformSampler
+
+
+def _linear_weighted_choice(rng: random.Random, weights: dict[str, float]) -> str:
+    items = list(weights.items())
+    value = rng.uniform(0, sum(weight for _, weight in items))
+    running = 0.0
+    for key, weight in items:
+        running += weight
+        if value <= running:
+            return key
+    return items[-1][0]
+
+
+def test_categorical_sampler_matches_linear_scan() -> None:
+    sampler = CategoricalSampler(STAR_WEIGHTS)
+    expected_rng, rng = random.Random(5), random.Random(5)
+    expected = [_linear_weighted_choice(expected_rng, STAR_WEIGHTS) for _ in range(2000)]
+    assert sampler.draw(rng, 1000) + [sampler.sample(rng) for _ in range(1000)] == expected
+
+
+def test_continuous_samplers_match_direct_draws() -> None:
+    expected_rng, rng = random.Random(9), random.Random(9)
+    expected = [math.exp(expected_rng.uniform(math.log(0.08), math.log(0.6))) for _ in range(50)]
+    expected += [expected_rng.uniform(0.35, 0.9) for _ in range(50)]
+    assert LogUniformSampler(0.08, 0.6).draw(rng, 50) + UniformSampler(0.35, 0.9).draw(rng, 50) == expected
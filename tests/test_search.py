@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+
+from galaxy.data_cli import main
+from galaxy.data_pipeline import generate_galaxy
+from galaxy.search import parse_query, search_seeds
+
+
+def _brute_force(text: str, seeds: range, **kwargs) -> list[int]:
+    query = parse_query(text)
+    matches = []
+    for seed in seeds:
+        systems = generate_galaxy(seed=seed, **kwargs)["systems"]
+        counts = [sum(clause.count(system) for system in systems) for clause in query.clauses]
+        if all(clause.verdict(count, count) for clause, count in zip(query.clauses, counts)):
+            matches.append(seed)
+    return matches
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "planets(hab >= 70) >= 3 and no stars(cls in [O, B])",
+        "planets(t ~ ocean, star.cls == K, locked == false) >= 1",
+        "any stars(cls == g) and planets(atm.O2 > 15 and mass < 5) >= 1",
+        "stars(tk > 6000) == 1 and planets <= 30",
+    ],
+)
+def test_search_matches_brute_force(text: str) -> None:
+    summary = search_seeds(text, range(0, 120), limit=1000, system_count=5, planets_per_system=4)
+    assert [match.seed for match in summary.matches] == _brute_force(text, range(0, 120), system_count=5, planets_per_system=4)
+    assert summary.seeds == 120
+
+
+def test_search_prunes_on_star_classes_before_building_systems() -> None:
+    summary = search_seeds("planets(star.cls == K) >= 4", range(0, 60), limit=1000, system_count=4)
+    assert summary.rejected_at_classes > 0
+    assert summary.systems_built < summary.systems_total
+
+
+def test_search_stops_at_limit_and_is_identical_for_any_job_count() -> None:
+    text = "planets(hab >= 70) >= 2"
+    serial = search_seeds(text, range(0, 2000), limit=40)
+    parallel = search_seeds(text, range(0, 2000), limit=40, workers=3)
+    assert len(serial.matches) == 40
+    assert serial.seeds < 2000
+    assert parallel.format(parse_query(text)) == serial.format(parse_query(text))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "planets(hab >= 70)",
+        "planets(hab >= warm) >= 1",
+        "planets(colour == red) >= 1",
+        "stars(tk ~ 5) >= 1",
+        "moons >= 1",
+        "planets(locked == maybe) >= 1",
+        "planets(hab >= 70) >= 1 or stars >= 1",
+        "planets(hab >= 70) >= 1.5",
+        "planets(t ~ ocean $) >= 1",
+    ],
+)
+def test_parse_query_rejects_bad_queries(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_query(text)
+
+
+def test_search_cli_prints_matches(capsys) -> None:
+    assert main(["search", "--where", "no stars(cls == M)", "--seeds", "0:50", "--limit", "2"]) == 0
+    assert capsys.readouterr().out.startswith("Matches: 0 in 50 seeds; rejected 50 after star classes")
+    assert main(["search", "--where", "planets(hab >= 70) >= 2", "--seeds", "0:500", "--limit", "2"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3 and lines[0].startswith("seed ")
+    with pytest.raises(SystemExit):
+        main(["search", "--where", "planets(hab >> 70) >= 1"])
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+import json
+
+import pytest
+
+from galaxy.data_cli import main
+from galaxy.data_pipeline import export_galaxy_json, generate_galaxy, stream_galaxy_json
+from galaxy.serialization import dumps, orjson_available
+
+
+def test_exports_match_dumps_in_both_styles(tmp_path) -> None:
+    data = generate_galaxy(seed=42, sector_count=4, system_count=9, planets_per_system=3)
+    pretty = export_galaxy_json(data, tmp_path / "pretty.json")
+    compact = export_galaxy_json(data, tmp_path / "compact.json", style="compact")
+    assert pretty.read_text(encoding="utf-8") == json.dumps(data, indent=2)
+    assert compact.read_text(encoding="utf-8") == json.dumps(data, separators=(",", ":"))
+    assert compact.stat().st_size < pretty.stat().st_size
+
+
+@pytest.mark.skipif(not orjson_available(), reason="orjson is not installed")
+@pytest.mark.parametrize("style", ["pretty", "compact"])
+def test_backends_produce_identical_text(style) -> None:
+    data = generate_galaxy(seed=7, sector_count=3, system_count=6, planets_per_system=4)
+    assert dumps(data, style, backend="orjson") == dumps(data, style, backend="stdlib")
+
+
+def test_compact_stream_matches_compact_export(tmp_path) -> None:
+    kwargs = dict(seed=11, sector_count=5, system_count=12, planets_per_system=3)
+    streamed = stream_galaxy_json(tmp_path / "streamed.json", style="compact", **kwargs)
+    exported = export_galaxy_json(generate_galaxy(**kwargs), tmp_path / "exported.json", style="compact")
+    assert streamed.read_text(encoding="utf-8") == exported.read_text(encoding="utf-8")
+
+
+def test_dumps_rejects_unknown_style_and_backend() -> None:
+    with pytest.raises(ValueError):
+        dumps({}, "tight")
+    with pytest.raises(ValueError):
+        dumps({}, backend="simdjson")
+
+
+def test_cli_writes_compact_json(tmp_path, capsys) -> None:
+    output = tmp_path / "galaxy.json"
+    assert main(["generate", "--json-style", "compact", "--systems", "6", "-o", str(output)]) == 0
+    text = output.read_text(encoding="utf-8")
+    assert "\n" not in text
+    assert main(["validate", str(output)]) == 0
+    assert "Validation issues: 0" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("backend", ["stdlib", pytest.param("orjson", marks=pytest.mark.skipif(not orjson_available(), reason="orjson is not installed"))])
+def test_default_hook_handles_values_json_cannot_hold(backend) -> None:
+    value = {"when": datetime(2024, 5, 1, 12, 30), "amount": Decimal("1.25"), 3: "three"}
+    expected = json.dumps(value, separators=(",", ":"), default=str)
+    assert dumps(value, "compact", backend=backend, default=str) == expected
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import random
+
+from galaxy.data_pipeline import generate_galaxy
+from galaxy.spatial import KDTree, build_sector_tree
+
+
+def _points(count: int, seed: int) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    # Coarse rounding produces the duplicate coordinates real sector lists have.
+    return [(round(rng.uniform(-1, 1), 1), round(rng.uniform(-1, 1), 2)) for _ in range(count)]
+
+
+def test_in_box_matches_linear_scan() -> None:
+    points = _points(700, seed=1)
+    tree = KDTree(points)
+    rng = random.Random(2)
+    for _ in range(50):
+        xmin, xmax = sorted(rng.uniform(-1.2, 1.2) for _ in range(2))
+        ymin, ymax = sorted(rng.uniform(-1.2, 1.2) for _ in range(2))
+        expected = [i for i, (x, y) in enumerate(points) if xmin <= x <= xmax and ymin <= y <= ymax]
+        assert tree.in_box(xmin, ymin, xmax, ymax) == expected
+
+
+def test_nearest_matches_linear_scan() -> None:
+    points = _points(700, seed=3)
+    tree = KDTree(points)
+    rng = random.Random(4)
+    for _ in range(50):
+        x, y, k = rng.uniform(-1, 1), rng.uniform(-1, 1), rng.randint(1, 25)
+        expected = sorted(((px - x) ** 2 + (py - y) ** 2, i) for i, (px, py) in enumerate(points))[:k]
+        assert [i for _, i in tree.nearest(x, y, k)] == [i for _, i in expected]
+
+
+def test_sector_tree_indexes_generated_sectors() -> None:
+    sectors = generate_galaxy(seed=6, sector_count=40, system_count=3)["sectors"]
+    tree = build_sector_tree(sectors)
+    assert len(tree) == 40
+    distance, index = tree.nearest(*sectors[17]["c"])[0]
+    assert distance == 0.0 and sectors[index]["c"] == sectors[17]["c"]
+    assert KDTree([]).nearest(0.0, 0.0, 3) == []
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import random
+import statistics
+
+import pytest
+
+from galaxy.stats import Histogram, Moments, QuantileSketch
+
+
+def _split(values: list[float], factory):
+    whole, left, right = factory(), factory(), factory()
+    for value in values:
+        whole.add(value)
+    for value in values[:37]:
+        left.add(value)
+    for value in values[37:]:
+        right.add(value)
+    left.merge(right)
+    return whole, left
+
+
+def test_moments_merge_matches_single_pass() -> None:
+    rng = random.Random(1)
+    values = [rng.gauss(50, 12) for _ in range(500)]
+    whole, merged = _split(values, Moments)
+    assert merged.count == whole.count == 500
+    assert merged.mean == pytest.approx(statistics.fmean(values))
+    assert merged.stdev == pytest.approx(statistics.stdev(values))
+    assert (merged.min, merged.max) == (min(values), max(values))
+
+
+def test_histogram_counts_and_rejects_mismatched_bins() -> None:
+    whole, merged = _split([-1, 0, 4.9, 5, 99.9, 100, 250] * 10, lambda: Histogram(0, 100, 20))
+    assert merged.to_dict() == whole.to_dict()
+    assert (merged.underflow, merged.overflow, merged.counts[0], merged.counts[1], merged.counts[-1]) == (10, 20, 20, 10, 10)
+    with pytest.raises(ValueError):
+        merged.merge(Histogram(0, 100, 10))
+
+
+def test_quantile_sketch_stays_within_relative_accuracy() -> None:
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3, 1) for _ in range(5000)] + [0.0] * 200 + [-rng.expovariate(0.1) for _ in range(300)]
+    whole, merged = _split(values, lambda: QuantileSketch(0.01))
+    ordered = sorted(values)
+    for q in (0.0, 0.01, 0.05, 0.25, 0.5, 0.9, 0.99, 1.0):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert merged.quantile(q) == whole.quantile(q)
+        assert merged.quantile(q) == pytest.approx(exact, rel=0.011, abs=1e-9)
+    assert QuantileSketch().quantile(0.5) is None
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from galaxy.data_cli import main
+from galaxy.data_pipeline import generate_galaxy
+from galaxy.sweep import parse_seed_range, sweep_seeds
+
+
+def test_sweep_matches_per_seed_generation() -> None:
+    summary = sweep_seeds(range(3, 40), system_count=4, planets_per_system=3)
+    planets = [
+        (system["star"]["cls"][0], planet)
+        for seed in range(3, 40)
+        for system in generate_galaxy(seed=seed, system_count=4, planets_per_system=3)["systems"]
+        for planet in system["p"]
+    ]
+    everything = summary.groups["all"]
+    assert summary.seeds == 37
+    assert everything.planets == len(planets)
+    assert everything.locked == sum(planet["locked"] for _, planet in planets)
+    assert everything.hab.mean == pytest.approx(sum(planet["hab"] for _, planet in planets) / len(planets))
+    m_planets = [planet for star_class, planet in planets if star_class == "M"]
+    assert summary.groups["M"].types == {label: sum(p["t"] == label for p in m_planets) for label in {p["t"] for p in m_planets}}
+
+
+def test_sweep_report_is_identical_for_any_job_count() -> None:
+    serial = sweep_seeds(range(0, 40), system_count=3, planets_per_system=2)
+    parallel = sweep_seeds(range(0, 40), system_count=3, planets_per_system=2, workers=2)
+    assert json.dumps(parallel.report()) == json.dumps(serial.report())
+
+
+def test_parse_seed_range() -> None:
+    assert parse_seed_range("0:10000") == range(0, 10000)
+    assert parse_seed_range("7") == range(7, 8)
+    for bad in ("5:5", "a:b", "1:2:3"):
+        with pytest.raises(ValueError):
+            parse_seed_range(bad)
+
+
+def test_sweep_cli_prints_summary_and_writes_json(tmp_path, capsys) -> None:
+    output = tmp_path / "sweep.json"
+    assert main(["sweep", "--seeds", "0:20", "--systems", "5", "--json", str(output)]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("Sweep: 20 seeds, 100 systems, 600 planets")
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["star_classes"]["all"]["hab"]["histogram"]["low"] == 0
+    with pytest.raises(SystemExit):
+        main(["sweep", "--seeds", "9:3"])
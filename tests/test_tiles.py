@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from galaxy.data_pipeline import SECTOR_TEMPLATES, validate_system
+from galaxy.tiles import clear_tile_cache, generate_tile, tile_bounds
+
+
+def test_tile_systems_pass_physics_validation() -> None:
+    sector_names = {sector["n"] for sector in SECTOR_TEMPLATES}
+    for z, x, y in [(0, 0, 0), (6, 17, 40), (20, 500_000, 12_345)]:
+        systems = generate_tile(7, z, x, y)["systems"]
+        assert systems
+        for system in systems:
+            assert validate_system(system, sector_names)[0] == []
+
+
+def test_zooming_in_keeps_parent_systems() -> None:
+    parent = generate_tile(7, 4, 3, 9)
+    children = [
+        system["id"]
+        for dx in (0, 1)
+        for dy in (0, 1)
+        for system in generate_tile(7, 5, 6 + dx, 18 + dy)["systems"]
+    ]
+    assert {system["id"] for system in parent["systems"]} <= set(children)
+    assert len(children) == len(set(children))
+
+
+def test_tiles_do_not_depend_on_generation_order() -> None:
+    clear_tile_cache()
+    first = generate_tile(7, 8, 100, 200)
+    clear_tile_cache()
+    generate_tile(7, 8, 101, 200)
+    assert generate_tile(7, 8, 100, 200) == first
+
+
+def test_tile_bounds_reject_out_of_range_tiles() -> None:
+    assert tile_bounds(1, 1, 0) == (0.0, -1.0, 1.0, 0.0)
+    with pytest.raises(ValueError):
+        tile_bounds(1, 2, 0)
+
+
+def test_tile_cache_is_bounded_and_returns_fresh_objects() -> None:
+    from galaxy import tiles
+
+    clear_tile_cache()
+    first = generate_tile(7, 3, 2, 5)
+    first["systems"][0]["p"][0]["n"] = "Edited"
+    first["systems"].clear()
+    assert generate_tile(7, 3, 2, 5)["systems"]
+    assert generate_tile(7, 3, 2, 5)["systems"][0]["p"][0]["n"] != "Edited"
+
+    for x in range(tiles.FINISHED_TILE_CACHE_SIZE + 20):
+        generate_tile(7, 10, x, 3)
+    assert tiles._tile_text.cache_info().currsize == tiles.FINISHED_TILE_CACHE_SIZE
+    assert tiles._tile_anchors.cache_info().currsize <= tiles.TILE_CACHE_SIZE
@@ -254,12 +254,12 @@ function setRuntimeData(payload) {
 
 async function loadRuntimeData() {
   try {
-    const response = await fetch("./galaxy-data.json", { cache: "no-store" });
+    const response = await fetch("./galaxy-data.json", { cache: "no-cache" });
     if (!response.ok) {
       throw new Error(`HTTP ${response.status}`);
     }
     const payload = await response.json();
-    if (setRuntimeData(payload)) return;
+    if (setRuntimeData(decodeGalaxy(payload))) return;
     console.warn("galaxy-data.json payload shape invalid, using embedded fallback.");
   } catch (err) {
     console.warn("Failed to load galaxy-data.json, using embedded fallback.", err);
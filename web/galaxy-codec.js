@@ -0,0 +1,22 @@
+// Expands dictionary-encoded galaxy-data.json (galaxy-data generate --format dictionary).
+// Mirrors galaxy.data_dictionary.decode_galaxy; plain payloads pass through unchanged.
+function decodeGalaxy(payload) {
+  const tables = payload && payload.tables;
+  if (!tables) return payload;
+
+  const text = (ref) => {
+    if (!Array.isArray(ref)) return tables.text[ref].join("");
+    const [index, ...numbers] = ref;
+    const fragments = tables.text[index];
+    return fragments.map((fragment, i) => (i < numbers.length ? fragment + numbers[i] : fragment)).join("");
+  };
+  const planet = (p) => ({ ...p, t: tables.t[p.t], v: text(p.v), sci: text(p.sci), x: tables.x[p.x] });
+  const system = (s) => ({
+    ...s,
+    tl: (s.tl || []).map(([myr, event]) => [myr, text(event)]),
+    p: (s.p || []).map(planet)
+  });
+
+  const { tables: _tables, ...rest } = payload;
+  return { ...rest, systems: (payload.systems || []).map(system) };
+}
@@ -40,11 +40,20 @@ function atmosphereText(atm) {
 }
 
 async function loadData() {
-  const response = await fetch("./galaxy-data.json", { cache: "no-store" });
+  const response = await fetch("./galaxy-data.json", { cache: "no-cache" });
   if (!response.ok) {
     throw new Error(`Unable to load galaxy-data.json (HTTP ${response.status})`);
   }
-  return response.json();
+  return decodeGalaxy(await response.json());
+}
+
+async function loadFromApi(path) {
+  try {
+    const response = await fetch(path);
+    return response.ok ? response.json() : null;
+  } catch {
+    return null;
+  }
 }
 
 function resolvePlanet(data) {
@@ -70,8 +79,18 @@ function renderError(message) {
   d.jumpSectorLink.href = "./index.html";
 }
 
-function renderPlanet(data, system, planet) {
-  const sector = data.sectors.find((s) => tokenMatch(s.n, system.sector));
+async function loadRecord() {
+  if (systemQuery && planetQuery) {
+    const record = await loadFromApi(`/api/systems/${encodeURIComponent(systemQuery)}/planets/${encodeURIComponent(planetQuery)}`);
+    if (record) return record;
+  }
+  const data = await loadData();
+  const record = resolvePlanet(data);
+  if (!record) return null;
+  return { ...record, sector: data.sectors.find((s) => tokenMatch(s.n, record.system.sector)) };
+}
+
+function renderPlanet(sector, system, planet) {
   const giant = /giant/i.test(planet.t);
   const moonProfile = giant ? "Likely multi-moon architecture inferred from giant class." : "No large moon system is currently cataloged.";
   const ringProfile = giant ? "High probability of ring material around the equatorial plane." : "No stable ring structure expected for this regime.";
@@ -132,13 +151,12 @@ function renderPlanet(data, system, planet) {
 
 async function bootstrap() {
   try {
-    const data = await loadData();
-    const record = resolvePlanet(data);
+    const record = await loadRecord();
     if (!record) {
       renderError("Requested planet token was not found.");
       return;
     }
-    renderPlanet(data, record.system, record.planet);
+    renderPlanet(record.sector, record.system, record.planet);
   } catch (error) {
     renderError(error.message);
   }
@@ -30,11 +30,44 @@ function bestHabitability(system) {
 }
 
 async function loadData() {
-  const response = await fetch("./galaxy-data.json", { cache: "no-store" });
+  const response = await fetch("./galaxy-data.json", { cache: "no-cache" });
   if (!response.ok) {
     throw new Error(`Unable to load galaxy-data.json (HTTP ${response.status})`);
   }
-  return response.json();
+  return decodeGalaxy(await response.json());
+}
+
+async function loadFromApi(path) {
+  try {
+    const response = await fetch(path);
+    return response.ok ? response.json() : null;
+  } catch {
+    return null;
+  }
+}
+
+async function loadFromShards() {
+  // `galaxy-data export --shards web/shards` writes one file per sector.
+  const manifest = await loadFromApi("./shards/manifest.json");
+  if (!manifest || !Array.isArray(manifest.shards)) return null;
+  const sector = manifest.document.sectors.find((s) => tokenMatch(s.id, sectorQuery) || tokenMatch(s.n, sectorQuery));
+  if (!sector) return null;
+  const shard = manifest.shards.find((entry) => entry.sector === sector.n);
+  if (!shard) return { sector, systems: [] };
+  const systems = await loadFromApi(`./shards/${encodeURIComponent(shard.file)}`);
+  return systems ? { sector, systems } : null;
+}
+
+async function loadRecord() {
+  if (sectorQuery) {
+    const record = (await loadFromApi(`/api/sectors/${encodeURIComponent(sectorQuery)}`)) || (await loadFromShards());
+    if (record) return record;
+  }
+  const data = await loadData();
+  const fallback = data.sectors[0];
+  const sector = data.sectors.find((s) => tokenMatch(s.id, sectorQuery) || tokenMatch(s.n, sectorQuery)) || fallback;
+  if (!sector) return null;
+  return { sector, systems: data.systems.filter((system) => tokenMatch(system.sector, sector.n)) };
 }
 
 function renderError(message) {
@@ -44,8 +77,7 @@ function renderError(message) {
   d.sectorSystems.innerHTML = `<p class="muted">${message}</p>`;
 }
 
-function renderSector(data, sector) {
-  const systems = data.systems.filter((system) => tokenMatch(system.sector, sector.n));
+function renderSector(sector, systems) {
   d.sectorName.textContent = sector.n.toUpperCase();
   d.sectorMeta.textContent = `Threat ${sector.t} | Radiation ${sector.r} | Star Density ${sector.d}`;
   d.sectorStats.innerHTML = `
@@ -84,14 +116,12 @@ function renderSector(data, sector) {
 
 async function bootstrap() {
   try {
-    const data = await loadData();
-    const fallback = data.sectors[0];
-    const sector = data.sectors.find((s) => tokenMatch(s.id, sectorQuery) || tokenMatch(s.n, sectorQuery)) || fallback;
-    if (!sector) {
+    const record = await loadRecord();
+    if (!record) {
       renderError("No sector data was found in galaxy-data.json.");
       return;
     }
-    renderSector(data, sector);
+    renderSector(record.sector, record.systems);
   } catch (error) {
     renderError(error.message);
   }
@@ -86,11 +86,32 @@ function planetUrl(systemId, planetName) {
 }
 
 async function loadData() {
-  const response = await fetch("./galaxy-data.json", { cache: "no-store" });
+  const response = await fetch("./galaxy-data.json", { cache: "no-cache" });
   if (!response.ok) {
     throw new Error(`Unable to load galaxy-data.json (HTTP ${response.status})`);
   }
-  return response.json();
+  return decodeGalaxy(await response.json());
+}
+
+async function loadFromApi(path) {
+  try {
+    const response = await fetch(path);
+    return response.ok ? response.json() : null;
+  } catch {
+    return null;
+  }
+}
+
+async function loadRecord() {
+  if (systemQuery) {
+    const record = await loadFromApi(`/api/systems/${encodeURIComponent(systemQuery)}`);
+    if (record) return record;
+  }
+  const data = await loadData();
+  const fallback = data.systems[0];
+  const system = data.systems.find((s) => tokenMatch(s.id, systemQuery) || tokenMatch(s.n, systemQuery)) || fallback;
+  if (!system) return null;
+  return { system, sector: data.sectors.find((s) => tokenMatch(s.n, system.sector)) };
 }
 
 function getBeltParticles(innerRadius, outerRadius) {
@@ -338,8 +359,7 @@ function attachCanvasHandlers(system) {
   });
 }
 
-function renderSystem(data, system) {
-  const sector = data.sectors.find((s) => tokenMatch(s.n, system.sector));
+function renderSystem(sector, system) {
   d.systemName.textContent = system.n.toUpperCase();
   d.systemMeta.textContent = `${system.star.cls} | ${system.star.mult} | Sector ${system.sector}`;
   d.systemStats.innerHTML = `
@@ -378,14 +398,12 @@ function renderSystem(data, system) {
 
 async function bootstrap() {
   try {
-    const data = await loadData();
-    const fallback = data.systems[0];
-    const system = data.systems.find((s) => tokenMatch(s.id, systemQuery) || tokenMatch(s.n, systemQuery)) || fallback;
-    if (!system) {
+    const record = await loadRecord();
+    if (!record) {
       renderError("No system data was found in galaxy-data.json.");
       return;
     }
-    renderSystem(data, system);
+    renderSystem(record.sector, record.system);
   } catch (error) {
     renderError(error.message);
   }